@@ -0,0 +1,83 @@
+import pytest
+import torch
+
+from whisperspeech import t2s_up_wds_mlang_enclm, s2a_delar_mup_wds_mlang, s2a_delar_mup_wds_mlang_cond
+from whisperspeech.a2wav import Vocoder
+from whisperspeech.cache import TieredCache
+from whisperspeech.pipeline import Pipeline
+
+# Tiny randomly initialized models: too small to say anything sensible but they exercise the same code paths as the
+# released checkpoints in a fraction of a second. The weights are scaled up so the greedy outputs are not degenerate.
+# Batched matmuls are not bitwise identical to single-sequence ones so the tests keep the sequences short to stay
+# clear of near-ties in the greedy comparisons.
+
+t2s_args = dict(depth=2, n_head=2, head_width=32, ffn_mult=1, ttoks_len=550, stoks_len=750, stoks_codes=513, ttoks_codes=256)
+s2a_args = dict(depth=2, n_head=2, head_width=32, ffn_mult=1, quantizers=4, stoks_codes=513, spk_width=192)
+
+def random_init(m, seed):
+    torch.manual_seed(seed)
+    for p in m.parameters():
+        torch.nn.init.normal_(p, std=0.3)
+    return m.eval()
+
+def make_t2s(seed=0, dtype=torch.float32, torch_compile=False, **optimize_kw):
+    torch.manual_seed(seed)
+    m = random_init(t2s_up_wds_mlang_enclm.TSARTransformer(**t2s_args), seed)
+    m.__stored_args__ = t2s_args
+    m.optimize(dtype=dtype, torch_compile=torch_compile, **optimize_kw)
+    return m
+
+def make_s2a(seed=0, cond=False, dtype=torch.float32, torch_compile=False, **optimize_kw):
+    module = s2a_delar_mup_wds_mlang_cond if cond else s2a_delar_mup_wds_mlang
+    torch.manual_seed(seed)
+    m = random_init(module.SADelARTransformer(**s2a_args), seed)
+    m.__stored_args__ = s2a_args
+    m.optimize(dtype=dtype, torch_compile=torch_compile, **optimize_kw)
+    return m
+
+@pytest.fixture
+def t2s():
+    return make_t2s(max_batch_size=4)
+
+@pytest.fixture(params=[False, True], ids=['s2a', 's2a_cond'])
+def s2a(request):
+    return make_s2a(cond=request.param, max_batch_size=4)
+
+@pytest.fixture
+def stoks():
+    torch.manual_seed(5)
+    return [torch.randint(0, 512, (n,)) for n in (10, 25, 7, 18)]
+
+@pytest.fixture
+def speakers():
+    torch.manual_seed(6)
+    return torch.randn(4, 192)
+
+class FakeVocoder(Vocoder):
+    """Turns every acoustic frame into `hop_length` samples without loading Vocos."""
+    def __init__(self):
+        self.device = 'cpu'
+        self.vocos = torch.nn.Linear(2, 2)
+
+    def decode(self, atoks):
+        if atoks.dim() == 2: atoks = atoks.unsqueeze(0)
+        return atoks.float().mean(1).repeat_interleave(320, -1) / 1024
+
+def make_pipeline(max_batch_size=4, **optimize_kw):
+    """A `Pipeline` with tiny random models, none of the real checkpoints is downloaded."""
+    pipe = Pipeline.__new__(Pipeline)
+    pipe.device = 'cpu'
+    pipe.max_batch_size = max_batch_size
+    pipe.t2s = make_t2s(max_batch_size=max_batch_size)
+    pipe.s2a = make_s2a(max_batch_size=max_batch_size, **optimize_kw)
+    pipe.t2s_draft = pipe.s2a_draft = None
+    pipe.draft_tokens, pipe.frames_per_step = 4, 4
+    pipe.s2a_window = optimize_kw.get('kv_window')
+    pipe.vocoder = FakeVocoder()
+    pipe.encoder = None
+    pipe.spk_cache = TieredCache()
+    pipe.speakers = {}
+    pipe.stoks_cache, pipe.atoks_cache = TieredCache(), TieredCache()
+    pipe.audio_cache = None
+    pipe.checksums = {}
+    return pipe
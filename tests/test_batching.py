@@ -0,0 +1,85 @@
+import torch
+
+from whisperspeech.batching import T2SScheduler, S2AScheduler
+from whisperspeech.modules import KVPagePool
+
+# Batched greedy decoding has to give exactly the same tokens as decoding every sequence on its own.
+
+txts = ["hello world", "a much longer sentence here", "żółw", "x"]
+langs = ['en', 'pl', 'pl', 'en']
+cpss = [10, 12, 15, 20]
+
+def test_t2s_generate_batch(t2s):
+    ref = [t2s.generate(x, N=40, lang=l, cps=c, T=0, show_progress_bar=False)[0] for x,l,c in zip(txts, langs, cpss)]
+    out = t2s.generate_batch(txts, N=40, lang=langs, cps=cpss, T=0, show_progress_bar=False)
+    for a,b in zip(ref, out): assert torch.equal(a, b)
+
+def test_s2a_generate_batch(s2a, stoks, speakers):
+    ref = [s2a.generate(x, speakers[i:i+1], T=0, show_progress_bar=False)[0] for i,x in enumerate(stoks)]
+    out = s2a.generate_batch(stoks, speakers, T=0, show_progress_bar=False)
+    for a,b in zip(ref, out): assert torch.equal(a, b)
+
+def test_s2a_padded_stoks(s2a, stoks, speakers):
+    # the semantic tokens end at the first padding token, every sequence stops (and leaves the batch) there
+    pad = s2a.stoks_codes - 1
+    padded = [torch.cat([x, torch.full((i*5,), pad)]) for i,x in enumerate(stoks)]
+    ref = s2a.generate_batch(stoks, speakers, T=0, show_progress_bar=False)
+    out = s2a.generate_batch(padded, speakers, T=0, show_progress_bar=False)
+    for a,b,x in zip(ref, out, stoks):
+        assert torch.equal(a, b) and a.shape[-1] == len(x) * 3 - 4
+    assert torch.equal(s2a.generate(padded[3], speakers[3:], T=0, show_progress_bar=False)[0], ref[3])
+
+def test_t2s_scheduler(t2s):
+    ref = [t2s.generate(x, N=30+5*i, lang=l, cps=c, T=0, show_progress_bar=False)[0]
+           for i,(x,l,c) in enumerate(zip(txts, langs, cpss))]
+    sched = T2SScheduler(t2s, max_batch_size=2, T=0)
+    # requests join while others are already decoding
+    reqs = [sched.submit(x, N=30+5*i, lang=l, cps=c) for i,(x,l,c) in enumerate(zip(txts[:2], langs, cpss))]
+    sched.step(); sched.step()
+    reqs += [sched.submit(x, N=30+5*i, lang=l, cps=c) for i,(x,l,c) in enumerate(zip(txts, langs, cpss)) if i >= 2]
+    sched.run()
+    for r,x in zip(reqs, ref): assert torch.equal(r.stoks, x)
+
+def test_t2s_scheduler_prompt(t2s):
+    prompt = torch.randint(0, 512, (5,))
+    ref = t2s.generate("hello world", stoks_prompt=prompt, N=30, T=0, show_progress_bar=False)[0]
+    sched = T2SScheduler(t2s, T=0)
+    req = sched.submit("hello world", stoks_prompt=prompt, N=30)
+    sched.submit("x", N=20)
+    sched.run()
+    assert torch.equal(req.stoks, ref)
+
+def test_s2a_scheduler(s2a, stoks, speakers):
+    prompts = [None, torch.randint(0, 1024, (4, 6)), None, torch.randint(0, 1024, (4, 2))]
+    ref = [s2a.generate(x, spk.unsqueeze(0), atoks_prompt=p.unsqueeze(0) if p is not None else None, T=0, show_progress_bar=False)[0]
+           for x,spk,p in zip(stoks, speakers, prompts)]
+    sched = S2AScheduler(s2a, max_batch_size=2, T=0)
+    reqs = [sched.submit(x, spk, atoks_prompt=p) for x,spk,p in zip(stoks, speakers, prompts)]
+    sched.run()
+    for r,x in zip(reqs, ref): assert torch.equal(r.atoks, x)
+
+def test_preemption(t2s):
+    ref = [t2s.generate(x, N=30, T=0, show_progress_bar=False)[0] for x in txts]
+    sched = T2SScheduler(t2s, max_batch_size=2, T=0)
+    reqs = [sched.submit(x, N=30, priority=1) for x in txts[:2]]
+    for _ in range(5): sched.step()
+    # the urgent requests evict the running ones which later resume where they stopped
+    reqs += [sched.submit(x, N=30, priority=0) for x in txts[2:]]
+    sched.run()
+    assert sum(r.preemptions for r in reqs) > 0
+    for r,x in zip(reqs, ref): assert torch.equal(r.stoks, x)
+
+def test_paged_kv_cache(t2s, s2a, stoks, speakers):
+    ref = [t2s.generate(x, N=40, T=0, show_progress_bar=False)[0] for x in txts]
+    pool = KVPagePool(1000, 2, 32, page_size=16)
+    sched = T2SScheduler(t2s, max_batch_size=4, T=0, kv_pool=pool)
+    reqs = [sched.submit(x, N=40) for x in txts]
+    sched.run()
+    for r,x in zip(reqs, ref): assert torch.equal(r.stoks, x)
+    assert pool.n_free == 1000 - 1
+
+    ref = [s2a.generate(x, speakers[i:i+1], T=0, show_progress_bar=False)[0] for i,x in enumerate(stoks)]
+    # a small pool: the requests have to wait for pages to be released
+    small = KVPagePool(1 + 2*3*8, 2, 32, page_size=16)
+    out = S2AScheduler(s2a, max_batch_size=4, T=0, kv_pool=small).generate(stoks, speakers)
+    for a,b in zip(ref, out): assert torch.equal(a, b)
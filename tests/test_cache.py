@@ -0,0 +1,98 @@
+import time
+
+import pytest
+import torch
+
+from whisperspeech.cache import LRUCache, DiskCache, AudioCache, TieredCache, content_hash, model_checksum
+from conftest import make_t2s
+
+def test_lru_cache():
+    c = LRUCache(max_items=2)
+    c.put('a', torch.zeros(3)); c.put('b', torch.ones(3))
+    assert torch.equal(c.get('a'), torch.zeros(3))
+    c.put('c', torch.ones(2))
+    # 'b' was used least recently
+    assert 'b' not in c and 'a' in c and 'c' in c
+    assert c.get('b') is None
+    assert c.stats() == dict(hits=1, misses=1, items=2, nbytes=20)
+
+    c = LRUCache(max_items=None, max_bytes=100)
+    for i in range(10): c.put(str(i), torch.zeros(10))
+    assert len(c) == 2 and c.nbytes == 80
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_disk_cache(tmp_path, mmap):
+    c = DiskCache(tmp_path, mmap=mmap)
+    x = torch.randn(4, 100)
+    c.put('x', x)
+    assert 'x' in c and 'y' not in c
+    assert torch.equal(c.get('x'), x)
+    # a new cache object sees the files of the old one
+    c2 = DiskCache(tmp_path, mmap=mmap)
+    assert torch.equal(c2.get('x'), x) and c2.nbytes == c.nbytes
+    c.clear()
+    assert len(c) == 0 and c.get('x') is None
+
+def test_disk_cache_eviction(tmp_path):
+    c = DiskCache(tmp_path, max_bytes=3000)
+    for i in range(10):
+        c.put(str(i), torch.zeros(200))
+        time.sleep(0.01)
+    assert c.nbytes <= 3000 and 0 < len(c) < 10
+    assert '9' in c and '0' not in c
+
+def test_audio_cache(tmp_path):
+    c = AudioCache(tmp_path)
+    audio = torch.sin(torch.arange(2400) * 0.05).unsqueeze(0) * 0.5
+    try:
+        c.put('a', audio)
+    except ImportError as e:
+        pytest.skip(f"no torchaudio backend to write FLAC files: {e}")
+    # FLAC stores 16 bit samples
+    assert (c.get('a') - audio).abs().max() < 1e-4
+
+def test_tiered_cache(tmp_path):
+    c = TieredCache(tmp_path, max_items=1)
+    a, b = torch.zeros(5), torch.ones(5)
+    c.put('a', a); c.put('b', b)
+    assert 'a' not in c.memory and 'a' in c.disk
+    # disk hits are promoted to memory
+    assert torch.equal(c.get('a'), a) and 'a' in c.memory
+    assert c.get('c') is None
+    assert c.stats()['hits'] == 1 and c.stats()['misses'] == 1
+    c.clear()
+    assert 'a' not in c and 'b' not in c
+
+def test_hashes(tmp_path):
+    (tmp_path/'a').write_bytes(b'123'); (tmp_path/'b').write_bytes(b'123'); (tmp_path/'c').write_bytes(b'124')
+    assert content_hash(tmp_path/'a') == content_hash(tmp_path/'b') != content_hash(tmp_path/'c')
+    assert model_checksum(make_t2s(0)) == model_checksum(make_t2s(0)) != model_checksum(make_t2s(1))
+
+def test_model_checksum_generate(t2s, s2a, stoks, speakers):
+    # the KV caches filled by generation do not change the checksum
+    checksums = [model_checksum(t2s), model_checksum(s2a)]
+    t2s.generate("hello world", N=30, T=0, show_progress_bar=False)
+    s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False)
+    assert [model_checksum(t2s), model_checksum(s2a)] == checksums
+
+def test_model_checksum_quantized():
+    a, b = make_t2s(0), make_t2s(0)
+    # a change in the middle of a weight matrix (away from the values shown by repr)
+    with torch.no_grad(): b.decoder.layers[0].attn.key.weight[5, 5] += 1
+    for m in (a, b): m.quantize('int8')
+    assert model_checksum(a) != model_checksum(b)
+    c = make_t2s(0)
+    c.quantize('int8')
+    assert model_checksum(a) == model_checksum(c)
+
+def test_encoder_cache(t2s):
+    ref = [t2s.generate(x, N=30, T=0, show_progress_bar=False) for x in ("hello world", "x")]
+    t2s.enable_encoder_cache()
+    calls = []
+    run_encoder = t2s.run_encoder
+    t2s.run_encoder = lambda *args: calls.append(1) or run_encoder(*args)
+    for _ in range(2):
+        for x,r in zip(("hello world", "x"), ref):
+            assert torch.equal(t2s.generate(x, N=30, T=0, show_progress_bar=False), r)
+    # the second round only hits the cache
+    assert len(calls) == 2 and len(t2s.encoder_cache) == 2
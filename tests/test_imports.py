@@ -0,0 +1,27 @@
+import os
+import ast
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+# these are only needed for training, data preparation, voice cloning or vocoding and take seconds to import
+heavy = ['torchaudio', 'whisper', 'speechbrain', 'vocos', 'webdataset', 'pylab', 'vector_quantize_pytorch']
+
+@pytest.mark.parametrize('module', ['whisperspeech.pipeline', 'whisperspeech.server', 'whisperspeech.vq_stoks'])
+def test_lazy_imports(module):
+    code = f"import sys, {module}; print(' '.join(m for m in {heavy!r} if m in sys.modules))"
+    root = Path(__file__).parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(root), os.environ.get('PYTHONPATH', '')]))
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env)
+    assert out.stdout.split() == []
+
+# settings.ini declares min_python = 3.7, the inference code has to stay within its grammar
+inference_modules = ['a2wav', 'batching', 'cache', 'inference', 'languages', 'modules', 'pipeline', 'server',
+                     's2a_delar_mup_wds_mlang', 's2a_delar_mup_wds_mlang_cond', 't2s_up_wds_mlang_enclm']
+
+@pytest.mark.parametrize('module', inference_modules)
+def test_python37_syntax(module):
+    fname = Path(__file__).parent.parent/'whisperspeech'/f'{module}.py'
+    ast.parse(fname.read_text(), str(fname), feature_version=(3, 7))
@@ -0,0 +1,71 @@
+import torch
+
+from conftest import make_t2s, make_s2a
+
+def test_trim_kv(s2a, stoks, speakers):
+    # the CPU path only attends to the filled part of the KV cache, that must not change the results
+    t2s = make_t2s()
+    assert all(l.attn.trim_kv for l in t2s.decoder.layers)
+    ref = t2s.generate("hello world", N=60, T=0, show_progress_bar=False)
+    for l in t2s.decoder.layers: l.attn.trim_kv = False
+    assert torch.equal(t2s.generate("hello world", N=60, T=0, show_progress_bar=False), ref)
+
+    ref = s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False)
+    for l in s2a.decoder.layers: l.attn.trim_kv = False
+    assert torch.equal(s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False), ref)
+
+def test_kv_window(s2a, speakers):
+    cond = 'cond' in type(s2a).__module__
+    stoks = torch.randint(0, 512, (40,))
+    spk = speakers[:1]
+    ref = s2a.generate(stoks, spk, T=0, show_progress_bar=False)
+
+    # a window longer than the sequence changes nothing
+    w = make_s2a(cond=cond, kv_window=200)
+    assert torch.equal(ref, w.generate(stoks, spk, T=0, show_progress_bar=False))
+    assert torch.equal(ref, w.generate_long(stoks, spk, T=0, show_progress_bar=False))
+    prompt = torch.randint(0, 1024, (1, 4, 9))
+    assert torch.equal(s2a.generate(stoks, spk, atoks_prompt=prompt, T=0, show_progress_bar=False),
+                       w.generate_long(stoks, spk, atoks_prompt=prompt, T=0, show_progress_bar=False))
+
+    # a short rolling window is the same as full attention with a banded mask
+    w = make_s2a(cond=cond, kv_window=16)
+    ref = make_s2a(cond=cond)
+    band = torch.empty(ref.ctx_n, ref.ctx_n).fill_(-torch.inf).triu_(1)
+    ref.decoder.mask = band + torch.empty_like(band).fill_(-torch.inf).tril_(-16)
+    # the trimmed CPU cache skips the mask for single queries (it assumes a causal one)
+    for l in ref.decoder.layers: l.attn.trim_kv = False
+    assert torch.equal(ref.generate(stoks, spk, T=0, show_progress_bar=False),
+                       w.generate(stoks, spk, T=0, show_progress_bar=False))
+
+def test_kv_window_long(speakers):
+    # with a window the KV cache stays the same size for sequences longer than the model context
+    w = make_s2a(kv_window=16)
+    stoks = torch.randint(0, 512, (w.ctx_n // 3 + 50,))
+    out = w.generate_long(stoks, speakers[:1], T=0.7, show_progress_bar=False)
+    assert out.shape[-1] > w.ctx_n and (out < 1024).all()
+    assert w.decoder.layers[0].attn.k_cache.shape[2] == 16
+
+def test_cross_kv(s2a, stoks, speakers):
+    # the precomputed cross-attention keys and values give the same result as projecting the encoder output
+    xenc, xenc_positions = s2a.encode(s2a.prep_stoks(stoks[1]).unsqueeze(0), speakers[:1])
+    x = torch.randn(1, 20, xenc.shape[-1])
+    positions = torch.arange(20)
+    s2a.decoder.train()
+    try:
+        ref = s2a.decoder(x, positions, xenc, xenc_positions)
+        cross_kv = s2a.decoder.project_cross_kv(xenc, xenc_positions)
+        assert torch.allclose(s2a.decoder(x, positions, xenc, xenc_positions, cross_kv=cross_kv), ref, atol=1e-6)
+    finally:
+        s2a.decoder.eval()
+
+def test_setup_kv_cache(s2a, stoks, speakers):
+    # worker processes get fresh KV caches of the same size next to the shared weights
+    ref = s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False)
+    old = [l.attn.k_cache for l in s2a.decoder.layers]
+    s2a.share_memory()
+    s2a.decoder.setup_kv_cache()
+    for l, k in zip(s2a.decoder.layers, old):
+        assert l.attn.k_cache.shape == k.shape and l.attn.k_cache.dtype == k.dtype
+        assert l.attn.k_cache.data_ptr() != k.data_ptr()
+    assert torch.equal(s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False), ref)
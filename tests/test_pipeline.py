@@ -0,0 +1,215 @@
+import time
+import threading
+
+import torch
+
+from whisperspeech.cache import TieredCache
+from whisperspeech.pipeline import split_text, crossfade_concat
+from conftest import make_pipeline, FakeVocoder
+
+def test_generate_batch():
+    pipe = make_pipeline(max_batch_size=2)
+    atoks = []
+    decode_batch = pipe.vocoder.decode_batch
+    pipe.vocoder.decode_batch = lambda x: atoks.extend(x) or decode_batch(x)
+    torch.manual_seed(0)
+    # more texts than fit in one batch, with per-text settings
+    audio = pipe.generate_batch(["hello world", "żółw", "x"], langs=['en', 'pl', 'en'], cps=[10, 15, 20])
+    assert len(audio) == len(atoks) == 3
+    for a, x in zip(audio, atoks):
+        assert x.shape[0] == pipe.s2a.quantizers and a.shape == (x.shape[-1] * 320,)
+
+def test_s2a_stream(s2a, stoks, speakers):
+    ref = s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False)
+    chunks = list(s2a.generate_stream(stoks[1], speakers[:1], T=0, chunk_frames=10))
+    assert len(chunks) > 1 and all(x.shape[-1] >= 10 for x in chunks[:-1])
+    assert torch.equal(torch.cat(chunks, -1), ref)
+
+def test_decode_stream():
+    v = FakeVocoder()
+    atoks = torch.randint(0, 1024, (1, 4, 100))
+    audio = list(v.decode_stream(atoks.split(10, -1)))
+    assert len(audio) > 1
+    # the cross-faded windows add up to the audio decoded in one go
+    assert torch.allclose(torch.cat(audio, -1), v.decode(atoks))
+
+def test_t2s_stream(t2s):
+    ref = t2s.generate("hello world", N=60, T=0, show_progress_bar=False)[0]
+    out = torch.cat(list(t2s.generate_stream("hello world", N=60, T=0)))
+    assert torch.equal(out, ref[:len(out)])
+
+def test_s2a_stream_lookahead(s2a, stoks, speakers):
+    ref = s2a.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False)
+    # with a lookahead covering the whole text the encoder sees the complete semantic tokens from the start
+    chunks = s2a.generate_stream(iter(stoks[1].split(1)), speakers[:1], T=0, lookahead=len(stoks[1]))
+    assert torch.equal(torch.cat(list(chunks), -1), ref)
+    # a short lookahead only approximates it but still decodes every frame
+    chunks = s2a.generate_stream(iter(stoks[1].split(1)), speakers[:1], T=0, lookahead=2)
+    assert torch.cat(list(chunks), -1).shape == ref.shape
+
+def test_s2a_stream_encode_calls(s2a, speakers):
+    stoks = torch.randint(0, 512, (60,))
+    calls = []
+    encode = s2a.encode
+    s2a.encode = lambda *args, **kwargs: calls.append(1) or encode(*args, **kwargs)
+    chunks = list(s2a.generate_stream(iter(stoks.split(1)), speakers[:1], T=0, lookahead=6))
+    assert torch.cat(chunks, -1).shape[-1] == 60 * 3 - 4
+    # the encoder reruns once per `lookahead` new semantic tokens and not after every one of them
+    assert len(calls) <= 60 // 6 + 1
+
+def test_split_text():
+    text = "Short one. " + "A very long sentence, with clauses; and many words " * 8 + "! Żółć gęślą jaźń. " * 20
+    segments = split_text(text, max_chars=100, max_bytes=120)
+    assert all(len(s) <= 100 and len(s.encode('utf-8')) <= 120 for s in segments)
+    assert ' '.join(segments).split() == text.split()
+    assert split_text("One. Two.") == ["One. Two."]
+
+def test_crossfade_concat():
+    chunks = [torch.ones(1, 100), torch.zeros(1, 50), torch.ones(1, 80)]
+    out = crossfade_concat(chunks, 10)
+    assert out.shape == (1, 100 + 50 + 80 - 2*10)
+    assert out[0,0] == 1 and out[0,95] < 1 and out[0,-1] == 1
+
+def test_register_speaker(tmp_path):
+    pipe = make_pipeline()
+    pipe.spk_cache = TieredCache(tmp_path)
+    emb = torch.randn(192)
+    pipe.register_speaker('alice', emb)
+    assert torch.equal(pipe.get_speaker('alice'), emb)
+    # the registration survives in the disk cache
+    pipe = make_pipeline()
+    pipe.spk_cache = TieredCache(tmp_path)
+    assert torch.equal(pipe.get_speaker('alice'), emb)
+
+class FakeSpkEncoder:
+    """Averages the unpadded samples instead of running the ECAPA model."""
+    def encode_batch(self, samples, wav_lens=None):
+        if wav_lens is None: wav_lens = torch.ones(len(samples))
+        lens = (wav_lens * samples.shape[-1]).round().long()
+        return torch.stack([x[:n].mean().expand(192) for x, n in zip(samples, lens)]).unsqueeze(1)
+
+def test_extract_spk_embs(tmp_path):
+    fnames = []
+    for i, n in enumerate((300, 500, 800)):
+        fnames.append(tmp_path/f'{n}.wav')
+        fnames[-1].write_bytes(bytes([i]))
+    loaded = []
+    def load_spk_audio(fname, max_seconds=30):
+        loaded.append(fname)
+        return torch.arange(int(fname.stem)).float()
+    pipes = [make_pipeline() for _ in range(2)]
+    for pipe in pipes:
+        pipe.encoder = FakeSpkEncoder()
+        pipe.load_spk_audio = load_spk_audio
+    # the padded batches give the same embeddings as extracting them one by one
+    embs = pipes[0].extract_spk_embs(fnames, batch_size=2, show_progress_bar=False)
+    assert torch.allclose(embs, torch.stack([pipes[1].extract_spk_emb(f) for f in fnames]))
+    assert len(loaded) == 6
+    # everything is cached now
+    assert torch.equal(pipes[0].extract_spk_embs(fnames, show_progress_bar=False), embs)
+    assert len(loaded) == 6
+
+def test_stoks_cache():
+    pipe = make_pipeline()
+    calls = []
+    generate = pipe.t2s.generate
+    pipe.t2s.generate = lambda *args, **kwargs: calls.append(1) or generate(*args, **kwargs)
+    a = pipe.generate_stoks("hello world", seed=1)
+    # the same seed and (normalized) text come from the cache, another seed is sampled again
+    assert torch.equal(pipe.generate_stoks(" hello  world", seed=1), a) and len(calls) == 1
+    pipe.generate_stoks("hello world", seed=2)
+    pipe.generate_stoks("hello world")
+    assert len(calls) == 3 and len(pipe.stoks_cache.memory) == 2
+
+def test_atoks_cache():
+    pipe = make_pipeline()
+    pipe.audio_cache = TieredCache()
+    calls = []
+    generate, decode = pipe.s2a.generate, pipe.vocoder.decode
+    pipe.s2a.generate = lambda *args, **kwargs: calls.append('s2a') or generate(*args, **kwargs)
+    pipe.vocoder.decode = lambda *args: calls.append('vocoder') or decode(*args)
+    audio = pipe.generate("hello world", seed=1)
+    assert torch.equal(pipe.generate("hello world", seed=1), audio)
+    # the audio was cached so not even the vocoder runs again, the acoustic tokens are cached as well
+    assert calls == ['s2a', 'vocoder']
+    assert torch.equal(torch.cat(list(pipe.generate_stream("hello world", seed=1)), -1), audio)
+    pipe.audio_cache.clear()
+    assert torch.equal(pipe.generate("hello world", seed=1), audio)
+    assert calls == ['s2a', 'vocoder', 'vocoder']
+    stats = pipe.cache_stats()
+    assert stats['stoks']['misses'] == 1 and stats['atoks']['hits'] == 1
+
+def test_generate_long_windowed():
+    pipe = make_pipeline(kv_window=16)
+    # every segment gets 28 semantic tokens, together they are longer than the S2A context
+    pipe.t2s.generate_batch = lambda txts, **kwargs: [torch.randint(0, 512, (28,)) for _ in txts]
+    text = 'First sentence here. ' * 60
+    n = len(split_text(text, max_chars=15*4, max_bytes=(pipe.t2s.ttoks_len - 2) // 2 - 1))
+    assert n * 28 * 3 > pipe.s2a.ctx_n
+    audio = pipe.generate_long(text, max_seconds=4)
+    # S2A runs on all the semantic tokens at once so there are no crossfades
+    assert audio.shape[-1] == (n * 28 * 3 - 4) * 320
+
+def test_decode_batch():
+    v = FakeVocoder()
+    atoks = [torch.randint(0, 1024, (4, n)) for n in (5, 0, 3)]
+    audio = v.decode_batch(atoks)
+    assert [len(a) for a in audio] == [5*320, 0, 3*320]
+    assert torch.allclose(audio[2], v.decode(atoks[2])[0])
+    assert [len(a) for a in v.decode_batch([atoks[1]])] == [0]
+
+def test_generate_long():
+    pipe = make_pipeline()
+    # a T2S model which never stops on its own, the segments take up all their token budget
+    def generate_batch(txts, cps=15, lang='en', stoks_prompt=None, N=None, step=None):
+        n = (N or pipe.t2s.stoks_len) - 1 - (len(stoks_prompt) if stoks_prompt is not None else 0)
+        return [torch.randint(0, 512, (n,)) for _ in txts]
+    pipe.t2s.generate_batch = generate_batch
+    lens = []
+    decode_batch = pipe.vocoder.decode_batch
+    pipe.vocoder.decode_batch = lambda atoks: lens.extend(x.shape[-1] for x in atoks) or decode_batch(atoks)
+    # the prompt and every segment still have to fit in the S2A context together
+    audio = pipe.generate_long('First sentence here. ' * 30, max_seconds=4)
+    assert len(lens) > 1 and min(lens) > 0
+    assert audio.shape[-1] == sum(lens) * 320 - (len(lens) - 1) * int(0.05 * 24000)
+
+def test_generate_long_no_context():
+    pipe = make_pipeline()
+    texts = []
+    def generate_batch(txts, cps=15, lang='en', stoks_prompt=None, N=None, step=None):
+        texts.extend(txts)
+        return [torch.randint(0, 512, (20,)) for _ in txts]
+    pipe.t2s.generate_batch = generate_batch
+    # without the prompt every segment can use the whole T2S text context
+    pipe.generate_long('First sentence here. ' * 20, max_seconds=30, context=False)
+    assert len(texts) == 1
+    lens = []
+    decode_batch = pipe.vocoder.decode_batch
+    pipe.vocoder.decode_batch = lambda atoks: lens.extend(x.shape[-1] for x in atoks) or decode_batch(atoks)
+    audio = pipe.generate_long('First sentence here. ' * 60, max_seconds=30, context=False)
+    # the segments are not overlapped but separated with silence
+    gap = int(0.05 * 24000)
+    assert len(lens) == 3 and audio.shape[-1] == sum(lens) * 320 + 2 * gap
+    start = lens[0] * 320
+    assert (audio[...,start:start+gap] == 0).all()
+
+def test_stream_stops_t2s():
+    pipe = make_pipeline(max_batch_size=1)
+    produced, finished = [], threading.Event()
+    # a slow T2S model which never stops on its own
+    def generate_stream(*args, **kwargs):
+        try:
+            for i in range(pipe.t2s.stoks_len - 1):
+                time.sleep(0.002)
+                produced.append(i)
+                yield torch.randint(0, 512, (1,))
+        finally:
+            finished.set()
+    pipe.t2s.generate_stream = generate_stream
+
+    stream = pipe.generate_stream("hello world", lookahead=4, chunk_frames=10)
+    assert next(stream).shape[-1] > 0
+    # the client went away: T2S running in the background has to stop instead of finishing the utterance
+    stream.close()
+    assert finished.wait(10)
+    assert len(produced) < pipe.t2s.stoks_len - 1
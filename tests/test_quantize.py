@@ -0,0 +1,62 @@
+import pytest
+import torch
+
+from whisperspeech import inference
+from conftest import make_t2s, make_s2a
+
+def rel_error(a, b):
+    return ((a - b).norm() / b.norm()).item()
+
+def decoder_output(m, xenc, xenc_positions, x):
+    # the training mode runs the decoder without the KV cache
+    m.decoder.train()
+    try:
+        return m.decoder(x, torch.arange(x.shape[1]), xenc, xenc_positions)
+    finally:
+        m.decoder.eval()
+
+def load(m, fname):
+    if 'cond' in type(m).__module__: return type(m).load_model(str(fname), device='cpu')
+    return type(m).load_model(local_filename=str(fname), device='cpu')
+
+@pytest.mark.parametrize('cond', [False, True], ids=['s2a', 's2a_cond'])
+def test_quantize_s2a(tmp_path, cond, stoks, speakers):
+    ref, q = make_s2a(cond=cond), make_s2a(cond=cond, quantize='int8')
+    assert q.quantized == 'int8'
+    assert any(isinstance(l, torch.ao.nn.quantized.dynamic.Linear) for l in q.decoder.modules())
+    # the int8 layers stay close to the float32 ones
+    torch.manual_seed(0)
+    x = torch.randn(1, 20, q.decoder.layers[0].attn_ln.weight.shape[0])
+    outs = []
+    for m in (ref, q):
+        xenc, xenc_positions = m.encode(m.prep_stoks(stoks[1]).unsqueeze(0), speakers[:1])
+        outs.append((xenc, decoder_output(m, xenc, xenc_positions, x)))
+    assert rel_error(outs[1][0], outs[0][0]) < 0.05 and rel_error(outs[1][1], outs[0][1]) < 0.05
+
+    q.save_model(tmp_path/'q.model')
+    assert inference.load_spec(tmp_path/'q.model')['quantized'] == 'int8'
+    loaded = load(q, tmp_path/'q.model')
+    assert loaded.quantized == 'int8'
+    loaded.optimize(torch_compile=False)
+    assert torch.equal(loaded.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False),
+                       q.generate(stoks[1], speakers[:1], T=0, show_progress_bar=False))
+
+def test_quantize_t2s(tmp_path):
+    ref, q = make_t2s(), make_t2s(quantize='int8')
+    assert q.quantized == 'int8'
+    torch.manual_seed(0)
+    x = torch.randn(1, 20, q.decoder.layers[0].attn_ln.weight.shape[0])
+    outs = []
+    for m in (ref, q):
+        m.ensure_tokenizer()
+        ttoks, cpss, langs = m.prep("hello world")
+        xenc, xenc_positions, _ = m.run_encoder(ttoks, langs, cpss)
+        outs.append((xenc, decoder_output(m, xenc, xenc_positions, x)))
+    assert rel_error(outs[1][0], outs[0][0]) < 0.05 and rel_error(outs[1][1], outs[0][1]) < 0.05
+
+    q.save_model(tmp_path/'q.model')
+    assert inference.load_spec(tmp_path/'q.model')['quantized'] == 'int8'
+    loaded = load(q, tmp_path/'q.model')
+    loaded.optimize(torch_compile=False)
+    assert torch.equal(loaded.generate("hello world", N=30, T=0, show_progress_bar=False),
+                       q.generate("hello world", N=30, T=0, show_progress_bar=False))
@@ -0,0 +1,51 @@
+import pytest
+import torch
+
+from whisperspeech import inference, t2s_up_wds_mlang_enclm, s2a_delar_mup_wds_mlang, s2a_delar_mup_wds_mlang_cond
+from conftest import t2s_args, s2a_args, random_init
+
+models = {
+    't2s': (t2s_up_wds_mlang_enclm.TSARTransformer, t2s_args),
+    's2a': (s2a_delar_mup_wds_mlang.SADelARTransformer, s2a_args),
+    's2a_cond': (s2a_delar_mup_wds_mlang_cond.SADelARTransformer, s2a_args),
+}
+
+def load(cls, fname):
+    if cls is s2a_delar_mup_wds_mlang_cond.SADelARTransformer: return cls.load_model(str(fname), device='cpu')
+    return cls.load_model(local_filename=str(fname), device='cpu')
+
+def assert_state_equal(a, b):
+    assert a.keys() == b.keys()
+    for k in a:
+        if isinstance(a[k], torch.Tensor): assert torch.equal(a[k], b[k]), k
+        else: assert a[k] == b[k], k
+
+@pytest.mark.parametrize('name', models)
+def test_safetensors_roundtrip(tmp_path, name):
+    cls, args = models[name]
+    m = random_init(cls(**args), 0)
+    m.__stored_args__ = args
+    m.save_model(tmp_path/'m.model')
+    m.save_model(tmp_path/'m.safetensors')
+    a, b = load(cls, tmp_path/'m.model'), load(cls, tmp_path/'m.safetensors')
+    assert_state_equal(a.state_dict(), b.state_dict())
+    assert not b.training
+
+    for x in (a, b): x.optimize(dtype=torch.float32, torch_compile=False)
+    if name == 't2s':
+        gen = lambda x: x.generate("hello", N=30, T=0, show_progress_bar=False)
+    else:
+        stoks, spk = torch.randint(0, 512, (20,)), torch.randn(1, 192)
+        gen = lambda x: x.generate(stoks, spk, T=0, show_progress_bar=False)
+    assert torch.equal(gen(a), gen(b))
+
+def test_safetensors_spec(tmp_path):
+    spec = dict(config=dict(depth=2, name='x'), tunables=dict(rope=True),
+                state_dict={'a': torch.randn(3, 4), 'b': torch.arange(5), 'c': torch.randn(2).half(),
+                            '_extra_state': {'speaker_map': {'x': 1}}})
+    inference.save_safetensors(tmp_path/'x.safetensors', spec)
+    spec2 = inference.load_safetensors(tmp_path/'x.safetensors')
+    assert spec2['config'] == spec['config'] and spec2['tunables'] == spec['tunables']
+    assert_state_equal(spec['state_dict'], spec2['state_dict'])
+    # the header is padded so the memory-mapped tensors are aligned
+    assert int.from_bytes((tmp_path/'x.safetensors').read_bytes()[:8], 'little') % 8 == 0
@@ -0,0 +1,78 @@
+import json
+import time
+import asyncio
+
+import pytest
+import torch
+
+from whisperspeech.server import SynthesisWorker, parse_request, make_app
+
+class FakePipeline:
+    """Returns constant audio (or fails for texts starting with 'boom') instead of running any models."""
+    max_batch_size = 4
+    speakers = {'alice': torch.zeros(192)}
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_batch(self, texts, speakers, langs, cps):
+        self.calls.append(len(texts))
+        time.sleep(0.02)
+        if any(t.startswith('boom') for t in texts): raise KeyError('boom')
+        return [torch.full((1, 100*len(t)), 0.5) for t in texts]
+
+    def generate_stream(self, text, speaker, lang, cps):
+        if text.startswith('boom'): raise KeyError('boom')
+        for i in range(3): yield torch.full((1, 10), i/4)
+
+@pytest.fixture
+def worker():
+    w = SynthesisWorker(FakePipeline(), batch_timeout=0.05).start()
+    yield w
+    w.stop()
+
+def test_batching(worker):
+    async def go():
+        return await asyncio.gather(*[worker.generate("t"*(i+1)) for i in range(6)])
+    audio = asyncio.run(go())
+    assert [len(x) for x in audio] == [100*(i+1) for i in range(6)]
+    assert worker.pipe.calls == [4, 2]
+
+def test_bad_request_in_batch(worker):
+    async def go():
+        return await asyncio.gather(*[worker.generate(t) for t in ("a", "boom", "ccc")], return_exceptions=True)
+    a, b, c = asyncio.run(go())
+    # the batch fails and the requests are retried one by one
+    assert len(a) == 100 and len(c) == 300 and isinstance(b, KeyError)
+    assert worker.pipe.calls == [3, 1, 1, 1]
+    assert worker.stats()['errors'] == 1
+
+def test_parse_request():
+    speakers = FakePipeline.speakers
+    assert parse_request({'text': 'hi', 'lang': 'pl', 'cps': 10}, speakers) == dict(text='hi', speaker=None, lang='pl', cps=10.)
+    for params in ({}, {'text': ' '}, {'text': 'hi', 'speaker': '/etc/passwd'}, {'text': 'hi', 'lang': 'xx'},
+                   {'text': 'hi', 'lang': ['en']}, {'text': 'hi', 'cps': -1}, {'text': 'hi', 'cps': 100},
+                   {'text': 'hi', 'cps': 'fast'}):
+        with pytest.raises(ValueError): parse_request(params, speakers)
+
+def test_app(worker):
+    testclient = pytest.importorskip('starlette.testclient')
+    with testclient.TestClient(make_app(worker)) as client:
+        r = client.post('/v1/tts', json={'text': 'hi', 'speaker': 'alice'})
+        assert r.status_code == 200 and r.headers['content-type'] == 'audio/wav'
+        assert client.post('/v1/tts', json={'text': 'hi', 'lang': 'xx'}).status_code == 400
+        assert client.post('/v1/tts', json={'text': 'boom'}).status_code == 500
+        r = client.post('/v1/tts', json={'text': 'hi', 'stream': True})
+        assert r.status_code == 200 and len(r.content) == 3 * 10 * 2
+
+        with client.websocket_connect('/v1/tts/stream') as ws:
+            # errors are reported and the connection can still be used
+            for text, reply in (('boom', 'error'), ('hello', 'done'), ('hi', 'done')):
+                ws.send_json({'text': text})
+                n, msg = 0, ws.receive()
+                while msg.get('bytes') is not None:
+                    n += len(msg['bytes'])
+                    msg = ws.receive()
+                assert reply in json.loads(msg['text'])
+                assert n == (0 if reply == 'error' else 60)
+        assert client.get('/v1/speakers').json() == ['alice']
@@ -0,0 +1,43 @@
+import pytest
+import torch
+
+from whisperspeech.pipeline import Pipeline
+from conftest import make_t2s, make_s2a
+
+# With greedy sampling speculative decoding has to return exactly what `generate` returns, whatever the draft proposes.
+
+@pytest.mark.parametrize('k', [1, 3, 5])
+def test_t2s_speculative(k):
+    t2s = make_t2s(0)
+    ref = t2s.generate("hello world", N=60, T=0, show_progress_bar=False)
+    for draft in (t2s, make_t2s(1)):
+        out = t2s.generate_speculative(draft, "hello world", N=60, k=k, T=0)
+        assert torch.equal(ref, out)
+    assert 0 <= t2s.speculative_stats['accepted'] <= t2s.speculative_stats['drafted']
+
+@pytest.mark.parametrize('cond', [False, True], ids=['s2a', 's2a_cond'])
+def test_s2a_speculative(cond, stoks, speakers):
+    s2a, draft = make_s2a(0, cond=cond), make_s2a(1, cond=cond)
+    st, spk = stoks[1], speakers[:1]
+    ref = s2a.generate(st, spk, T=0, show_progress_bar=False)
+    for frames in (1, 3, 6):
+        assert torch.equal(ref, s2a.generate_speculative(draft, st, spk, T=0, frames_per_step=frames))
+    prompt = torch.randint(0, 1024, (1, 4, 12))
+    assert torch.equal(s2a.generate(st, spk, atoks_prompt=prompt, T=0, show_progress_bar=False),
+                       s2a.generate_speculative(draft, st, spk, atoks_prompt=prompt, T=0))
+
+def test_t2s_speculative_prompt():
+    prompt = torch.randint(0, 512, (7,))
+    # the speculative run goes first so it cannot reuse a KV cache filled by `generate`
+    t2s, draft = make_t2s(0), make_t2s(1)
+    out = t2s.generate_speculative(draft, "hello world", N=60, k=3, T=0, stoks_prompt=prompt)
+    t2s.decoder.setup_kv_cache()
+    assert torch.equal(t2s.generate("hello world", N=60, T=0, stoks_prompt=prompt, show_progress_bar=False), out)
+
+def test_s2a_speculative_window(speakers):
+    # the draft frames which get rejected would overwrite the ring buffer of a windowed KV cache
+    s2a, draft = make_s2a(0, kv_window=16), make_s2a(1)
+    with pytest.raises(AssertionError):
+        s2a.generate_speculative(draft, torch.randint(0, 512, (20,)), speakers[:1], T=0)
+    with pytest.raises(AssertionError):
+        Pipeline(s2a_window=300, s2a_draft_ref='draft.model')
@@ -1 +1 @@
-__version__ = "0.8"
+__version__ = "0.8.9"
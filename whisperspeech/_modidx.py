@@ -0,0 +1,1916 @@
+# Autogenerated by nbdev
+
+d = { 'settings': { 'branch': 'master',
+                'doc_baseurl': '/WhisperSpeech',
+                'doc_host': 'https://collabora.github.io',
+                'git_url': 'https://github.com/collabora/WhisperSpeech',
+                'lib_path': 'whisperspeech'},
+  'syms': { 'whisperspeech.a2wav': { 'whisperspeech.a2wav.Vocoder': ('6. quality-boosting vocoder.html#vocoder', 'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.__init__': ( '6. quality-boosting vocoder.html#vocoder.__init__',
+                                                                               'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.decode': ( '6. quality-boosting vocoder.html#vocoder.decode',
+                                                                             'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.decode_batch': ( '6. quality-boosting vocoder.html#vocoder.decode_batch',
+                                                                                   'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.decode_stream': ( '6. quality-boosting '
+                                                                                    'vocoder.html#vocoder.decode_stream',
+                                                                                    'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.decode_to_file': ( '6. quality-boosting '
+                                                                                     'vocoder.html#vocoder.decode_to_file',
+                                                                                     'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.decode_to_notebook': ( '6. quality-boosting '
+                                                                                         'vocoder.html#vocoder.decode_to_notebook',
+                                                                                         'whisperspeech/a2wav.py'),
+                                     'whisperspeech.a2wav.Vocoder.is_notebook': ( '6. quality-boosting vocoder.html#vocoder.is_notebook',
+                                                                                  'whisperspeech/a2wav.py')},
+            'whisperspeech.batching': { 'whisperspeech.batching.S2ARequest': ( '7a. continuous batching.html#s2arequest',
+                                                                               'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2ARequest.done': ( '7a. continuous batching.html#s2arequest.done',
+                                                                                    'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler': ( '7a. continuous batching.html#s2ascheduler',
+                                                                                 'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler.__init__': ( '7a. continuous '
+                                                                                          'batching.html#s2ascheduler.__init__',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler._initial_length': ( '7a. continuous '
+                                                                                                 'batching.html#s2ascheduler._initial_length',
+                                                                                                 'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler._retire': ( '7a. continuous '
+                                                                                         'batching.html#s2ascheduler._retire',
+                                                                                         'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler._snapshot': ( '7a. continuous '
+                                                                                           'batching.html#s2ascheduler._snapshot',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler._target_length': ( '7a. continuous '
+                                                                                                'batching.html#s2ascheduler._target_length',
+                                                                                                'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler._write': ( '7a. continuous batching.html#s2ascheduler._write',
+                                                                                        'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler.admit': ( '7a. continuous batching.html#s2ascheduler.admit',
+                                                                                       'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler.generate': ( '7a. continuous '
+                                                                                          'batching.html#s2ascheduler.generate',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler.step': ( '7a. continuous batching.html#s2ascheduler.step',
+                                                                                      'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.S2AScheduler.submit': ( '7a. continuous batching.html#s2ascheduler.submit',
+                                                                                        'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler': ( '7a. continuous batching.html#slotscheduler',
+                                                                                  'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler.__init__': ( '7a. continuous '
+                                                                                           'batching.html#slotscheduler.__init__',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._active_slots': ( '7a. continuous '
+                                                                                                'batching.html#slotscheduler._active_slots',
+                                                                                                'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._finish': ( '7a. continuous '
+                                                                                          'batching.html#slotscheduler._finish',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._free_slot': ( '7a. continuous '
+                                                                                             'batching.html#slotscheduler._free_slot',
+                                                                                             'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._initial_length': ( '7a. continuous '
+                                                                                                  'batching.html#slotscheduler._initial_length',
+                                                                                                  'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._kv_cache': ( '7a. continuous '
+                                                                                            'batching.html#slotscheduler._kv_cache',
+                                                                                            'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._preempt': ( '7a. continuous '
+                                                                                           'batching.html#slotscheduler._preempt',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._rank': ( '7a. continuous batching.html#slotscheduler._rank',
+                                                                                        'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._reserve': ( '7a. continuous '
+                                                                                           'batching.html#slotscheduler._reserve',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._snapshot': ( '7a. continuous '
+                                                                                            'batching.html#slotscheduler._snapshot',
+                                                                                            'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._store_cross_kv': ( '7a. continuous '
+                                                                                                  'batching.html#slotscheduler._store_cross_kv',
+                                                                                                  'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._submit': ( '7a. continuous '
+                                                                                          'batching.html#slotscheduler._submit',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._take_waiting': ( '7a. continuous '
+                                                                                                'batching.html#slotscheduler._take_waiting',
+                                                                                                'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler._urgency': ( '7a. continuous '
+                                                                                           'batching.html#slotscheduler._urgency',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler.active': ( '7a. continuous '
+                                                                                         'batching.html#slotscheduler.active',
+                                                                                         'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler.pending': ( '7a. continuous '
+                                                                                          'batching.html#slotscheduler.pending',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler.run': ( '7a. continuous batching.html#slotscheduler.run',
+                                                                                      'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.SlotScheduler.stats': ( '7a. continuous batching.html#slotscheduler.stats',
+                                                                                        'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SRequest': ( '7a. continuous batching.html#t2srequest',
+                                                                               'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SRequest.done': ( '7a. continuous batching.html#t2srequest.done',
+                                                                                    'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler': ( '7a. continuous batching.html#t2sscheduler',
+                                                                                 'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler.__init__': ( '7a. continuous '
+                                                                                          'batching.html#t2sscheduler.__init__',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler._alloc_buffers': ( '7a. continuous '
+                                                                                                'batching.html#t2sscheduler._alloc_buffers',
+                                                                                                'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler._initial_length': ( '7a. continuous '
+                                                                                                 'batching.html#t2sscheduler._initial_length',
+                                                                                                 'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler._prompt': ( '7a. continuous '
+                                                                                         'batching.html#t2sscheduler._prompt',
+                                                                                         'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler._retire': ( '7a. continuous '
+                                                                                         'batching.html#t2sscheduler._retire',
+                                                                                         'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler._snapshot': ( '7a. continuous '
+                                                                                           'batching.html#t2sscheduler._snapshot',
+                                                                                           'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler.admit': ( '7a. continuous batching.html#t2sscheduler.admit',
+                                                                                       'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler.generate': ( '7a. continuous '
+                                                                                          'batching.html#t2sscheduler.generate',
+                                                                                          'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler.step': ( '7a. continuous batching.html#t2sscheduler.step',
+                                                                                      'whisperspeech/batching.py'),
+                                        'whisperspeech.batching.T2SScheduler.submit': ( '7a. continuous batching.html#t2sscheduler.submit',
+                                                                                        'whisperspeech/batching.py')},
+            'whisperspeech.benchmark': { 'whisperspeech.benchmark.benchmark': ('c. benchmark.html#benchmark', 'whisperspeech/benchmark.py'),
+                                         'whisperspeech.benchmark.measure': ('c. benchmark.html#measure', 'whisperspeech/benchmark.py'),
+                                         'whisperspeech.benchmark.measure_import': ( 'c. benchmark.html#measure_import',
+                                                                                     'whisperspeech/benchmark.py')},
+            'whisperspeech.cache': { 'whisperspeech.cache.AudioCache': ('7b. caches.html#audiocache', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.AudioCache.__init__': ( '7b. caches.html#audiocache.__init__',
+                                                                                  'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.AudioCache.load': ('7b. caches.html#audiocache.load', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.AudioCache.save': ('7b. caches.html#audiocache.save', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache': ('7b. caches.html#diskcache', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.__contains__': ( '7b. caches.html#diskcache.__contains__',
+                                                                                     'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.__init__': ( '7b. caches.html#diskcache.__init__',
+                                                                                 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.__len__': ( '7b. caches.html#diskcache.__len__',
+                                                                                'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.clear': ('7b. caches.html#diskcache.clear', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.evict': ('7b. caches.html#diskcache.evict', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.files': ('7b. caches.html#diskcache.files', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.fname': ('7b. caches.html#diskcache.fname', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.get': ('7b. caches.html#diskcache.get', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.load': ('7b. caches.html#diskcache.load', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.put': ('7b. caches.html#diskcache.put', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.save': ('7b. caches.html#diskcache.save', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.DiskCache.stats': ('7b. caches.html#diskcache.stats', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache': ('7b. caches.html#lrucache', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.__contains__': ( '7b. caches.html#lrucache.__contains__',
+                                                                                    'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.__init__': ( '7b. caches.html#lrucache.__init__',
+                                                                                'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.__len__': ('7b. caches.html#lrucache.__len__', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.clear': ('7b. caches.html#lrucache.clear', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.get': ('7b. caches.html#lrucache.get', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.put': ('7b. caches.html#lrucache.put', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.LRUCache.stats': ('7b. caches.html#lrucache.stats', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache': ('7b. caches.html#tieredcache', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.__contains__': ( '7b. caches.html#tieredcache.__contains__',
+                                                                                       'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.__init__': ( '7b. caches.html#tieredcache.__init__',
+                                                                                   'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.clear': ( '7b. caches.html#tieredcache.clear',
+                                                                                'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.get': ('7b. caches.html#tieredcache.get', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.put': ('7b. caches.html#tieredcache.put', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.TieredCache.stats': ( '7b. caches.html#tieredcache.stats',
+                                                                                'whisperspeech/cache.py'),
+                                     'whisperspeech.cache._hash_value': ('7b. caches.html#_hash_value', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache._nbytes': ('7b. caches.html#_nbytes', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.content_hash': ('7b. caches.html#content_hash', 'whisperspeech/cache.py'),
+                                     'whisperspeech.cache.model_checksum': ('7b. caches.html#model_checksum', 'whisperspeech/cache.py')},
+            'whisperspeech.extract_metrics': { 'whisperspeech.extract_metrics.prepare_metrics': ( '3b. speech quality metrics '
+                                                                                                  'extraction.html#prepare_metrics',
+                                                                                                  'whisperspeech/extract_metrics.py')},
+            'whisperspeech.extract_spk_emb': { 'whisperspeech.extract_spk_emb.calc_len': ( '2a. speaker embeddings.html#calc_len',
+                                                                                           'whisperspeech/extract_spk_emb.py'),
+                                               'whisperspeech.extract_spk_emb.chunked_dataset': ( '2a. speaker '
+                                                                                                  'embeddings.html#chunked_dataset',
+                                                                                                  'whisperspeech/extract_spk_emb.py'),
+                                               'whisperspeech.extract_spk_emb.process_shard': ( '2a. speaker embeddings.html#process_shard',
+                                                                                                'whisperspeech/extract_spk_emb.py')},
+            'whisperspeech.extract_stoks': { 'whisperspeech.extract_stoks.prepare_stoks': ( '3b. semantic token '
+                                                                                            'extraction.html#prepare_stoks',
+                                                                                            'whisperspeech/extract_stoks.py')},
+            'whisperspeech.fetch_models': { 'whisperspeech.fetch_models.load_whisperx': ( '0. download models.html#load_whisperx',
+                                                                                          'whisperspeech/fetch_models.py'),
+                                            'whisperspeech.fetch_models.main': ( '0. download models.html#main',
+                                                                                 'whisperspeech/fetch_models.py')},
+            'whisperspeech.inference': { 'whisperspeech.inference.export_safetensors': ( 'd. common inference '
+                                                                                         'utilities.html#export_safetensors',
+                                                                                         'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.get_compute_device': ( 'd. common inference '
+                                                                                         'utilities.html#get_compute_device',
+                                                                                         'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.get_default_compute_device': ( 'd. common inference '
+                                                                                                 'utilities.html#get_default_compute_device',
+                                                                                                 'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.inference_context': ( 'd. common inference '
+                                                                                        'utilities.html#inference_context',
+                                                                                        'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.load_model': ( 'd. common inference utilities.html#load_model',
+                                                                                 'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.load_safetensors': ( 'd. common inference '
+                                                                                       'utilities.html#load_safetensors',
+                                                                                       'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.load_spec': ( 'd. common inference utilities.html#load_spec',
+                                                                                'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.logits_to_probs': ( 'd. common inference utilities.html#logits_to_probs',
+                                                                                      'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.multinomial_sample_one_no_sync': ( 'd. common inference '
+                                                                                                     'utilities.html#multinomial_sample_one_no_sync',
+                                                                                                     'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.progress_bar': ( 'd. common inference utilities.html#progress_bar',
+                                                                                   'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.sample': ( 'd. common inference utilities.html#sample',
+                                                                             'whisperspeech/inference.py'),
+                                         'whisperspeech.inference.save_safetensors': ( 'd. common inference '
+                                                                                       'utilities.html#save_safetensors',
+                                                                                       'whisperspeech/inference.py')},
+            'whisperspeech.languages': {'whisperspeech.languages.to_id': ('b. languages.html#to_id', 'whisperspeech/languages.py')},
+            'whisperspeech.modules': { 'whisperspeech.modules.BaseDecoder': ( 'a. neural modules.html#basedecoder',
+                                                                              'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.BaseDecoder.__init__': ( 'a. neural modules.html#basedecoder.__init__',
+                                                                                       'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.BaseDecoder.forward': ( 'a. neural modules.html#basedecoder.forward',
+                                                                                      'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.BaseDecoder.project_cross_kv': ( 'a. neural '
+                                                                                               'modules.html#basedecoder.project_cross_kv',
+                                                                                               'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.BaseDecoder.select_kv_rows': ( 'a. neural '
+                                                                                             'modules.html#basedecoder.select_kv_rows',
+                                                                                             'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.BaseDecoder.setup_kv_cache': ( 'a. neural '
+                                                                                             'modules.html#basedecoder.setup_kv_cache',
+                                                                                             'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.EmbeddingProjector': ( 'a. neural modules.html#embeddingprojector',
+                                                                                     'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings': ( 'a. neural modules.html#flexembeddings',
+                                                                                 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings.__init__': ( 'a. neural modules.html#flexembeddings.__init__',
+                                                                                          'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings.convert_for_eval': ( 'a. neural '
+                                                                                                  'modules.html#flexembeddings.convert_for_eval',
+                                                                                                  'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings.forward': ( 'a. neural modules.html#flexembeddings.forward',
+                                                                                         'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings.set_frozen_embeddings': ( 'a. neural '
+                                                                                                       'modules.html#flexembeddings.set_frozen_embeddings',
+                                                                                                       'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.FlexEmbeddings.unembed': ( 'a. neural modules.html#flexembeddings.unembed',
+                                                                                         'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.KVPagePool': ( 'a. neural modules.html#kvpagepool',
+                                                                             'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.KVPagePool.__init__': ( 'a. neural modules.html#kvpagepool.__init__',
+                                                                                      'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.KVPagePool.alloc': ( 'a. neural modules.html#kvpagepool.alloc',
+                                                                                   'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.KVPagePool.n_free': ( 'a. neural modules.html#kvpagepool.n_free',
+                                                                                    'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.KVPagePool.release': ( 'a. neural modules.html#kvpagepool.release',
+                                                                                     'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.LayerNorm': ('a. neural modules.html#layernorm', 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.LayerNorm.forward': ( 'a. neural modules.html#layernorm.forward',
+                                                                                    'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.LinearHead': ( 'a. neural modules.html#linearhead',
+                                                                             'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention': ( 'a. neural modules.html#multiheadattention',
+                                                                                     'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.__init__': ( 'a. neural '
+                                                                                              'modules.html#multiheadattention.__init__',
+                                                                                              'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.convert_for_eval': ( 'a. neural '
+                                                                                                      'modules.html#multiheadattention.convert_for_eval',
+                                                                                                      'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.forward': ( 'a. neural '
+                                                                                             'modules.html#multiheadattention.forward',
+                                                                                             'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.merge_linears': ( 'a. neural '
+                                                                                                   'modules.html#multiheadattention.merge_linears',
+                                                                                                   'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.paged_kv': ( 'a. neural '
+                                                                                              'modules.html#multiheadattention.paged_kv',
+                                                                                              'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.project_kv': ( 'a. neural '
+                                                                                                'modules.html#multiheadattention.project_kv',
+                                                                                                'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.select_kv_rows': ( 'a. neural '
+                                                                                                    'modules.html#multiheadattention.select_kv_rows',
+                                                                                                    'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.setup_kv_cache': ( 'a. neural '
+                                                                                                    'modules.html#multiheadattention.setup_kv_cache',
+                                                                                                    'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.split_heads': ( 'a. neural '
+                                                                                                 'modules.html#multiheadattention.split_heads',
+                                                                                                 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.update_kv_cache': ( 'a. neural '
+                                                                                                     'modules.html#multiheadattention.update_kv_cache',
+                                                                                                     'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.MultiHeadAttention.window_kv': ( 'a. neural '
+                                                                                               'modules.html#multiheadattention.window_kv',
+                                                                                               'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache': ( 'a. neural modules.html#pagedkvcache',
+                                                                               'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache.__init__': ( 'a. neural modules.html#pagedkvcache.__init__',
+                                                                                        'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache.attached': ( 'a. neural modules.html#pagedkvcache.attached',
+                                                                                        'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache.pages_needed': ( 'a. neural '
+                                                                                            'modules.html#pagedkvcache.pages_needed',
+                                                                                            'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache.release': ( 'a. neural modules.html#pagedkvcache.release',
+                                                                                       'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.PagedKVCache.reserve': ( 'a. neural modules.html#pagedkvcache.reserve',
+                                                                                       'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.QueryHead': ('a. neural modules.html#queryhead', 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.ResidualAttentionBlock': ( 'a. neural modules.html#residualattentionblock',
+                                                                                         'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.ResidualAttentionBlock.__init__': ( 'a. neural '
+                                                                                                  'modules.html#residualattentionblock.__init__',
+                                                                                                  'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.ResidualAttentionBlock.forward': ( 'a. neural '
+                                                                                                 'modules.html#residualattentionblock.forward',
+                                                                                                 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.ResidualAttentionBlock.setup_kv_cache': ( 'a. neural '
+                                                                                                        'modules.html#residualattentionblock.setup_kv_cache',
+                                                                                                        'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.Rotary': ('a. neural modules.html#rotary', 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.Rotary.__init__': ( 'a. neural modules.html#rotary.__init__',
+                                                                                  'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.Rotary.at': ('a. neural modules.html#rotary.at', 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.Rotary.forward': ( 'a. neural modules.html#rotary.forward',
+                                                                                 'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.init_transformer': ( 'a. neural modules.html#init_transformer',
+                                                                                   'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.quantize_int8': ( 'a. neural modules.html#quantize_int8',
+                                                                                'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.rope_rotate': ( 'a. neural modules.html#rope_rotate',
+                                                                              'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.rotate_half': ( 'a. neural modules.html#rotate_half',
+                                                                              'whisperspeech/modules.py'),
+                                       'whisperspeech.modules.sinusoids': ('a. neural modules.html#sinusoids', 'whisperspeech/modules.py')},
+            'whisperspeech.pipeline': { 'whisperspeech.pipeline.Pipeline': ('7. pipeline.html#pipeline', 'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.__init__': ( '7. pipeline.html#pipeline.__init__',
+                                                                                      'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.cache_key': ( '7. pipeline.html#pipeline.cache_key',
+                                                                                       'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.cache_stats': ( '7. pipeline.html#pipeline.cache_stats',
+                                                                                         'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.cached_stoks_stream': ( '7. '
+                                                                                                 'pipeline.html#pipeline.cached_stoks_stream',
+                                                                                                 'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.checksum': ( '7. pipeline.html#pipeline.checksum',
+                                                                                      'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.extract_spk_emb': ( '7. pipeline.html#pipeline.extract_spk_emb',
+                                                                                             'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.extract_spk_embs': ( '7. pipeline.html#pipeline.extract_spk_embs',
+                                                                                              'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate': ( '7. pipeline.html#pipeline.generate',
+                                                                                      'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_atoks': ( '7. pipeline.html#pipeline.generate_atoks',
+                                                                                            'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_atoks_batch': ( '7. '
+                                                                                                  'pipeline.html#pipeline.generate_atoks_batch',
+                                                                                                  'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_batch': ( '7. pipeline.html#pipeline.generate_batch',
+                                                                                            'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_long': ( '7. pipeline.html#pipeline.generate_long',
+                                                                                           'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_long_windowed': ( '7. '
+                                                                                                    'pipeline.html#pipeline.generate_long_windowed',
+                                                                                                    'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_stoks': ( '7. pipeline.html#pipeline.generate_stoks',
+                                                                                            'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_stoks_async': ( '7. '
+                                                                                                  'pipeline.html#pipeline.generate_stoks_async',
+                                                                                                  'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_stream': ( '7. pipeline.html#pipeline.generate_stream',
+                                                                                             'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_to_file': ( '7. pipeline.html#pipeline.generate_to_file',
+                                                                                              'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.generate_to_notebook': ( '7. '
+                                                                                                  'pipeline.html#pipeline.generate_to_notebook',
+                                                                                                  'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.get_cached_audio': ( '7. pipeline.html#pipeline.get_cached_audio',
+                                                                                              'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.get_speaker': ( '7. pipeline.html#pipeline.get_speaker',
+                                                                                         'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.get_stoks': ( '7. pipeline.html#pipeline.get_stoks',
+                                                                                       'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.load_spk_audio': ( '7. pipeline.html#pipeline.load_spk_audio',
+                                                                                            'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.load_spk_encoder': ( '7. pipeline.html#pipeline.load_spk_encoder',
+                                                                                              'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.make_cache': ( '7. pipeline.html#pipeline.make_cache',
+                                                                                        'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.register_speaker': ( '7. pipeline.html#pipeline.register_speaker',
+                                                                                              'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.setup_kv_cache': ( '7. pipeline.html#pipeline.setup_kv_cache',
+                                                                                            'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.Pipeline.share_memory': ( '7. pipeline.html#pipeline.share_memory',
+                                                                                          'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.crossfade_concat': ( '7. pipeline.html#crossfade_concat',
+                                                                                     'whisperspeech/pipeline.py'),
+                                        'whisperspeech.pipeline.split_text': ('7. pipeline.html#split_text', 'whisperspeech/pipeline.py')},
+            'whisperspeech.prepare_s2a_atoks': { 'whisperspeech.prepare_s2a_atoks.load_model': ( '3c. s2a acoustic tokens '
+                                                                                                 'preparation.html#load_model',
+                                                                                                 'whisperspeech/prepare_s2a_atoks.py'),
+                                                 'whisperspeech.prepare_s2a_atoks.prepare_atoks': ( '3c. s2a acoustic tokens '
+                                                                                                    'preparation.html#prepare_atoks',
+                                                                                                    'whisperspeech/prepare_s2a_atoks.py')},
+            'whisperspeech.prepare_t2s_txts': { 'whisperspeech.prepare_t2s_txts.Transcriber': ( '3a. t2s transcripts '
+                                                                                                'preparation.html#transcriber',
+                                                                                                'whisperspeech/prepare_t2s_txts.py'),
+                                                'whisperspeech.prepare_t2s_txts.Transcriber.__init__': ( '3a. t2s transcripts '
+                                                                                                         'preparation.html#transcriber.__init__',
+                                                                                                         'whisperspeech/prepare_t2s_txts.py'),
+                                                'whisperspeech.prepare_t2s_txts.Transcriber.transcribe': ( '3a. t2s transcripts '
+                                                                                                           'preparation.html#transcriber.transcribe',
+                                                                                                           'whisperspeech/prepare_t2s_txts.py'),
+                                                'whisperspeech.prepare_t2s_txts.prepare_txt': ( '3a. t2s transcripts '
+                                                                                                'preparation.html#prepare_txt',
+                                                                                                'whisperspeech/prepare_t2s_txts.py')},
+            'whisperspeech.s2a_delar_mup_wds_mlang': { 'whisperspeech.s2a_delar_mup_wds_mlang.DelSumEmbedding': ( '4b. multi-language '
+                                                                                                                  'semantic to acoustic '
+                                                                                                                  'token '
+                                                                                                                  'modeling.html#delsumembedding',
+                                                                                                                  'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.DelSumEmbedding.__init__': ( '4b. '
+                                                                                                                           'multi-language '
+                                                                                                                           'semantic to '
+                                                                                                                           'acoustic token '
+                                                                                                                           'modeling.html#delsumembedding.__init__',
+                                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.DelSumEmbedding.forward': ( '4b. '
+                                                                                                                          'multi-language '
+                                                                                                                          'semantic to '
+                                                                                                                          'acoustic token '
+                                                                                                                          'modeling.html#delsumembedding.forward',
+                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.DelSumHead': ( '4b. multi-language semantic '
+                                                                                                             'to acoustic token '
+                                                                                                             'modeling.html#delsumhead',
+                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.DelSumHead.__init__': ( '4b. multi-language '
+                                                                                                                      'semantic to '
+                                                                                                                      'acoustic token '
+                                                                                                                      'modeling.html#delsumhead.__init__',
+                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.DelSumHead.forward': ( '4b. multi-language '
+                                                                                                                     'semantic to acoustic '
+                                                                                                                     'token '
+                                                                                                                     'modeling.html#delsumhead.forward',
+                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer': ( '4b. multi-language '
+                                                                                                                     'semantic to acoustic '
+                                                                                                                     'token '
+                                                                                                                     'modeling.html#sadelartransformer',
+                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.__init__': ( '4b. '
+                                                                                                                              'multi-language '
+                                                                                                                              'semantic to '
+                                                                                                                              'acoustic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#sadelartransformer.__init__',
+                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer._encoder': ( '4b. '
+                                                                                                                              'multi-language '
+                                                                                                                              'semantic to '
+                                                                                                                              'acoustic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#sadelartransformer._encoder',
+                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.convert_for_eval': ( '4b. '
+                                                                                                                                      'multi-language '
+                                                                                                                                      'semantic '
+                                                                                                                                      'to '
+                                                                                                                                      'acoustic '
+                                                                                                                                      'token '
+                                                                                                                                      'modeling.html#sadelartransformer.convert_for_eval',
+                                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.device': ( '4b. '
+                                                                                                                            'multi-language '
+                                                                                                                            'semantic to '
+                                                                                                                            'acoustic '
+                                                                                                                            'token '
+                                                                                                                            'modeling.html#sadelartransformer.device',
+                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.embed_stoks': ( '4b. '
+                                                                                                                                 'multi-language '
+                                                                                                                                 'semantic '
+                                                                                                                                 'to '
+                                                                                                                                 'acoustic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#sadelartransformer.embed_stoks',
+                                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.encode': ( '4b. '
+                                                                                                                            'multi-language '
+                                                                                                                            'semantic to '
+                                                                                                                            'acoustic '
+                                                                                                                            'token '
+                                                                                                                            'modeling.html#sadelartransformer.encode',
+                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.forward': ( '4b. '
+                                                                                                                             'multi-language '
+                                                                                                                             'semantic to '
+                                                                                                                             'acoustic '
+                                                                                                                             'token '
+                                                                                                                             'modeling.html#sadelartransformer.forward',
+                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate': ( '4b. '
+                                                                                                                              'multi-language '
+                                                                                                                              'semantic to '
+                                                                                                                              'acoustic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#sadelartransformer.generate',
+                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_batch': ( '4b. '
+                                                                                                                                    'multi-language '
+                                                                                                                                    'semantic '
+                                                                                                                                    'to '
+                                                                                                                                    'acoustic '
+                                                                                                                                    'token '
+                                                                                                                                    'modeling.html#sadelartransformer.generate_batch',
+                                                                                                                                    'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_long': ( '4b. '
+                                                                                                                                   'multi-language '
+                                                                                                                                   'semantic '
+                                                                                                                                   'to '
+                                                                                                                                   'acoustic '
+                                                                                                                                   'token '
+                                                                                                                                   'modeling.html#sadelartransformer.generate_long',
+                                                                                                                                   'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_next': ( '4b. '
+                                                                                                                                   'multi-language '
+                                                                                                                                   'semantic '
+                                                                                                                                   'to '
+                                                                                                                                   'acoustic '
+                                                                                                                                   'token '
+                                                                                                                                   'modeling.html#sadelartransformer.generate_next',
+                                                                                                                                   'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_one': ( '4b. '
+                                                                                                                                  'multi-language '
+                                                                                                                                  'semantic '
+                                                                                                                                  'to '
+                                                                                                                                  'acoustic '
+                                                                                                                                  'token '
+                                                                                                                                  'modeling.html#sadelartransformer.generate_one',
+                                                                                                                                  'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_speculative': ( '4b. '
+                                                                                                                                          'multi-language '
+                                                                                                                                          'semantic '
+                                                                                                                                          'to '
+                                                                                                                                          'acoustic '
+                                                                                                                                          'token '
+                                                                                                                                          'modeling.html#sadelartransformer.generate_speculative',
+                                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.generate_stream': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#sadelartransformer.generate_stream',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.get_extra_state': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#sadelartransformer.get_extra_state',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.get_metrics': ( '4b. '
+                                                                                                                                 'multi-language '
+                                                                                                                                 'semantic '
+                                                                                                                                 'to '
+                                                                                                                                 'acoustic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#sadelartransformer.get_metrics',
+                                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.init_transformer': ( '4b. '
+                                                                                                                                      'multi-language '
+                                                                                                                                      'semantic '
+                                                                                                                                      'to '
+                                                                                                                                      'acoustic '
+                                                                                                                                      'token '
+                                                                                                                                      'modeling.html#sadelartransformer.init_transformer',
+                                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.load_checkpoint': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#sadelartransformer.load_checkpoint',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.load_frozen_acoustic_embeddings': ( '4b. '
+                                                                                                                                                     'multi-language '
+                                                                                                                                                     'semantic '
+                                                                                                                                                     'to '
+                                                                                                                                                     'acoustic '
+                                                                                                                                                     'token '
+                                                                                                                                                     'modeling.html#sadelartransformer.load_frozen_acoustic_embeddings',
+                                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.load_frozen_semantic_embeddings': ( '4b. '
+                                                                                                                                                     'multi-language '
+                                                                                                                                                     'semantic '
+                                                                                                                                                     'to '
+                                                                                                                                                     'acoustic '
+                                                                                                                                                     'token '
+                                                                                                                                                     'modeling.html#sadelartransformer.load_frozen_semantic_embeddings',
+                                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.load_model': ( '4b. '
+                                                                                                                                'multi-language '
+                                                                                                                                'semantic '
+                                                                                                                                'to '
+                                                                                                                                'acoustic '
+                                                                                                                                'token '
+                                                                                                                                'modeling.html#sadelartransformer.load_model',
+                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.optimize': ( '4b. '
+                                                                                                                              'multi-language '
+                                                                                                                              'semantic to '
+                                                                                                                              'acoustic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#sadelartransformer.optimize',
+                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.optimize_training': ( '4b. '
+                                                                                                                                       'multi-language '
+                                                                                                                                       'semantic '
+                                                                                                                                       'to '
+                                                                                                                                       'acoustic '
+                                                                                                                                       'token '
+                                                                                                                                       'modeling.html#sadelartransformer.optimize_training',
+                                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.prefill': ( '4b. '
+                                                                                                                             'multi-language '
+                                                                                                                             'semantic to '
+                                                                                                                             'acoustic '
+                                                                                                                             'token '
+                                                                                                                             'modeling.html#sadelartransformer.prefill',
+                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.prep_stoks': ( '4b. '
+                                                                                                                                'multi-language '
+                                                                                                                                'semantic '
+                                                                                                                                'to '
+                                                                                                                                'acoustic '
+                                                                                                                                'token '
+                                                                                                                                'modeling.html#sadelartransformer.prep_stoks',
+                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.quantize': ( '4b. '
+                                                                                                                              'multi-language '
+                                                                                                                              'semantic to '
+                                                                                                                              'acoustic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#sadelartransformer.quantize',
+                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.run_encoder': ( '4b. '
+                                                                                                                                 'multi-language '
+                                                                                                                                 'semantic '
+                                                                                                                                 'to '
+                                                                                                                                 'acoustic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#sadelartransformer.run_encoder',
+                                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.save_model': ( '4b. '
+                                                                                                                                'multi-language '
+                                                                                                                                'semantic '
+                                                                                                                                'to '
+                                                                                                                                'acoustic '
+                                                                                                                                'token '
+                                                                                                                                'modeling.html#sadelartransformer.save_model',
+                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.set_extra_state': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#sadelartransformer.set_extra_state',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.setup': ( '4b. '
+                                                                                                                           'multi-language '
+                                                                                                                           'semantic to '
+                                                                                                                           'acoustic token '
+                                                                                                                           'modeling.html#sadelartransformer.setup',
+                                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.stoks_length': ( '4b. '
+                                                                                                                                  'multi-language '
+                                                                                                                                  'semantic '
+                                                                                                                                  'to '
+                                                                                                                                  'acoustic '
+                                                                                                                                  'token '
+                                                                                                                                  'modeling.html#sadelartransformer.stoks_length',
+                                                                                                                                  'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.switch_dtypes': ( '4b. '
+                                                                                                                                   'multi-language '
+                                                                                                                                   'semantic '
+                                                                                                                                   'to '
+                                                                                                                                   'acoustic '
+                                                                                                                                   'token '
+                                                                                                                                   'modeling.html#sadelartransformer.switch_dtypes',
+                                                                                                                                   'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.SADelARTransformer.undelay': ( '4b. '
+                                                                                                                             'multi-language '
+                                                                                                                             'semantic to '
+                                                                                                                             'acoustic '
+                                                                                                                             'token '
+                                                                                                                             'modeling.html#sadelartransformer.undelay',
+                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.Tunables': ( '4b. multi-language semantic to '
+                                                                                                           'acoustic token '
+                                                                                                           'modeling.html#tunables',
+                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.Tunables.__post_init__': ( '4b. '
+                                                                                                                         'multi-language '
+                                                                                                                         'semantic to '
+                                                                                                                         'acoustic token '
+                                                                                                                         'modeling.html#tunables.__post_init__',
+                                                                                                                         'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.Tunables.upgrade': ( '4b. multi-language '
+                                                                                                                   'semantic to acoustic '
+                                                                                                                   'token '
+                                                                                                                   'modeling.html#tunables.upgrade',
+                                                                                                                   'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang._make_model': ( '4b. multi-language semantic '
+                                                                                                              'to acoustic token '
+                                                                                                              'modeling.html#_make_model',
+                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.load_dataset': ( '4b. multi-language '
+                                                                                                               'semantic to acoustic token '
+                                                                                                               'modeling.html#load_dataset',
+                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.load_model': ( '4b. multi-language semantic '
+                                                                                                             'to acoustic token '
+                                                                                                             'modeling.html#load_model',
+                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.logrand': ( '4b. multi-language semantic to '
+                                                                                                          'acoustic token '
+                                                                                                          'modeling.html#logrand',
+                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.make_model': ( '4b. multi-language semantic '
+                                                                                                             'to acoustic token '
+                                                                                                             'modeling.html#make_model',
+                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.pad_samples': ( '4b. multi-language semantic '
+                                                                                                              'to acoustic token '
+                                                                                                              'modeling.html#pad_samples',
+                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.rand': ( '4b. multi-language semantic to '
+                                                                                                       'acoustic token modeling.html#rand',
+                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang.py'),
+                                                       'whisperspeech.s2a_delar_mup_wds_mlang.random_trunc': ( '4b. multi-language '
+                                                                                                               'semantic to acoustic token '
+                                                                                                               'modeling.html#random_trunc',
+                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang.py')},
+            'whisperspeech.s2a_delar_mup_wds_mlang_cond': { 'whisperspeech.s2a_delar_mup_wds_mlang_cond.BinnedEmbedding': ( '4b. '
+                                                                                                                            'multi-language '
+                                                                                                                            'semantic to '
+                                                                                                                            'acoustic '
+                                                                                                                            'token '
+                                                                                                                            'modeling with '
+                                                                                                                            'conditioning.html#binnedembedding',
+                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.BinnedEmbedding.__init__': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling '
+                                                                                                                                     'with '
+                                                                                                                                     'conditioning.html#binnedembedding.__init__',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.BinnedEmbedding.forward': ( '4b. '
+                                                                                                                                    'multi-language '
+                                                                                                                                    'semantic '
+                                                                                                                                    'to '
+                                                                                                                                    'acoustic '
+                                                                                                                                    'token '
+                                                                                                                                    'modeling '
+                                                                                                                                    'with '
+                                                                                                                                    'conditioning.html#binnedembedding.forward',
+                                                                                                                                    'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.CategoricalEmbedding': ( '4b. '
+                                                                                                                                 'multi-language '
+                                                                                                                                 'semantic '
+                                                                                                                                 'to '
+                                                                                                                                 'acoustic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling '
+                                                                                                                                 'with '
+                                                                                                                                 'conditioning.html#categoricalembedding',
+                                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.CategoricalEmbedding.__init__': ( '4b. '
+                                                                                                                                          'multi-language '
+                                                                                                                                          'semantic '
+                                                                                                                                          'to '
+                                                                                                                                          'acoustic '
+                                                                                                                                          'token '
+                                                                                                                                          'modeling '
+                                                                                                                                          'with '
+                                                                                                                                          'conditioning.html#categoricalembedding.__init__',
+                                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.CategoricalEmbedding.forward': ( '4b. '
+                                                                                                                                         'multi-language '
+                                                                                                                                         'semantic '
+                                                                                                                                         'to '
+                                                                                                                                         'acoustic '
+                                                                                                                                         'token '
+                                                                                                                                         'modeling '
+                                                                                                                                         'with '
+                                                                                                                                         'conditioning.html#categoricalembedding.forward',
+                                                                                                                                         'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumEmbedding': ( '4b. '
+                                                                                                                            'multi-language '
+                                                                                                                            'semantic to '
+                                                                                                                            'acoustic '
+                                                                                                                            'token '
+                                                                                                                            'modeling with '
+                                                                                                                            'conditioning.html#delsumembedding',
+                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumEmbedding.__init__': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling '
+                                                                                                                                     'with '
+                                                                                                                                     'conditioning.html#delsumembedding.__init__',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumEmbedding.forward': ( '4b. '
+                                                                                                                                    'multi-language '
+                                                                                                                                    'semantic '
+                                                                                                                                    'to '
+                                                                                                                                    'acoustic '
+                                                                                                                                    'token '
+                                                                                                                                    'modeling '
+                                                                                                                                    'with '
+                                                                                                                                    'conditioning.html#delsumembedding.forward',
+                                                                                                                                    'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumHead': ( '4b. multi-language '
+                                                                                                                       'semantic to '
+                                                                                                                       'acoustic token '
+                                                                                                                       'modeling with '
+                                                                                                                       'conditioning.html#delsumhead',
+                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumHead.__init__': ( '4b. '
+                                                                                                                                'multi-language '
+                                                                                                                                'semantic '
+                                                                                                                                'to '
+                                                                                                                                'acoustic '
+                                                                                                                                'token '
+                                                                                                                                'modeling '
+                                                                                                                                'with '
+                                                                                                                                'conditioning.html#delsumhead.__init__',
+                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.DelSumHead.forward': ( '4b. '
+                                                                                                                               'multi-language '
+                                                                                                                               'semantic '
+                                                                                                                               'to '
+                                                                                                                               'acoustic '
+                                                                                                                               'token '
+                                                                                                                               'modeling '
+                                                                                                                               'with '
+                                                                                                                               'conditioning.html#delsumhead.forward',
+                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer': ( '4b. '
+                                                                                                                               'multi-language '
+                                                                                                                               'semantic '
+                                                                                                                               'to '
+                                                                                                                               'acoustic '
+                                                                                                                               'token '
+                                                                                                                               'modeling '
+                                                                                                                               'with '
+                                                                                                                               'conditioning.html#sadelartransformer',
+                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.__init__': ( '4b. '
+                                                                                                                                        'multi-language '
+                                                                                                                                        'semantic '
+                                                                                                                                        'to '
+                                                                                                                                        'acoustic '
+                                                                                                                                        'token '
+                                                                                                                                        'modeling '
+                                                                                                                                        'with '
+                                                                                                                                        'conditioning.html#sadelartransformer.__init__',
+                                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer._encoder': ( '4b. '
+                                                                                                                                        'multi-language '
+                                                                                                                                        'semantic '
+                                                                                                                                        'to '
+                                                                                                                                        'acoustic '
+                                                                                                                                        'token '
+                                                                                                                                        'modeling '
+                                                                                                                                        'with '
+                                                                                                                                        'conditioning.html#sadelartransformer._encoder',
+                                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.convert_for_eval': ( '4b. '
+                                                                                                                                                'multi-language '
+                                                                                                                                                'semantic '
+                                                                                                                                                'to '
+                                                                                                                                                'acoustic '
+                                                                                                                                                'token '
+                                                                                                                                                'modeling '
+                                                                                                                                                'with '
+                                                                                                                                                'conditioning.html#sadelartransformer.convert_for_eval',
+                                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.device': ( '4b. '
+                                                                                                                                      'multi-language '
+                                                                                                                                      'semantic '
+                                                                                                                                      'to '
+                                                                                                                                      'acoustic '
+                                                                                                                                      'token '
+                                                                                                                                      'modeling '
+                                                                                                                                      'with '
+                                                                                                                                      'conditioning.html#sadelartransformer.device',
+                                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.embed_stoks': ( '4b. '
+                                                                                                                                           'multi-language '
+                                                                                                                                           'semantic '
+                                                                                                                                           'to '
+                                                                                                                                           'acoustic '
+                                                                                                                                           'token '
+                                                                                                                                           'modeling '
+                                                                                                                                           'with '
+                                                                                                                                           'conditioning.html#sadelartransformer.embed_stoks',
+                                                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.encode': ( '4b. '
+                                                                                                                                      'multi-language '
+                                                                                                                                      'semantic '
+                                                                                                                                      'to '
+                                                                                                                                      'acoustic '
+                                                                                                                                      'token '
+                                                                                                                                      'modeling '
+                                                                                                                                      'with '
+                                                                                                                                      'conditioning.html#sadelartransformer.encode',
+                                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.forward': ( '4b. '
+                                                                                                                                       'multi-language '
+                                                                                                                                       'semantic '
+                                                                                                                                       'to '
+                                                                                                                                       'acoustic '
+                                                                                                                                       'token '
+                                                                                                                                       'modeling '
+                                                                                                                                       'with '
+                                                                                                                                       'conditioning.html#sadelartransformer.forward',
+                                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate': ( '4b. '
+                                                                                                                                        'multi-language '
+                                                                                                                                        'semantic '
+                                                                                                                                        'to '
+                                                                                                                                        'acoustic '
+                                                                                                                                        'token '
+                                                                                                                                        'modeling '
+                                                                                                                                        'with '
+                                                                                                                                        'conditioning.html#sadelartransformer.generate',
+                                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_batch': ( '4b. '
+                                                                                                                                              'multi-language '
+                                                                                                                                              'semantic '
+                                                                                                                                              'to '
+                                                                                                                                              'acoustic '
+                                                                                                                                              'token '
+                                                                                                                                              'modeling '
+                                                                                                                                              'with '
+                                                                                                                                              'conditioning.html#sadelartransformer.generate_batch',
+                                                                                                                                              'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_long': ( '4b. '
+                                                                                                                                             'multi-language '
+                                                                                                                                             'semantic '
+                                                                                                                                             'to '
+                                                                                                                                             'acoustic '
+                                                                                                                                             'token '
+                                                                                                                                             'modeling '
+                                                                                                                                             'with '
+                                                                                                                                             'conditioning.html#sadelartransformer.generate_long',
+                                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_next': ( '4b. '
+                                                                                                                                             'multi-language '
+                                                                                                                                             'semantic '
+                                                                                                                                             'to '
+                                                                                                                                             'acoustic '
+                                                                                                                                             'token '
+                                                                                                                                             'modeling '
+                                                                                                                                             'with '
+                                                                                                                                             'conditioning.html#sadelartransformer.generate_next',
+                                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_one': ( '4b. '
+                                                                                                                                            'multi-language '
+                                                                                                                                            'semantic '
+                                                                                                                                            'to '
+                                                                                                                                            'acoustic '
+                                                                                                                                            'token '
+                                                                                                                                            'modeling '
+                                                                                                                                            'with '
+                                                                                                                                            'conditioning.html#sadelartransformer.generate_one',
+                                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_speculative': ( '4b. '
+                                                                                                                                                    'multi-language '
+                                                                                                                                                    'semantic '
+                                                                                                                                                    'to '
+                                                                                                                                                    'acoustic '
+                                                                                                                                                    'token '
+                                                                                                                                                    'modeling '
+                                                                                                                                                    'with '
+                                                                                                                                                    'conditioning.html#sadelartransformer.generate_speculative',
+                                                                                                                                                    'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.generate_stream': ( '4b. '
+                                                                                                                                               'multi-language '
+                                                                                                                                               'semantic '
+                                                                                                                                               'to '
+                                                                                                                                               'acoustic '
+                                                                                                                                               'token '
+                                                                                                                                               'modeling '
+                                                                                                                                               'with '
+                                                                                                                                               'conditioning.html#sadelartransformer.generate_stream',
+                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.get_extra_state': ( '4b. '
+                                                                                                                                               'multi-language '
+                                                                                                                                               'semantic '
+                                                                                                                                               'to '
+                                                                                                                                               'acoustic '
+                                                                                                                                               'token '
+                                                                                                                                               'modeling '
+                                                                                                                                               'with '
+                                                                                                                                               'conditioning.html#sadelartransformer.get_extra_state',
+                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.get_metrics': ( '4b. '
+                                                                                                                                           'multi-language '
+                                                                                                                                           'semantic '
+                                                                                                                                           'to '
+                                                                                                                                           'acoustic '
+                                                                                                                                           'token '
+                                                                                                                                           'modeling '
+                                                                                                                                           'with '
+                                                                                                                                           'conditioning.html#sadelartransformer.get_metrics',
+                                                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.init_transformer': ( '4b. '
+                                                                                                                                                'multi-language '
+                                                                                                                                                'semantic '
+                                                                                                                                                'to '
+                                                                                                                                                'acoustic '
+                                                                                                                                                'token '
+                                                                                                                                                'modeling '
+                                                                                                                                                'with '
+                                                                                                                                                'conditioning.html#sadelartransformer.init_transformer',
+                                                                                                                                                'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.load_checkpoint': ( '4b. '
+                                                                                                                                               'multi-language '
+                                                                                                                                               'semantic '
+                                                                                                                                               'to '
+                                                                                                                                               'acoustic '
+                                                                                                                                               'token '
+                                                                                                                                               'modeling '
+                                                                                                                                               'with '
+                                                                                                                                               'conditioning.html#sadelartransformer.load_checkpoint',
+                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.load_frozen_acoustic_embeddings': ( '4b. '
+                                                                                                                                                               'multi-language '
+                                                                                                                                                               'semantic '
+                                                                                                                                                               'to '
+                                                                                                                                                               'acoustic '
+                                                                                                                                                               'token '
+                                                                                                                                                               'modeling '
+                                                                                                                                                               'with '
+                                                                                                                                                               'conditioning.html#sadelartransformer.load_frozen_acoustic_embeddings',
+                                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.load_frozen_semantic_embeddings': ( '4b. '
+                                                                                                                                                               'multi-language '
+                                                                                                                                                               'semantic '
+                                                                                                                                                               'to '
+                                                                                                                                                               'acoustic '
+                                                                                                                                                               'token '
+                                                                                                                                                               'modeling '
+                                                                                                                                                               'with '
+                                                                                                                                                               'conditioning.html#sadelartransformer.load_frozen_semantic_embeddings',
+                                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.load_model': ( '4b. '
+                                                                                                                                          'multi-language '
+                                                                                                                                          'semantic '
+                                                                                                                                          'to '
+                                                                                                                                          'acoustic '
+                                                                                                                                          'token '
+                                                                                                                                          'modeling '
+                                                                                                                                          'with '
+                                                                                                                                          'conditioning.html#sadelartransformer.load_model',
+                                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.optimize': ( '4b. '
+                                                                                                                                        'multi-language '
+                                                                                                                                        'semantic '
+                                                                                                                                        'to '
+                                                                                                                                        'acoustic '
+                                                                                                                                        'token '
+                                                                                                                                        'modeling '
+                                                                                                                                        'with '
+                                                                                                                                        'conditioning.html#sadelartransformer.optimize',
+                                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.optimize_training': ( '4b. '
+                                                                                                                                                 'multi-language '
+                                                                                                                                                 'semantic '
+                                                                                                                                                 'to '
+                                                                                                                                                 'acoustic '
+                                                                                                                                                 'token '
+                                                                                                                                                 'modeling '
+                                                                                                                                                 'with '
+                                                                                                                                                 'conditioning.html#sadelartransformer.optimize_training',
+                                                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.prefill': ( '4b. '
+                                                                                                                                       'multi-language '
+                                                                                                                                       'semantic '
+                                                                                                                                       'to '
+                                                                                                                                       'acoustic '
+                                                                                                                                       'token '
+                                                                                                                                       'modeling '
+                                                                                                                                       'with '
+                                                                                                                                       'conditioning.html#sadelartransformer.prefill',
+                                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.prep_stoks': ( '4b. '
+                                                                                                                                          'multi-language '
+                                                                                                                                          'semantic '
+                                                                                                                                          'to '
+                                                                                                                                          'acoustic '
+                                                                                                                                          'token '
+                                                                                                                                          'modeling '
+                                                                                                                                          'with '
+                                                                                                                                          'conditioning.html#sadelartransformer.prep_stoks',
+                                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.quantize': ( '4b. '
+                                                                                                                                        'multi-language '
+                                                                                                                                        'semantic '
+                                                                                                                                        'to '
+                                                                                                                                        'acoustic '
+                                                                                                                                        'token '
+                                                                                                                                        'modeling '
+                                                                                                                                        'with '
+                                                                                                                                        'conditioning.html#sadelartransformer.quantize',
+                                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.run_encoder': ( '4b. '
+                                                                                                                                           'multi-language '
+                                                                                                                                           'semantic '
+                                                                                                                                           'to '
+                                                                                                                                           'acoustic '
+                                                                                                                                           'token '
+                                                                                                                                           'modeling '
+                                                                                                                                           'with '
+                                                                                                                                           'conditioning.html#sadelartransformer.run_encoder',
+                                                                                                                                           'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.save_model': ( '4b. '
+                                                                                                                                          'multi-language '
+                                                                                                                                          'semantic '
+                                                                                                                                          'to '
+                                                                                                                                          'acoustic '
+                                                                                                                                          'token '
+                                                                                                                                          'modeling '
+                                                                                                                                          'with '
+                                                                                                                                          'conditioning.html#sadelartransformer.save_model',
+                                                                                                                                          'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.set_extra_state': ( '4b. '
+                                                                                                                                               'multi-language '
+                                                                                                                                               'semantic '
+                                                                                                                                               'to '
+                                                                                                                                               'acoustic '
+                                                                                                                                               'token '
+                                                                                                                                               'modeling '
+                                                                                                                                               'with '
+                                                                                                                                               'conditioning.html#sadelartransformer.set_extra_state',
+                                                                                                                                               'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.setup': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling '
+                                                                                                                                     'with '
+                                                                                                                                     'conditioning.html#sadelartransformer.setup',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.stoks_length': ( '4b. '
+                                                                                                                                            'multi-language '
+                                                                                                                                            'semantic '
+                                                                                                                                            'to '
+                                                                                                                                            'acoustic '
+                                                                                                                                            'token '
+                                                                                                                                            'modeling '
+                                                                                                                                            'with '
+                                                                                                                                            'conditioning.html#sadelartransformer.stoks_length',
+                                                                                                                                            'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.switch_dtypes': ( '4b. '
+                                                                                                                                             'multi-language '
+                                                                                                                                             'semantic '
+                                                                                                                                             'to '
+                                                                                                                                             'acoustic '
+                                                                                                                                             'token '
+                                                                                                                                             'modeling '
+                                                                                                                                             'with '
+                                                                                                                                             'conditioning.html#sadelartransformer.switch_dtypes',
+                                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SADelARTransformer.undelay': ( '4b. '
+                                                                                                                                       'multi-language '
+                                                                                                                                       'semantic '
+                                                                                                                                       'to '
+                                                                                                                                       'acoustic '
+                                                                                                                                       'token '
+                                                                                                                                       'modeling '
+                                                                                                                                       'with '
+                                                                                                                                       'conditioning.html#sadelartransformer.undelay',
+                                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SpeakerEmbedding': ( '4b. '
+                                                                                                                             'multi-language '
+                                                                                                                             'semantic to '
+                                                                                                                             'acoustic '
+                                                                                                                             'token '
+                                                                                                                             'modeling '
+                                                                                                                             'with '
+                                                                                                                             'conditioning.html#speakerembedding',
+                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SpeakerEmbedding.__init__': ( '4b. '
+                                                                                                                                      'multi-language '
+                                                                                                                                      'semantic '
+                                                                                                                                      'to '
+                                                                                                                                      'acoustic '
+                                                                                                                                      'token '
+                                                                                                                                      'modeling '
+                                                                                                                                      'with '
+                                                                                                                                      'conditioning.html#speakerembedding.__init__',
+                                                                                                                                      'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.SpeakerEmbedding.forward': ( '4b. '
+                                                                                                                                     'multi-language '
+                                                                                                                                     'semantic '
+                                                                                                                                     'to '
+                                                                                                                                     'acoustic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling '
+                                                                                                                                     'with '
+                                                                                                                                     'conditioning.html#speakerembedding.forward',
+                                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.Tunables': ( '4b. multi-language '
+                                                                                                                     'semantic to acoustic '
+                                                                                                                     'token modeling with '
+                                                                                                                     'conditioning.html#tunables',
+                                                                                                                     'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.Tunables.__post_init__': ( '4b. '
+                                                                                                                                   'multi-language '
+                                                                                                                                   'semantic '
+                                                                                                                                   'to '
+                                                                                                                                   'acoustic '
+                                                                                                                                   'token '
+                                                                                                                                   'modeling '
+                                                                                                                                   'with '
+                                                                                                                                   'conditioning.html#tunables.__post_init__',
+                                                                                                                                   'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.Tunables.upgrade': ( '4b. '
+                                                                                                                             'multi-language '
+                                                                                                                             'semantic to '
+                                                                                                                             'acoustic '
+                                                                                                                             'token '
+                                                                                                                             'modeling '
+                                                                                                                             'with '
+                                                                                                                             'conditioning.html#tunables.upgrade',
+                                                                                                                             'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond._make_model': ( '4b. '
+                                                                                                                        'multi-language '
+                                                                                                                        'semantic to '
+                                                                                                                        'acoustic token '
+                                                                                                                        'modeling with '
+                                                                                                                        'conditioning.html#_make_model',
+                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.load_dataset': ( '4b. '
+                                                                                                                         'multi-language '
+                                                                                                                         'semantic to '
+                                                                                                                         'acoustic token '
+                                                                                                                         'modeling with '
+                                                                                                                         'conditioning.html#load_dataset',
+                                                                                                                         'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.load_model': ( '4b. multi-language '
+                                                                                                                       'semantic to '
+                                                                                                                       'acoustic token '
+                                                                                                                       'modeling with '
+                                                                                                                       'conditioning.html#load_model',
+                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.logrand': ( '4b. multi-language '
+                                                                                                                    'semantic to acoustic '
+                                                                                                                    'token modeling with '
+                                                                                                                    'conditioning.html#logrand',
+                                                                                                                    'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.make_model': ( '4b. multi-language '
+                                                                                                                       'semantic to '
+                                                                                                                       'acoustic token '
+                                                                                                                       'modeling with '
+                                                                                                                       'conditioning.html#make_model',
+                                                                                                                       'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.pad_samples': ( '4b. '
+                                                                                                                        'multi-language '
+                                                                                                                        'semantic to '
+                                                                                                                        'acoustic token '
+                                                                                                                        'modeling with '
+                                                                                                                        'conditioning.html#pad_samples',
+                                                                                                                        'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.rand': ( '4b. multi-language '
+                                                                                                                 'semantic to acoustic '
+                                                                                                                 'token modeling with '
+                                                                                                                 'conditioning.html#rand',
+                                                                                                                 'whisperspeech/s2a_delar_mup_wds_mlang_cond.py'),
+                                                            'whisperspeech.s2a_delar_mup_wds_mlang_cond.random_trunc': ( '4b. '
+                                                                                                                         'multi-language '
+                                                                                                                         'semantic to '
+                                                                                                                         'acoustic token '
+                                                                                                                         'modeling with '
+                                                                                                                         'conditioning.html#random_trunc',
+                                                                                                                         'whisperspeech/s2a_delar_mup_wds_mlang_cond.py')},
+            'whisperspeech.server': { 'whisperspeech.server.SynthesisProcessPool': ( '7c. synthesis server.html#synthesisprocesspool',
+                                                                                     'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.__init__': ( '7c. synthesis '
+                                                                                              'server.html#synthesisprocesspool.__init__',
+                                                                                              'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.collect': ( '7c. synthesis '
+                                                                                             'server.html#synthesisprocesspool.collect',
+                                                                                             'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.start': ( '7c. synthesis '
+                                                                                           'server.html#synthesisprocesspool.start',
+                                                                                           'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.stats': ( '7c. synthesis '
+                                                                                           'server.html#synthesisprocesspool.stats',
+                                                                                           'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.stop': ( '7c. synthesis '
+                                                                                          'server.html#synthesisprocesspool.stop',
+                                                                                          'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisProcessPool.submit': ( '7c. synthesis '
+                                                                                            'server.html#synthesisprocesspool.submit',
+                                                                                            'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisRequest': ( '7c. synthesis server.html#synthesisrequest',
+                                                                                 'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker': ( '7c. synthesis server.html#synthesisworker',
+                                                                                'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.__init__': ( '7c. synthesis '
+                                                                                         'server.html#synthesisworker.__init__',
+                                                                                         'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.generate': ( '7c. synthesis '
+                                                                                         'server.html#synthesisworker.generate',
+                                                                                         'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.next_batch': ( '7c. synthesis '
+                                                                                           'server.html#synthesisworker.next_batch',
+                                                                                           'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.run': ( '7c. synthesis server.html#synthesisworker.run',
+                                                                                    'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.run_batch': ( '7c. synthesis '
+                                                                                          'server.html#synthesisworker.run_batch',
+                                                                                          'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.run_stream': ( '7c. synthesis '
+                                                                                           'server.html#synthesisworker.run_stream',
+                                                                                           'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.start': ( '7c. synthesis server.html#synthesisworker.start',
+                                                                                      'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.stats': ( '7c. synthesis server.html#synthesisworker.stats',
+                                                                                      'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.stop': ( '7c. synthesis server.html#synthesisworker.stop',
+                                                                                     'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.stream': ( '7c. synthesis server.html#synthesisworker.stream',
+                                                                                       'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.submit': ( '7c. synthesis server.html#synthesisworker.submit',
+                                                                                       'whisperspeech/server.py'),
+                                      'whisperspeech.server.SynthesisWorker.synthesize': ( '7c. synthesis '
+                                                                                           'server.html#synthesisworker.synthesize',
+                                                                                           'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox': ( '7c. synthesis server.html#_workerinbox',
+                                                                             'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox.__init__': ( '7c. synthesis server.html#_workerinbox.__init__',
+                                                                                      'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox.get': ( '7c. synthesis server.html#_workerinbox.get',
+                                                                                 'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox.put': ( '7c. synthesis server.html#_workerinbox.put',
+                                                                                 'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox.qsize': ( '7c. synthesis server.html#_workerinbox.qsize',
+                                                                                   'whisperspeech/server.py'),
+                                      'whisperspeech.server._WorkerInbox.result': ( '7c. synthesis server.html#_workerinbox.result',
+                                                                                    'whisperspeech/server.py'),
+                                      'whisperspeech.server._pool_worker': ( '7c. synthesis server.html#_pool_worker',
+                                                                             'whisperspeech/server.py'),
+                                      'whisperspeech.server.encode_audio': ( '7c. synthesis server.html#encode_audio',
+                                                                             'whisperspeech/server.py'),
+                                      'whisperspeech.server.main': ('7c. synthesis server.html#main', 'whisperspeech/server.py'),
+                                      'whisperspeech.server.make_app': ('7c. synthesis server.html#make_app', 'whisperspeech/server.py'),
+                                      'whisperspeech.server.parse_request': ( '7c. synthesis server.html#parse_request',
+                                                                              'whisperspeech/server.py'),
+                                      'whisperspeech.server.to_pcm16': ('7c. synthesis server.html#to_pcm16', 'whisperspeech/server.py')},
+            'whisperspeech.split_out_val_datasets': { 'whisperspeech.split_out_val_datasets.split_dataset': ( '3d. split out '
+                                                                                                              'validation.html#split_dataset',
+                                                                                                              'whisperspeech/split_out_val_datasets.py')},
+            'whisperspeech.t2s_up_wds_mlang_enclm': { 'whisperspeech.t2s_up_wds_mlang_enclm.CharTokenizer': ( '5b. multi-lang text to '
+                                                                                                              'semantic token '
+                                                                                                              'modeling.html#chartokenizer',
+                                                                                                              'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.CharTokenizer.decode': ( '5b. multi-lang text '
+                                                                                                                     'to semantic token '
+                                                                                                                     'modeling.html#chartokenizer.decode',
+                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.CharTokenizer.encode': ( '5b. multi-lang text '
+                                                                                                                     'to semantic token '
+                                                                                                                     'modeling.html#chartokenizer.encode',
+                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Encoder': ( '5b. multi-lang text to semantic '
+                                                                                                        'token modeling.html#encoder',
+                                                                                                        'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Encoder.__init__': ( '5b. multi-lang text to '
+                                                                                                                 'semantic token '
+                                                                                                                 'modeling.html#encoder.__init__',
+                                                                                                                 'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Encoder.forward': ( '5b. multi-lang text to '
+                                                                                                                'semantic token '
+                                                                                                                'modeling.html#encoder.forward',
+                                                                                                                'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.T2SEmbedding': ( '5b. multi-lang text to '
+                                                                                                             'semantic token '
+                                                                                                             'modeling.html#t2sembedding',
+                                                                                                             'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.T2SEmbedding.__init__': ( '5b. multi-lang text '
+                                                                                                                      'to semantic token '
+                                                                                                                      'modeling.html#t2sembedding.__init__',
+                                                                                                                      'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.T2SEmbedding.forward': ( '5b. multi-lang text '
+                                                                                                                     'to semantic token '
+                                                                                                                     'modeling.html#t2sembedding.forward',
+                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer': ( '5b. multi-lang text to '
+                                                                                                                'semantic token '
+                                                                                                                'modeling.html#tsartransformer',
+                                                                                                                'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.__init__': ( '5b. multi-lang '
+                                                                                                                         'text to semantic '
+                                                                                                                         'token '
+                                                                                                                         'modeling.html#tsartransformer.__init__',
+                                                                                                                         'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer._embed_cps': ( '5b. multi-lang '
+                                                                                                                           'text to '
+                                                                                                                           'semantic token '
+                                                                                                                           'modeling.html#tsartransformer._embed_cps',
+                                                                                                                           'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.convert_for_eval': ( '5b. '
+                                                                                                                                 'multi-lang '
+                                                                                                                                 'text to '
+                                                                                                                                 'semantic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#tsartransformer.convert_for_eval',
+                                                                                                                                 'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.device': ( '5b. multi-lang '
+                                                                                                                       'text to semantic '
+                                                                                                                       'token '
+                                                                                                                       'modeling.html#tsartransformer.device',
+                                                                                                                       'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.enable_encoder_cache': ( '5b. '
+                                                                                                                                     'multi-lang '
+                                                                                                                                     'text '
+                                                                                                                                     'to '
+                                                                                                                                     'semantic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#tsartransformer.enable_encoder_cache',
+                                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.encode_text': ( '5b. '
+                                                                                                                            'multi-lang '
+                                                                                                                            'text to '
+                                                                                                                            'semantic '
+                                                                                                                            'token '
+                                                                                                                            'modeling.html#tsartransformer.encode_text',
+                                                                                                                            'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.ensure_tokenizer': ( '5b. '
+                                                                                                                                 'multi-lang '
+                                                                                                                                 'text to '
+                                                                                                                                 'semantic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#tsartransformer.ensure_tokenizer',
+                                                                                                                                 'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.forward': ( '5b. multi-lang '
+                                                                                                                        'text to semantic '
+                                                                                                                        'token '
+                                                                                                                        'modeling.html#tsartransformer.forward',
+                                                                                                                        'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate': ( '5b. multi-lang '
+                                                                                                                         'text to semantic '
+                                                                                                                         'token '
+                                                                                                                         'modeling.html#tsartransformer.generate',
+                                                                                                                         'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate_batch': ( '5b. '
+                                                                                                                               'multi-lang '
+                                                                                                                               'text to '
+                                                                                                                               'semantic '
+                                                                                                                               'token '
+                                                                                                                               'modeling.html#tsartransformer.generate_batch',
+                                                                                                                               'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate_next': ( '5b. '
+                                                                                                                              'multi-lang '
+                                                                                                                              'text to '
+                                                                                                                              'semantic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#tsartransformer.generate_next',
+                                                                                                                              'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate_one': ( '5b. '
+                                                                                                                             'multi-lang '
+                                                                                                                             'text to '
+                                                                                                                             'semantic '
+                                                                                                                             'token '
+                                                                                                                             'modeling.html#tsartransformer.generate_one',
+                                                                                                                             'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate_speculative': ( '5b. '
+                                                                                                                                     'multi-lang '
+                                                                                                                                     'text '
+                                                                                                                                     'to '
+                                                                                                                                     'semantic '
+                                                                                                                                     'token '
+                                                                                                                                     'modeling.html#tsartransformer.generate_speculative',
+                                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.generate_stream': ( '5b. '
+                                                                                                                                'multi-lang '
+                                                                                                                                'text to '
+                                                                                                                                'semantic '
+                                                                                                                                'token '
+                                                                                                                                'modeling.html#tsartransformer.generate_stream',
+                                                                                                                                'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.init_transformer': ( '5b. '
+                                                                                                                                 'multi-lang '
+                                                                                                                                 'text to '
+                                                                                                                                 'semantic '
+                                                                                                                                 'token '
+                                                                                                                                 'modeling.html#tsartransformer.init_transformer',
+                                                                                                                                 'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.load_checkpoint': ( '5b. '
+                                                                                                                                'multi-lang '
+                                                                                                                                'text to '
+                                                                                                                                'semantic '
+                                                                                                                                'token '
+                                                                                                                                'modeling.html#tsartransformer.load_checkpoint',
+                                                                                                                                'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.load_frozen_semantic_embeddings': ( '5b. '
+                                                                                                                                                'multi-lang '
+                                                                                                                                                'text '
+                                                                                                                                                'to '
+                                                                                                                                                'semantic '
+                                                                                                                                                'token '
+                                                                                                                                                'modeling.html#tsartransformer.load_frozen_semantic_embeddings',
+                                                                                                                                                'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.load_model': ( '5b. multi-lang '
+                                                                                                                           'text to '
+                                                                                                                           'semantic token '
+                                                                                                                           'modeling.html#tsartransformer.load_model',
+                                                                                                                           'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.optimize': ( '5b. multi-lang '
+                                                                                                                         'text to semantic '
+                                                                                                                         'token '
+                                                                                                                         'modeling.html#tsartransformer.optimize',
+                                                                                                                         'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.optimize_training': ( '5b. '
+                                                                                                                                  'multi-lang '
+                                                                                                                                  'text to '
+                                                                                                                                  'semantic '
+                                                                                                                                  'token '
+                                                                                                                                  'modeling.html#tsartransformer.optimize_training',
+                                                                                                                                  'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.prep': ( '5b. multi-lang text '
+                                                                                                                     'to semantic token '
+                                                                                                                     'modeling.html#tsartransformer.prep',
+                                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.prep_text': ( '5b. multi-lang '
+                                                                                                                          'text to '
+                                                                                                                          'semantic token '
+                                                                                                                          'modeling.html#tsartransformer.prep_text',
+                                                                                                                          'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.quantize': ( '5b. multi-lang '
+                                                                                                                         'text to semantic '
+                                                                                                                         'token '
+                                                                                                                         'modeling.html#tsartransformer.quantize',
+                                                                                                                         'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.run_encoder': ( '5b. '
+                                                                                                                            'multi-lang '
+                                                                                                                            'text to '
+                                                                                                                            'semantic '
+                                                                                                                            'token '
+                                                                                                                            'modeling.html#tsartransformer.run_encoder',
+                                                                                                                            'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.save_model': ( '5b. multi-lang '
+                                                                                                                           'text to '
+                                                                                                                           'semantic token '
+                                                                                                                           'modeling.html#tsartransformer.save_model',
+                                                                                                                           'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.setup': ( '5b. multi-lang text '
+                                                                                                                      'to semantic token '
+                                                                                                                      'modeling.html#tsartransformer.setup',
+                                                                                                                      'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.TSARTransformer.switch_dtypes': ( '5b. '
+                                                                                                                              'multi-lang '
+                                                                                                                              'text to '
+                                                                                                                              'semantic '
+                                                                                                                              'token '
+                                                                                                                              'modeling.html#tsartransformer.switch_dtypes',
+                                                                                                                              'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Tunables': ( '5b. multi-lang text to semantic '
+                                                                                                         'token modeling.html#tunables',
+                                                                                                         'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Tunables.__post_init__': ( '5b. multi-lang '
+                                                                                                                       'text to semantic '
+                                                                                                                       'token '
+                                                                                                                       'modeling.html#tunables.__post_init__',
+                                                                                                                       'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.Tunables.upgrade': ( '5b. multi-lang text to '
+                                                                                                                 'semantic token '
+                                                                                                                 'modeling.html#tunables.upgrade',
+                                                                                                                 'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm._make_model': ( '5b. multi-lang text to '
+                                                                                                            'semantic token '
+                                                                                                            'modeling.html#_make_model',
+                                                                                                            'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.ar_padder': ( '5b. multi-lang text to semantic '
+                                                                                                          'token modeling.html#ar_padder',
+                                                                                                          'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.char_per_seconder': ( '5b. multi-lang text to '
+                                                                                                                  'semantic token '
+                                                                                                                  'modeling.html#char_per_seconder',
+                                                                                                                  'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.load_dataset': ( '5b. multi-lang text to '
+                                                                                                             'semantic token '
+                                                                                                             'modeling.html#load_dataset',
+                                                                                                             'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.make_model': ( '5b. multi-lang text to '
+                                                                                                           'semantic token '
+                                                                                                           'modeling.html#make_model',
+                                                                                                           'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.rand': ( '5b. multi-lang text to semantic '
+                                                                                                     'token modeling.html#rand',
+                                                                                                     'whisperspeech/t2s_up_wds_mlang_enclm.py'),
+                                                      'whisperspeech.t2s_up_wds_mlang_enclm.tokenizer': ( '5b. multi-lang text to semantic '
+                                                                                                          'token modeling.html#tokenizer',
+                                                                                                          'whisperspeech/t2s_up_wds_mlang_enclm.py')},
+            'whisperspeech.testing': {'whisperspeech.testing.test_model': ('c2. testing.html#test_model', 'whisperspeech/testing.py')},
+            'whisperspeech.train': { 'whisperspeech.train.SimpleVisual': ('b1. training.html#simplevisual', 'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.__init__': ( 'b1. training.html#simplevisual.__init__',
+                                                                                    'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.add_data': ( 'b1. training.html#simplevisual.add_data',
+                                                                                    'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.add_table_row': ( 'b1. training.html#simplevisual.add_table_row',
+                                                                                         'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.hide': ( 'b1. training.html#simplevisual.hide',
+                                                                                'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.on_iter': ( 'b1. training.html#simplevisual.on_iter',
+                                                                                   'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.plot': ( 'b1. training.html#simplevisual.plot',
+                                                                                'whisperspeech/train.py'),
+                                     'whisperspeech.train.SimpleVisual.show': ( 'b1. training.html#simplevisual.show',
+                                                                                'whisperspeech/train.py'),
+                                     'whisperspeech.train.train': ('b1. training.html#train', 'whisperspeech/train.py'),
+                                     'whisperspeech.train.validate': ('b1. training.html#validate', 'whisperspeech/train.py')},
+            'whisperspeech.train_multi': { 'whisperspeech.train_multi.TrainingTask': ( 'b2. training (lightning).html#trainingtask',
+                                                                                       'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.__init__': ( 'b2. training '
+                                                                                                '(lightning).html#trainingtask.__init__',
+                                                                                                'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.configure_optimizers': ( 'b2. training '
+                                                                                                            '(lightning).html#trainingtask.configure_optimizers',
+                                                                                                            'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.on_fit_start': ( 'b2. training '
+                                                                                                    '(lightning).html#trainingtask.on_fit_start',
+                                                                                                    'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.on_validation_epoch_end': ( 'b2. training '
+                                                                                                               '(lightning).html#trainingtask.on_validation_epoch_end',
+                                                                                                               'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.test_step': ( 'b2. training '
+                                                                                                 '(lightning).html#trainingtask.test_step',
+                                                                                                 'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.training_step': ( 'b2. training '
+                                                                                                     '(lightning).html#trainingtask.training_step',
+                                                                                                     'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.TrainingTask.validation_step': ( 'b2. training '
+                                                                                                       '(lightning).html#trainingtask.validation_step',
+                                                                                                       'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.parse_and_call': ( 'b2. training (lightning).html#parse_and_call',
+                                                                                         'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.parse_dataset_string': ( 'b2. training '
+                                                                                               '(lightning).html#parse_dataset_string',
+                                                                                               'whisperspeech/train_multi.py'),
+                                           'whisperspeech.train_multi.simplify_folder_names': ( 'b2. training '
+                                                                                                '(lightning).html#simplify_folder_names',
+                                                                                                'whisperspeech/train_multi.py')},
+            'whisperspeech.utils': { 'whisperspeech.utils.AtomicTarWriter': ( 'd. common dataset utilities.html#atomictarwriter',
+                                                                              'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.derived_dataset': ( 'd. common dataset utilities.html#derived_dataset',
+                                                                              'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.derived_name': ( 'd. common dataset utilities.html#derived_name',
+                                                                           'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.find_audio': ( 'd. common dataset utilities.html#find_audio',
+                                                                         'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.join_datasets': ( 'd. common dataset utilities.html#join_datasets',
+                                                                            'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.join_datasets.__init__': ( 'd. common dataset '
+                                                                                     'utilities.html#join_datasets.__init__',
+                                                                                     'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.join_datasets.__iter__': ( 'd. common dataset '
+                                                                                     'utilities.html#join_datasets.__iter__',
+                                                                                     'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.join_datasets.__len__': ( 'd. common dataset '
+                                                                                    'utilities.html#join_datasets.__len__',
+                                                                                    'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.merge_in': ( 'd. common dataset utilities.html#merge_in',
+                                                                       'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.new_parse_si': ( 'd. common dataset utilities.html#new_parse_si',
+                                                                           'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.readlines': ( 'd. common dataset utilities.html#readlines',
+                                                                        'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.resampler': ( 'd. common dataset utilities.html#resampler',
+                                                                        'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.shard_glob': ( 'd. common dataset utilities.html#shard_glob',
+                                                                         'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.split_to_chunks': ( 'd. common dataset utilities.html#split_to_chunks',
+                                                                              'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.torch_audio_opus': ( 'd. common dataset utilities.html#torch_audio_opus',
+                                                                               'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.vad_dataset': ( 'd. common dataset utilities.html#vad_dataset',
+                                                                          'whisperspeech/utils.py'),
+                                     'whisperspeech.utils.wrap_downloader': ( 'd. common dataset utilities.html#wrap_downloader',
+                                                                              'whisperspeech/utils.py')},
+            'whisperspeech.vad': { 'whisperspeech.vad.extract_segments': ( '1b. voice activity detection.html#extract_segments',
+                                                                           'whisperspeech/vad.py'),
+                                   'whisperspeech.vad.normalize_loudness': ( '1b. voice activity detection.html#normalize_loudness',
+                                                                             'whisperspeech/vad.py'),
+                                   'whisperspeech.vad.process_shard': ( '1b. voice activity detection.html#process_shard',
+                                                                        'whisperspeech/vad.py'),
+                                   'whisperspeech.vad.segment_audio': ( '1b. voice activity detection.html#segment_audio',
+                                                                        'whisperspeech/vad.py')},
+            'whisperspeech.vad_merge': { 'whisperspeech.vad_merge.chunk_merger': ( '1c. vad merging.html#chunk_merger',
+                                                                                   'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.chunked_audio_dataset': ( '1c. vad merging.html#chunked_audio_dataset',
+                                                                                            'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.filter_bad_samples': ( '1c. vad merging.html#filter_bad_samples',
+                                                                                         'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.find_vad_kind': ( '1c. vad merging.html#find_vad_kind',
+                                                                                    'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.merge_by_src_key': ( '1c. vad merging.html#merge_by_src_key',
+                                                                                       'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.prepare_mvad': ( '1c. vad merging.html#prepare_mvad',
+                                                                                   'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.random_cutter': ( '1c. vad merging.html#random_cutter',
+                                                                                    'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.random_cutter2': ( '1c. vad merging.html#random_cutter2',
+                                                                                     'whisperspeech/vad_merge.py'),
+                                         'whisperspeech.vad_merge.split': ('1c. vad merging.html#split', 'whisperspeech/vad_merge.py')},
+            'whisperspeech.vq_stoks': { 'whisperspeech.vq_stoks.RQBottleneckTransformer': ( '2b. whisper quantization (semantic token) '
+                                                                                            'model.html#rqbottlenecktransformer',
+                                                                                            'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.__init__': ( '2b. whisper quantization (semantic '
+                                                                                                     'token) '
+                                                                                                     'model.html#rqbottlenecktransformer.__init__',
+                                                                                                     'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.decode_text': ( '2b. whisper quantization '
+                                                                                                        '(semantic token) '
+                                                                                                        'model.html#rqbottlenecktransformer.decode_text',
+                                                                                                        'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.dequantize': ( '2b. whisper quantization (semantic '
+                                                                                                       'token) '
+                                                                                                       'model.html#rqbottlenecktransformer.dequantize',
+                                                                                                       'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.device': ( '2b. whisper quantization (semantic '
+                                                                                                   'token) '
+                                                                                                   'model.html#rqbottlenecktransformer.device',
+                                                                                                   'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.downsample_embeddings': ( '2b. whisper '
+                                                                                                                  'quantization (semantic '
+                                                                                                                  'token) '
+                                                                                                                  'model.html#rqbottlenecktransformer.downsample_embeddings',
+                                                                                                                  'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.encode_audio': ( '2b. whisper quantization '
+                                                                                                         '(semantic token) '
+                                                                                                         'model.html#rqbottlenecktransformer.encode_audio',
+                                                                                                         'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.encode_mel': ( '2b. whisper quantization (semantic '
+                                                                                                       'token) '
+                                                                                                       'model.html#rqbottlenecktransformer.encode_mel',
+                                                                                                       'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.ensure_whisper': ( '2b. whisper quantization '
+                                                                                                           '(semantic token) '
+                                                                                                           'model.html#rqbottlenecktransformer.ensure_whisper',
+                                                                                                           'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.extract_teacher': ( '2b. whisper quantization '
+                                                                                                            '(semantic token) '
+                                                                                                            'model.html#rqbottlenecktransformer.extract_teacher',
+                                                                                                            'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.forward': ( '2b. whisper quantization (semantic '
+                                                                                                    'token) '
+                                                                                                    'model.html#rqbottlenecktransformer.forward',
+                                                                                                    'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.get_metrics': ( '2b. whisper quantization '
+                                                                                                        '(semantic token) '
+                                                                                                        'model.html#rqbottlenecktransformer.get_metrics',
+                                                                                                        'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.init_transformer': ( '2b. whisper quantization '
+                                                                                                             '(semantic token) '
+                                                                                                             'model.html#rqbottlenecktransformer.init_transformer',
+                                                                                                             'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.load_checkpoint': ( '2b. whisper quantization '
+                                                                                                            '(semantic token) '
+                                                                                                            'model.html#rqbottlenecktransformer.load_checkpoint',
+                                                                                                            'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.load_model': ( '2b. whisper quantization (semantic '
+                                                                                                       'token) '
+                                                                                                       'model.html#rqbottlenecktransformer.load_model',
+                                                                                                       'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.log_mel_spectrogram': ( '2b. whisper quantization '
+                                                                                                                '(semantic token) '
+                                                                                                                'model.html#rqbottlenecktransformer.log_mel_spectrogram',
+                                                                                                                'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.out_blocks': ( '2b. whisper quantization (semantic '
+                                                                                                       'token) '
+                                                                                                       'model.html#rqbottlenecktransformer.out_blocks',
+                                                                                                       'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.quantize': ( '2b. whisper quantization (semantic '
+                                                                                                     'token) '
+                                                                                                     'model.html#rqbottlenecktransformer.quantize',
+                                                                                                     'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.save_model': ( '2b. whisper quantization (semantic '
+                                                                                                       'token) '
+                                                                                                       'model.html#rqbottlenecktransformer.save_model',
+                                                                                                       'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.RQBottleneckTransformer.setup': ( '2b. whisper quantization (semantic '
+                                                                                                  'token) '
+                                                                                                  'model.html#rqbottlenecktransformer.setup',
+                                                                                                  'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.Tunables': ( '2b. whisper quantization (semantic token) '
+                                                                             'model.html#tunables',
+                                                                             'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.Tunables.__post_init__': ( '2b. whisper quantization (semantic token) '
+                                                                                           'model.html#tunables.__post_init__',
+                                                                                           'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.Tunables.upgrade': ( '2b. whisper quantization (semantic token) '
+                                                                                     'model.html#tunables.upgrade',
+                                                                                     'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.add_masks': ( '2b. whisper quantization (semantic token) '
+                                                                              'model.html#add_masks',
+                                                                              'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.get_tokenizer': ( '2b. whisper quantization (semantic token) '
+                                                                                  'model.html#get_tokenizer',
+                                                                                  'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.load_dataset': ( '2b. whisper quantization (semantic token) '
+                                                                                 'model.html#load_dataset',
+                                                                                 'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.logrand': ( '2b. whisper quantization (semantic token) model.html#logrand',
+                                                                            'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.make_model': ( '2b. whisper quantization (semantic token) '
+                                                                               'model.html#make_model',
+                                                                               'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.rand': ( '2b. whisper quantization (semantic token) model.html#rand',
+                                                                         'whisperspeech/vq_stoks.py'),
+                                        'whisperspeech.vq_stoks.tokenize_text': ( '2b. whisper quantization (semantic token) '
+                                                                                  'model.html#tokenize_text',
+                                                                                  'whisperspeech/vq_stoks.py')},
+            'whisperspeech.wer_metrics': { 'whisperspeech.wer_metrics.DfBuilder': ( 'c. word error rate metrics.html#dfbuilder',
+                                                                                    'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.DfBuilder.__init__': ( 'c. word error rate '
+                                                                                             'metrics.html#dfbuilder.__init__',
+                                                                                             'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.DfBuilder.df': ( 'c. word error rate metrics.html#dfbuilder.df',
+                                                                                       'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.DfBuilder.push': ( 'c. word error rate metrics.html#dfbuilder.push',
+                                                                                         'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.WERStats': ( 'c. word error rate metrics.html#werstats',
+                                                                                   'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.WERStats.__init__': ( 'c. word error rate '
+                                                                                            'metrics.html#werstats.__init__',
+                                                                                            'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.WERStats.push_sample': ( 'c. word error rate '
+                                                                                               'metrics.html#werstats.push_sample',
+                                                                                               'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.librispeech_data': ( 'c. word error rate '
+                                                                                           'metrics.html#librispeech_data',
+                                                                                           'whisperspeech/wer_metrics.py'),
+                                           'whisperspeech.wer_metrics.whisper_normalize': ( 'c. word error rate '
+                                                                                            'metrics.html#whisper_normalize',
+                                                                                            'whisperspeech/wer_metrics.py')},
+            'whisperspeech.wh_transcribe': { 'whisperspeech.wh_transcribe.chunk_merger': ( '2a. whisper quantization dataset '
+                                                                                           'preparation.html#chunk_merger',
+                                                                                           'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.flac_to_txt_name': ( '2a. whisper quantization dataset '
+                                                                                               'preparation.html#flac_to_txt_name',
+                                                                                               'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.merge_in': ( '2a. whisper quantization dataset '
+                                                                                       'preparation.html#merge_in',
+                                                                                       'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.process_shard': ( '2a. whisper quantization dataset '
+                                                                                            'preparation.html#process_shard',
+                                                                                            'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.random_cutter': ( '2a. whisper quantization dataset '
+                                                                                            'preparation.html#random_cutter',
+                                                                                            'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.split_to_chunks': ( '2a. whisper quantization dataset '
+                                                                                              'preparation.html#split_to_chunks',
+                                                                                              'whisperspeech/wh_transcribe.py'),
+                                             'whisperspeech.wh_transcribe.wds_compose': ( '2a. whisper quantization dataset '
+                                                                                          'preparation.html#wds_compose',
+                                                                                          'whisperspeech/wh_transcribe.py')}}}
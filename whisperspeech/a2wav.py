@@ -4,10 +4,8 @@
 __all__ = ['Vocoder']
 
 # %% ../nbs/6. Quality-boosting vocoder.ipynb 1
-from vocos import Vocos
 from whisperspeech import inference
 import torch
-import torchaudio
 
 # %% ../nbs/6. Quality-boosting vocoder.ipynb 2
 class Vocoder:
@@ -15,6 +13,7 @@ class Vocoder:
         if device is None: device = inference.get_compute_device()
         if device == 'mps': device = 'cpu' # mps does not currently work with vocos, thus only cuda or cpu
         self.device = device
+        from vocos import Vocos
         self.vocos = Vocos.from_pretrained(repo_id).to(device)
 
     def is_notebook(self):
@@ -37,8 +36,53 @@ class Vocoder:
         features = self.vocos.codes_to_features(atoks)
         bandwidth_id = torch.tensor({2: 0, 4: 1, 8: 2}[q]).to(self.device)  # Move tensor to the same device as model
         return self.vocos.decode(features, bandwidth_id=bandwidth_id)
+
+    @torch.no_grad()
+    def decode_batch(self, atoks_list, hop_length=320):
+        """Decodes a list of acoustic token sequences of different lengths in one batch."""
+        lens = [x.shape[-1] for x in atoks_list]
+        # empty sequences have no last frame to pad with, they simply give empty waveforms
+        idxs = [i for i, n in enumerate(lens) if n > 0]
+        out = [torch.zeros(0, device=self.device) for _ in lens]
+        if not idxs: return out
+        # pad by repeating the last frame, the padding is cut away after decoding
+        atoks = torch.stack([torch.cat([atoks_list[i], atoks_list[i][:,-1:].expand(-1, max(lens) - lens[i])], dim=-1) for i in idxs])
+        for i, a in zip(idxs, self.decode(atoks)): out[i] = a[:lens[i] * hop_length]
+        return out
         
+    @torch.no_grad()
+    def decode_stream(self, atoks_chunks, left_context=24, lookahead=12, crossfade=4, hop_length=320):
+        """Vocodes a stream of acoustic token chunks and yields the audio as soon as possible.
+
+        Every window is decoded with `left_context` frames of history, the last `lookahead` frames are held
+        back until more tokens arrive (Vocos needs some future context as well) and the seams between the
+        windows are cross-faded over `crossfade` frames."""
+        assert lookahead >= crossfade, "the lookahead has to cover the cross-fade region"
+        atoks, pos, tail = None, 0, None
+
+        def emit(end, final):
+            nonlocal pos, tail
+            w0 = max(0, pos - left_context)
+            audio = self.decode(atoks[...,w0:])
+            a, b = (pos - w0) * hop_length, (end - w0) * hop_length
+            out = audio[...,a:b]
+            if tail is not None:
+                n = min(tail.shape[-1], out.shape[-1])
+                fade = torch.linspace(0, 1, n, device=out.device, dtype=out.dtype)
+                out = torch.cat([out[...,:n] * fade + tail[...,:n] * (1 - fade), out[...,n:]], dim=-1)
+            tail = None if final else audio[...,b:b + crossfade * hop_length]
+            pos = end
+            return out
+
+        for chunk in atoks_chunks:
+            atoks = chunk if atoks is None else torch.cat([atoks, chunk], dim=-1)
+            end = atoks.shape[-1] - lookahead
+            if end > pos: yield emit(end, final=False)
+        if atoks is not None and atoks.shape[-1] > pos:
+            yield emit(atoks.shape[-1], final=True)
+
     def decode_to_file(self, fname, atoks):
+        import torchaudio
         audio = self.decode(atoks)
         torchaudio.save(fname, audio.cpu(), 24000)
         if self.is_notebook():
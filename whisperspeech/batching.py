@@ -0,0 +1,505 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/7A. Continuous batching.ipynb.
+
+# %% auto 0
+__all__ = ['T2SRequest', 'T2SScheduler', 'S2ARequest', 'S2AScheduler']
+
+# %% ../nbs/7A. Continuous batching.ipynb 2
+import math
+import time
+import heapq
+import itertools
+import contextlib
+import dataclasses
+
+import torch
+
+from whisperspeech import inference
+from whisperspeech.modules import PagedKVCache
+
+# %% ../nbs/7A. Continuous batching.ipynb 3
+# Continuous (in-flight) batching for the autoregressive decoders.
+#
+# Every decoder layer keeps a KV cache with `max_batch_size` rows (see `optimize`). The schedulers below
+# treat those rows as slots: a request is admitted into a free slot at any decoding step, decodes at its own
+# position and is retired (freeing the slot) as soon as it finishes, without waiting for the rest of the batch.
+#
+# With a `kv_pool` (`KVPagePool`) the self-attention caches are paged instead: every slot only holds the pages
+# it needs so `max_batch_size` can be much larger than what the dense caches would allow in the same memory
+# and the same pool can be shared by a T2S and an S2A scheduler.
+#
+# Requests have a `priority` class (lower values are served first) and an optional `deadline` (in seconds after
+# submission). The waiting queue is ordered by class and then by the earliest deadline. A request which finds no
+# free slot (or not enough free pages) preempts the running request of the lowest class: its slot is freed and it
+# goes back to the queue, when it is admitted again the tokens generated so far are prefilled as a prompt and it
+# continues where it left off.
+
+@dataclasses.dataclass(eq=False)
+class T2SRequest:
+    txt: str
+    cps: float = 15
+    lang: str = "en"
+    stoks_prompt: torch.Tensor = None
+    N: int = None
+    priority: int = 0
+    deadline: float = None
+    # filled in by the scheduler
+    id: int = None
+    slot: int = None
+    stoks: torch.Tensor = None
+    submitted: float = None
+    finished: float = None
+    preemptions: int = 0
+    resume: torch.Tensor = None # the tokens generated before a preemption
+
+    @property
+    def done(self):
+        return self.stoks is not None
+
+# %% ../nbs/7A. Continuous batching.ipynb 4
+class SlotScheduler:
+    """Keeps track of the waiting requests and the KV cache slots, subclasses implement `admit` and `step`
+    (and `_snapshot` for preemption)."""
+    def __init__(self, model, max_batch_size=None, kv_pool=None, max_seq_len=None):
+        attn = model.decoder.layers[0].attn
+        assert attn.k_cache is not None, "please call model.optimize() first to setup the KV caches"
+        self.model = model
+        self.paged = None
+        if kv_pool is None:
+            self.max_batch_size = max_batch_size or attn.k_cache.shape[0]
+            assert self.max_batch_size <= attn.k_cache.shape[0], "please pass in a larger max_batch_size to model.optimize"
+        else:
+            assert max_batch_size, "please pass in the max_batch_size for the paged KV cache"
+            self.max_batch_size = max_batch_size
+            self.paged = PagedKVCache(kv_pool, model.decoder, max_batch_size, max_seq_len)
+        self.waiting = [] # a heap of (`_urgency`, request) pairs
+        self.cross_kv = None
+        self.slots = [None] * self.max_batch_size
+        self.ids = itertools.count()
+        self.clock = time.monotonic
+        self.n_submitted = self.n_preempted = 0
+        self.classes = {} # per priority class: finished requests, deadline misses and the total latency
+
+    @property
+    def pending(self):
+        return len(self.waiting) + self.active
+
+    @property
+    def active(self):
+        return sum(r is not None for r in self.slots)
+
+    def _submit(self, req, priority=0, deadline=None):
+        if priority is not None: req.priority = priority
+        if deadline is not None: req.deadline = deadline
+        req.id = next(self.ids)
+        req.submitted = self.clock()
+        self.n_submitted += 1
+        heapq.heappush(self.waiting, (self._urgency(req), req))
+        return req
+
+    def _urgency(self, req):
+        """Waiting requests are served by priority class and then by the earliest deadline."""
+        deadline = math.inf if req.deadline is None else req.submitted + req.deadline
+        return req.priority, deadline, req.id
+
+    def _rank(self, req):
+        # the running request we would rather preempt compares higher: lowest class, admitted last
+        return req.priority, req.id
+
+    def _take_waiting(self):
+        """Assigns free slots to waiting requests (and reserves their initial KV cache pages), requests of a
+        lower priority class are preempted if there is no room."""
+        slots, reqs = [], []
+        while self.waiting:
+            req = self.waiting[0][1]
+            free = [i for i,r in enumerate(self.slots) if r is None and i not in slots]
+            length = self._initial_length(req)
+            if not free or (self.paged is not None and self.paged.pages_needed(length) > self.paged.pool.n_free):
+                victims = [r for r in self.slots if r is not None and r.priority > req.priority]
+                if victims:
+                    self._preempt(max(victims, key=self._rank))
+                    continue
+                if free and not self.active and not reqs: raise RuntimeError("the KV cache pool is too small for the request")
+                break
+            if self.paged is not None: self.paged.reserve(free[0], length)
+            slots.append(free[0])
+            reqs.append(heapq.heappop(self.waiting)[1])
+        for slot, req in zip(slots, reqs):
+            req.slot = slot
+            self.slots[slot] = req
+        return slots, reqs
+
+    def _snapshot(self, slot):
+        """The tokens generated so far in `slot` (to continue from after a preemption)."""
+        raise NotImplementedError
+
+    def _preempt(self, req):
+        """Frees the slot of a running request and puts it back into the queue."""
+        req.resume = self._snapshot(req.slot)
+        req.preemptions += 1
+        self.n_preempted += 1
+        self._free_slot(req.slot)
+        req.slot = None
+        heapq.heappush(self.waiting, (self._urgency(req), req))
+
+    def _reserve(self, slot, length):
+        """Makes sure a running request has the pages for `length` positions. When the pool runs out the least
+        important running request (possibly this one) is preempted. Returns False if it was this one."""
+        req = self.slots[slot]
+        while True:
+            try:
+                self.paged.reserve(slot, length)
+                return True
+            except RuntimeError:
+                victim = max((r for r in self.slots if r is not None), key=self._rank)
+                if victim is req and self.active == 1: raise
+                self._preempt(victim)
+                if victim is req: return False
+
+    def _finish(self, req):
+        """Frees the slot of a finished request and updates the metrics."""
+        self._free_slot(req.slot)
+        req.finished = self.clock()
+        latency = req.finished - req.submitted
+        stats = self.classes.setdefault(req.priority, dict(finished=0, deadline_misses=0, latency=0.))
+        stats['finished'] += 1
+        stats['latency'] += latency
+        if req.deadline is not None and latency > req.deadline: stats['deadline_misses'] += 1
+        return req
+
+    def stats(self):
+        """Returns the request counters, with the finished requests, deadline misses and the mean latency per priority class."""
+        classes = {p: dict(finished=c['finished'], deadline_misses=c['deadline_misses'], mean_latency=c['latency'] / c['finished'])
+                   for p, c in sorted(self.classes.items())}
+        return dict(submitted=self.n_submitted, preemptions=self.n_preempted, waiting=len(self.waiting), active=self.active,
+                    finished=sum(c['finished'] for c in classes.values()),
+                    deadline_misses=sum(c['deadline_misses'] for c in classes.values()), classes=classes)
+
+    def _initial_length(self, req):
+        """The number of KV cache positions reserved for `req` when it is admitted."""
+        raise NotImplementedError
+
+    def _store_cross_kv(self, slot_idx, cross_kv):
+        """Keeps the cross-attention keys and values of newly admitted requests for all their decoding steps."""
+        if self.cross_kv is None:
+            self.cross_kv = [tuple(torch.zeros((self.max_batch_size, *x.shape[1:]), dtype=x.dtype, device=x.device) for x in kv)
+                             for kv in cross_kv]
+        for (k, v), (new_k, new_v) in zip(self.cross_kv, cross_kv):
+            k[slot_idx] = new_k
+            v[slot_idx] = new_v
+
+    def _free_slot(self, slot):
+        self.slots[slot] = None
+        if self.paged is not None: self.paged.release(slot)
+
+    def _kv_cache(self):
+        """Context for running the decoder on the slots (switches to the paged KV cache if we have one)."""
+        return self.paged.attached() if self.paged is not None else contextlib.nullcontext()
+
+    def _active_slots(self):
+        return [i for i,r in enumerate(self.slots) if r is not None]
+
+    def run(self):
+        """Decodes until all the submitted requests are finished."""
+        done = []
+        while self.pending:
+            done += self.step()
+        return done
+
+# %% ../nbs/7A. Continuous batching.ipynb 5
+class T2SScheduler(SlotScheduler):
+    """Continuous batching scheduler for `TSARTransformer`.
+
+    The model has to be optimized (`model.optimize(max_batch_size=...)`) first so the KV caches exist.
+
+    ```
+    sched = T2SScheduler(t2s)
+    reqs = [sched.submit(txt) for txt in txts]
+    while sched.pending:
+        for req in sched.step():
+            print(req.id, req.stoks.shape)
+    ```
+
+    With a `kv_pool` the pages are reserved as the sequences grow, when the pool runs out the least important
+    running request is preempted (a `RuntimeError` is raised if a single request does not fit).
+    """
+    def __init__(self, model, max_batch_size=None, T=0.7, top_k=None, kv_pool=None):
+        super().__init__(model, max_batch_size, kv_pool=kv_pool, max_seq_len=model.stoks_len)
+        model.ensure_tokenizer()
+        self.top_k = top_k
+        self.eot = model.stoks_codes + model.tunables.padding_token_offset
+
+        dev = model.device
+        bs = self.max_batch_size
+        self.T = torch.tensor(T, device=dev)
+        self.toks = torch.full((bs, model.stoks_len), self.eot, dtype=torch.long, device=dev)
+        self.positions = torch.zeros(bs, dtype=torch.long, device=dev) # index of the last generated token
+        self.xenc = None
+        self.cps_emb = None
+        self.xenc_positions = None
+
+    def submit(self, txt, cps=15, lang="en", stoks_prompt=None, N=None, priority=None, deadline=None):
+        """Queues a text, `priority` is the request class (lower values first, 0 by default) and
+        `deadline` the number of seconds it should finish in."""
+        req = txt if isinstance(txt, T2SRequest) else T2SRequest(txt, cps=cps, lang=lang, stoks_prompt=stoks_prompt, N=N)
+        return self._submit(req, priority, deadline)
+
+    @staticmethod
+    def _prompt(req):
+        # a preempted request continues from everything it generated so far
+        return req.resume if req.resume is not None else req.stoks_prompt
+
+    def _initial_length(self, req):
+        # SOT, the prompt and the first sampled token
+        prompt = self._prompt(req)
+        return (0 if prompt is None else len(prompt)) + 2
+
+    def _snapshot(self, slot):
+        return self.toks[slot,1:int(self.positions[slot])+1].clone()
+
+    def _alloc_buffers(self, xenc, xenc_positions, cps_emb):
+        bs = self.max_batch_size
+        self.xenc = torch.zeros((bs, *xenc.shape[1:]), dtype=xenc.dtype, device=xenc.device)
+        self.cps_emb = torch.zeros((bs, *cps_emb.shape[1:]), dtype=cps_emb.dtype, device=cps_emb.device)
+        self.xenc_positions = xenc_positions
+
+    @torch.no_grad()
+    def admit(self):
+        """Moves waiting requests into free slots, encodes them and prefills the decoder in one batch."""
+        slots, reqs = self._take_waiting()
+        if not reqs: return []
+
+        m, dev = self.model, self.model.device
+        slot_idx = torch.tensor(slots, device=dev)
+
+        ttoks, langs = zip(*[m.prep_text(r.txt, r.lang) for r in reqs])
+        ttoks = torch.stack(ttoks)
+        langs = torch.stack([l.expand(m.ttoks_len) if len(l) == 1 else l for l in langs])
+        cpss = torch.tensor([r.cps for r in reqs], device=dev)
+        xenc, xenc_positions, cps_emb = m.run_encoder(ttoks, langs, cpss)
+        if self.xenc is None: self._alloc_buffers(xenc, xenc_positions, cps_emb)
+        self.xenc[slot_idx] = xenc
+        self.cps_emb[slot_idx] = cps_emb
+
+        # prompts can have different lengths, each row reads its logits at the end of its own prompt
+        prompts = [self._prompt(r) for r in reqs]
+        starts = torch.tensor([0 if p is None else len(p) for p in prompts], device=dev)
+        toks = torch.full((len(reqs), int(starts.max()) + 1), self.eot, dtype=torch.long, device=dev)
+        for j, p in enumerate(prompts):
+            if p is not None: toks[j,1:len(p)+1] = p
+        for r in reqs: r.resume = None
+        positions = torch.arange(toks.shape[1], device=dev).expand(len(reqs), -1)
+        cross_kv = m.decoder.project_cross_kv(xenc, xenc_positions)
+        self._store_cross_kv(slot_idx, cross_kv)
+        with self._kv_cache():
+            logits, _ = m(None, None, None, None, toks, in_stoks_positions=positions, loss=None,
+                          xenc=xenc, xenc_positions=xenc_positions, cps_emb=cps_emb, slots=slot_idx, cross_kv=cross_kv)
+        logits = logits[torch.arange(len(reqs), device=dev), starts]
+        first = inference.sample(logits, self.T, self.top_k)[:,0]
+
+        self.toks[slot_idx] = self.eot
+        self.toks[slot_idx,:toks.shape[1]] = toks
+        self.toks[slot_idx,starts+1] = first.to(torch.long)
+        self.positions[slot_idx] = starts + 1
+        return self._retire(slots)
+
+    def _retire(self, slots):
+        done = []
+        slot_idx = torch.tensor(slots, device=self.toks.device)
+        positions = self.positions[slot_idx].tolist()
+        last = self.toks[slot_idx,self.positions[slot_idx]].tolist()
+        for slot, pos, tok in zip(slots, positions, last):
+            req = self.slots[slot]
+            N = min(req.N or self.model.stoks_len, self.model.stoks_len)
+            if tok == self.eot:
+                req.stoks = self.toks[slot,1:pos].clone()
+            elif pos >= N - 1:
+                req.stoks = self.toks[slot,1:pos+1].clone()
+            else:
+                continue
+            done.append(self._finish(req))
+        return done
+
+    @torch.no_grad()
+    def step(self):
+        """Admits waiting requests and runs one decoding step for all the active slots.
+
+        Returns the requests that finished in this step."""
+        done = self.admit()
+        active = self._active_slots()
+        if self.paged is not None:
+            for slot, pos in zip(active, self.positions[active].tolist()):
+                if self.slots[slot] is not None: self._reserve(slot, pos + 1)
+            active = self._active_slots()
+        if not active: return done
+
+        # all slots up to the last active one are decoded together, idle slots in between
+        # only do some wasted work on their stale cache rows
+        n = max(active) + 1
+        rows = torch.arange(n, device=self.toks.device)
+        positions = self.positions[:n]
+        cross_kv = [(k[:n], v[:n]) for k,v in self.cross_kv]
+        with inference.inference_context(), self._kv_cache():
+            new = self.model.generate_next(self.toks[rows,positions].unsqueeze(1), positions.unsqueeze(1),
+                                           self.cps_emb[:n], self.xenc[:n], self.xenc_positions, self.T, self.top_k, cross_kv=cross_kv)[:,0]
+        active_idx = torch.tensor(active, device=self.toks.device)
+        self.positions[active_idx] += 1
+        self.toks[active_idx,self.positions[active_idx]] = new[active_idx].to(torch.long)
+        return done + self._retire(active)
+
+    def generate(self, txts, cps=15, lang="en"):
+        """Generates semantic tokens for a list of texts, returns them in the same order."""
+        if not isinstance(cps, (list, tuple)): cps = [cps] * len(txts)
+        if not isinstance(lang, (list, tuple)): lang = [lang] * len(txts)
+        reqs = [self.submit(txt, cps=c, lang=l) for txt, c, l in zip(txts, cps, lang)]
+        self.run()
+        return [r.stoks for r in reqs]
+
+# %% ../nbs/7A. Continuous batching.ipynb 6
+@dataclasses.dataclass(eq=False)
+class S2ARequest:
+    stoks: torch.Tensor
+    speaker: torch.Tensor
+    atoks_prompt: torch.Tensor = None
+    N: int = None
+    priority: int = 0
+    deadline: float = None
+    # filled in by the scheduler
+    id: int = None
+    slot: int = None
+    atoks: torch.Tensor = None
+    submitted: float = None
+    finished: float = None
+    preemptions: int = 0
+    resume: torch.Tensor = None # the (delayed) tokens generated before a preemption
+
+    @property
+    def done(self):
+        return self.atoks is not None
+
+# %% ../nbs/7A. Continuous batching.ipynb 7
+class S2AScheduler(SlotScheduler):
+    """Continuous batching scheduler for `SADelARTransformer`.
+
+    Every slot has its own semantic tokens, speaker embedding and position in the quantizer delay pattern
+    and is freed as soon as it reaches its own target length (`len(stoks)*3` acoustic frames by default).
+    With a `kv_pool` the pages for the whole target length are reserved when a request is admitted.
+    """
+    def __init__(self, model, max_batch_size=None, T=0.7, top_k=None, kv_pool=None):
+        super().__init__(model, max_batch_size, kv_pool=kv_pool, max_seq_len=model.ctx_n)
+        self.top_k = top_k
+        self.empty = model.codes + 1
+
+        dev = model.device
+        bs = self.max_batch_size
+        self.T = torch.tensor(T, device=dev)
+        self.toks = torch.full((bs, model.quantizers, model.ctx_n), self.empty, dtype=torch.long, device=dev)
+        self.positions = torch.zeros(bs, dtype=torch.long, device=dev) # index of the next token to generate
+        self.ends = torch.zeros(bs, dtype=torch.long, device=dev)
+        self.xenc = None
+        self.xenc_positions = None
+
+    def submit(self, stoks, speaker=None, atoks_prompt=None, N=None, priority=None, deadline=None):
+        """Queues semantic tokens, see `T2SScheduler.submit` for the `priority` and `deadline`."""
+        req = stoks if isinstance(stoks, S2ARequest) else S2ARequest(stoks, speaker, atoks_prompt=atoks_prompt, N=N)
+        return self._submit(req, priority, deadline)
+
+    def _snapshot(self, slot):
+        return self.toks[slot,:,:int(self.positions[slot])].clone()
+
+    def _target_length(self, req):
+        return req.N or self.model.stoks_length(req.stoks) * 3
+
+    def _initial_length(self, req):
+        return min(self._target_length(req), self.model.ctx_n-1) + 1
+
+    @torch.no_grad()
+    def admit(self):
+        """Moves waiting requests into free slots, encodes them and prefills the decoder in one batch."""
+        slots, reqs = self._take_waiting()
+        if not reqs: return []
+
+        m, dev = self.model, self.model.device
+        slot_idx = torch.tensor(slots, device=dev)
+
+        stoks = torch.stack([m.prep_stoks(r.stoks) for r in reqs])
+        speakers = torch.stack([r.speaker.reshape(-1) for r in reqs])
+        xenc, self.xenc_positions = m.encode(stoks, speakers)
+        if self.xenc is None:
+            self.xenc = torch.zeros((self.max_batch_size, *xenc.shape[1:]), dtype=xenc.dtype, device=dev)
+        self.xenc[slot_idx] = xenc
+
+        # same layout as in `SADelARTransformer.generate`: SOT followed by the prompt in the delay pattern
+        self.toks[slot_idx] = self.empty
+        starts = []
+        for slot, r in zip(slots, reqs):
+            if r.resume is not None:
+                # continue after the last generated frame
+                self.toks[slot,:,:r.resume.shape[-1]] = r.resume
+                starts.append(r.resume.shape[-1])
+                r.resume = None
+                continue
+            start = 0
+            if r.atoks_prompt is not None:
+                start = r.atoks_prompt.shape[-1]
+                for i in range(m.quantizers):
+                    self.toks[slot,i,1+i:start+i+1] = r.atoks_prompt[i]
+            starts.append(start + 1)
+        starts = torch.tensor(starts, device=dev)
+
+        toks = self.toks[slot_idx,:,:int(starts.max())]
+        positions = torch.arange(toks.shape[-1], device=dev).expand(len(reqs), -1)
+        cross_kv = m.decoder.project_cross_kv(xenc, self.xenc_positions)
+        self._store_cross_kv(slot_idx, cross_kv)
+        with self._kv_cache():
+            logits = m(None, toks, None, None, noloss=True, xenc=xenc, xenc_positions=self.xenc_positions,
+                       atoks_positions=positions, slots=slot_idx, cross_kv=cross_kv)
+        logits = logits[torch.arange(len(reqs), device=dev),:,starts-1]
+        first = inference.sample(logits, self.T, self.top_k)[...,0].to(torch.long)
+        self._write(slot_idx, starts, first)
+
+        self.positions[slot_idx] = starts + 1
+        self.ends[slot_idx] = torch.tensor([min(self._target_length(r), m.ctx_n-1) for r in reqs], device=dev)
+        return self._retire(slots)
+
+    def _write(self, slot_idx, positions, new):
+        # only the first `i` quantizers are valid at position `i` (the delay pattern staircase)
+        valid = torch.arange(self.model.quantizers, device=new.device) < positions[:,None]
+        self.toks[slot_idx,:,positions] = torch.where(valid, new, self.toks[slot_idx,:,positions])
+
+    def _retire(self, slots):
+        done = []
+        slot_idx = torch.tensor(slots, device=self.toks.device)
+        finished = (self.positions[slot_idx] >= self.ends[slot_idx]).tolist()
+        for slot, fin in zip(slots, finished):
+            if not fin: continue
+            req = self.slots[slot]
+            req.atoks = self.model.undelay(self.toks[slot], self._target_length(req))
+            done.append(self._finish(req))
+        return done
+
+    @torch.no_grad()
+    def step(self):
+        """Admits waiting requests and runs one decoding step for all the active slots.
+
+        Returns the requests that finished in this step."""
+        done = self.admit()
+        active = self._active_slots()
+        if not active: return done
+
+        n = max(active) + 1
+        rows = torch.arange(n, device=self.toks.device)
+        positions = (self.positions[:n] - 1).clamp(min=0)
+        cross_kv = [(k[:n], v[:n]) for k,v in self.cross_kv]
+        with inference.inference_context(), self._kv_cache():
+            new = self.model.generate_next(self.toks[rows,:,positions].unsqueeze(-1), positions.unsqueeze(1), None,
+                                           self.xenc[:n], self.xenc_positions, self.T, self.top_k, cross_kv=cross_kv)[...,0]
+        active_idx = torch.tensor(active, device=self.toks.device)
+        self._write(active_idx, self.positions[active_idx], new[active_idx].to(torch.long))
+        self.positions[active_idx] += 1
+        return done + self._retire(active)
+
+    def generate(self, stoks, speakers):
+        """Generates acoustic tokens for a list of semantic token sequences and speaker embeddings."""
+        reqs = [self.submit(s, spk) for s, spk in zip(stoks, speakers)]
+        self.run()
+        return [r.atoks for r in reqs]
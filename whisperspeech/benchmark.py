@@ -4,7 +4,9 @@
 __all__ = []
 
 # %% ../nbs/C. Benchmark.ipynb 2
+import sys
 import time
+import subprocess
 import torch
 from fastcore.script import call_parse
 from whisperspeech.pipeline import Pipeline
@@ -21,6 +23,21 @@ def measure(fun, iterations = 10):
     ts = torch.tensor(ts)
     return ts.mean(), ts.std()
 
+# the optional dependencies which should only be imported when they are used
+heavy_modules = ['vocos', 'huggingface_hub', 'webdataset', 'whisper', 'speechbrain', 'fastprogress', 'torchaudio']
+
+def measure_import(module, iterations = 5):
+    """Imports `module` in fresh interpreters, returns the mean and std of the import time (in seconds)
+    and the heavy dependencies it pulled in."""
+    code = (f"import sys, time; t = time.perf_counter(); import {module}; t = time.perf_counter() - t;"
+            f"print(t); print(' '.join(m for m in {heavy_modules!r} if m in sys.modules))")
+    ts = []
+    for x in range(iterations):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split('\n')
+        ts.append(float(out[0]))
+    ts = torch.tensor(ts)
+    return ts.mean(), ts.std(), out[1].split()
+
 @call_parse
 def benchmark(
     t2s_ref='collabora/whisperspeech:t2s-small-en+pl.model',
@@ -31,8 +48,20 @@ def benchmark(
     s2a_ctx_n : int = None,
     t2s_ctx_n : int = None,
     iterations = 10,
+    dtype : str = None, # float16, bfloat16 or float32 (the default is float16 on GPUs and float32 on the CPU)
+    num_threads : int = None,
+    import_time : bool = False, # only measure how long it takes to import the inference modules
+    lookahead : int = None, # also compare running T2S and S2A one after the other with overlapping them
 ):
+    if import_time:
+        for module in ['torch', 'whisperspeech.pipeline', 'whisperspeech.server']:
+            mean, std, deps = measure_import(module, iterations=int(iterations))
+            print(f"{module:25s} {mean:.3f} ± {std:.3f} s    {' '.join(deps) or '-'}")
+        return
+
     max_batch_size = max_batch_size or batch_size
+    if num_threads: torch.set_num_threads(num_threads)
+    if dtype: dtype = getattr(torch, dtype)
 
     pipe = Pipeline(t2s_ref=t2s_ref, s2a_ref=s2a_ref, optimize=False)
 
@@ -40,13 +69,13 @@ def benchmark(
         pipe.t2s.stoks_len = t2s_ctx_n
         pipe.t2s.decoder.mask = torch.empty(t2s_ctx_n, t2s_ctx_n).fill_(-torch.inf).triu_(1).to(get_compute_device())
     
-    pipe.t2s.optimize(max_batch_size=max_batch_size, torch_compile=not no_torch_compile)
+    pipe.t2s.optimize(max_batch_size=max_batch_size, dtype=dtype, torch_compile=not no_torch_compile)
 
     if s2a_ctx_n:
         pipe.s2a.ctx_n = s2a_ctx_n
         pipe.s2a.decoder.mask = torch.empty(s2a_ctx_n, s2a_ctx_n).fill_(-torch.inf).triu_(1).to(get_compute_device())
 
-    pipe.s2a.optimize(max_batch_size=max_batch_size, torch_compile=not no_torch_compile)
+    pipe.s2a.optimize(max_batch_size=max_batch_size, dtype=dtype, torch_compile=not no_torch_compile)
 
     txt = "This is the first demo of Whisper Speech, a fully open source text-to-speech model trained by Collabora and Lion on the Juwels supercomputer."
     stoks = torch.zeros(250)
@@ -65,3 +94,14 @@ def benchmark(
     s2a_mean, s2a_std = measure(s2a, iterations=iterations)
     print(f"T2S: {t2s_mean:.3f} ± {t2s_std:.3f} s    S2A: {s2a_mean:.3f} ± {s2a_std:.3f} s    Total: {t2s_mean+s2a_mean:.3f} s")
     print(f"     {t/t2s_mean:.2f}x                  {t/s2a_mean:.2f}x                    {t/(t2s_mean+s2a_mean):.2f}x")
+
+    if lookahead is not None:
+        # the whole text to acoustic tokens path, with S2A started after T2S and S2A following T2S with a lookahead
+        def sequential():
+            return pipe.generate_atoks(txt)
+        def overlapped():
+            return pipe.generate_atoks(txt, lookahead=lookahead)
+        overlapped()
+        seq_mean, seq_std = measure(sequential, iterations=iterations)
+        ovl_mean, ovl_std = measure(overlapped, iterations=iterations)
+        print(f"Sequential: {seq_mean:.3f} ± {seq_std:.3f} s    Overlapped (lookahead={lookahead}): {ovl_mean:.3f} ± {ovl_std:.3f} s")
@@ -0,0 +1,234 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/7B. Caches.ipynb.
+
+# %% auto 0
+__all__ = ['content_hash', 'model_checksum', 'LRUCache', 'DiskCache', 'AudioCache', 'TieredCache']
+
+# %% ../nbs/7B. Caches.ipynb 2
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+from collections import OrderedDict
+
+import numpy as np
+import torch
+
+# %% ../nbs/7B. Caches.ipynb 3
+# Simple caches for the intermediate results of the Pipeline (speaker embeddings, tokens, audio).
+# Keys are strings, values are tensors (or tuples of tensors for the in-memory cache).
+
+def content_hash(fname, chunk_size=1<<20):
+    """Returns a hash of the file contents (so renamed or copied files share cache entries)."""
+    h = hashlib.sha256()
+    with open(fname, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk: break
+            h.update(chunk)
+    return h.hexdigest()
+
+# %% ../nbs/7B. Caches.ipynb 4
+# the KV caches are overwritten by every generation so they are not a part of the checksum
+_kv_cache_buffers = ('k_cache', 'v_cache')
+
+def _hash_value(h, value):
+    if isinstance(value, (tuple, list)): # the (weight, bias) of a quantized linear layer
+        for x in value: _hash_value(h, x)
+    elif isinstance(value, torch.Tensor):
+        if value.is_quantized:
+            # the int8 values and the scales (the repr of a quantized tensor only shows a few dequantized values)
+            if value.qscheme() in (torch.per_tensor_affine, torch.per_tensor_symmetric):
+                h.update(f'{value.q_scale()} {value.q_zero_point()};'.encode('utf-8'))
+            else:
+                h.update(f'{value.q_per_channel_axis()};'.encode('utf-8'))
+                _hash_value(h, (value.q_per_channel_scales(), value.q_per_channel_zero_points()))
+            value = value.int_repr()
+        h.update(value.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy().tobytes())
+    else: # extra state (e.g. the speaker map), the dtype of quantized layers or a missing bias
+        h.update(repr(value).encode('utf-8'))
+
+def model_checksum(model):
+    """Returns a short hash of all the weights of `model` (to tell apart results of different checkpoints)."""
+    h = hashlib.sha256()
+    for name, value in model.state_dict().items():
+        if name.rsplit('.', 1)[-1] in _kv_cache_buffers: continue
+        h.update(name.encode('utf-8'))
+        _hash_value(h, value)
+    return h.hexdigest()[:16]
+
+# %% ../nbs/7B. Caches.ipynb 5
+def _nbytes(value):
+    if isinstance(value, torch.Tensor): return value.nelement() * value.element_size()
+    if isinstance(value, np.ndarray): return value.nbytes
+    if isinstance(value, (tuple, list)): return sum(_nbytes(x) for x in value)
+    if isinstance(value, dict): return sum(_nbytes(x) for x in value.values())
+    return 0
+
+# %% ../nbs/7B. Caches.ipynb 6
+class LRUCache:
+    """In-memory cache which evicts the least recently used entries above `max_items` entries or `max_bytes` of tensors."""
+    def __init__(self, max_items=256, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        if key not in self.entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        if key in self.entries: self.nbytes -= _nbytes(self.entries.pop(key))
+        self.entries[key] = value
+        self.nbytes += _nbytes(value)
+        while self.entries and ((self.max_items is not None and len(self.entries) > self.max_items) or
+                                (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            _, old = self.entries.popitem(last=False)
+            self.nbytes -= _nbytes(old)
+        return value
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return dict(hits=self.hits, misses=self.misses, items=len(self), nbytes=self.nbytes)
+
+# %% ../nbs/7B. Caches.ipynb 7
+class DiskCache:
+    """Stores tensors as `.npy` files in a directory. With `mmap` the files are memory-mapped (copy-on-write) instead of read.
+
+    If the files take up more than `max_bytes` the least recently used ones are deleted."""
+    suffix = '.npy'
+
+    def __init__(self, path, mmap=False, max_bytes=None):
+        self.path = Path(path).expanduser()
+        self.mmap = mmap
+        self.max_bytes = max_bytes
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.nbytes = sum(f.stat().st_size for f in self.files())
+        self.hits = self.misses = 0
+
+    def files(self):
+        return list(self.path.glob('*' + self.suffix))
+
+    def fname(self, key):
+        return self.path/(hashlib.sha256(key.encode('utf-8')).hexdigest() + self.suffix)
+
+    def __contains__(self, key):
+        return self.fname(key).exists()
+
+    def __len__(self):
+        return len(self.files())
+
+    def load(self, fname):
+        return torch.from_numpy(np.load(fname, mmap_mode='c' if self.mmap else None))
+
+    def save(self, fname, value):
+        with open(fname, 'wb') as f:
+            np.save(f, value.detach().cpu().numpy())
+
+    def get(self, key, default=None):
+        fname = self.fname(key)
+        if not fname.exists():
+            self.misses += 1
+            return default
+        value = self.load(fname)
+        self.hits += 1
+        # the modification time doubles as the last access time for eviction
+        os.utime(fname)
+        return value
+
+    def put(self, key, value):
+        fname = self.fname(key)
+        # write to a temporary file first so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        os.close(fd)
+        self.save(tmp, value)
+        if fname.exists(): self.nbytes -= fname.stat().st_size
+        self.nbytes += os.path.getsize(tmp)
+        os.replace(tmp, fname)
+        if self.max_bytes is not None and self.nbytes > self.max_bytes: self.evict()
+        return value
+
+    def evict(self):
+        files = sorted(((f.stat().st_mtime, f) for f in self.files()), key=lambda x: x[0])
+        self.nbytes = sum(f.stat().st_size for _,f in files)
+        for _,f in files:
+            if self.nbytes <= self.max_bytes: break
+            self.nbytes -= f.stat().st_size
+            f.unlink(missing_ok=True)
+
+    def clear(self):
+        for f in self.files(): f.unlink(missing_ok=True)
+        self.nbytes = 0
+
+    def stats(self):
+        return dict(hits=self.hits, misses=self.misses, items=len(self), nbytes=self.nbytes)
+
+# %% ../nbs/7B. Caches.ipynb 8
+class AudioCache(DiskCache):
+    """A `DiskCache` for waveforms, compressed as FLAC (lossless) or any other `format` supported by `torchaudio.save`
+    (e.g. `ogg` or `opus`)."""
+    def __init__(self, path, format='flac', sample_rate=24000, max_bytes=None):
+        self.suffix = '.' + format
+        self.format = format
+        self.sample_rate = sample_rate
+        super().__init__(path, max_bytes=max_bytes)
+
+    def load(self, fname):
+        import torchaudio
+        audio, sr = torchaudio.load(fname)
+        assert sr == self.sample_rate
+        return audio
+
+    def save(self, fname, value):
+        import torchaudio
+        torchaudio.save(fname, value.detach().cpu().float(), self.sample_rate, format=self.format)
+
+# %% ../nbs/7B. Caches.ipynb 9
+class TieredCache:
+    """An `LRUCache` in front of an optional `DiskCache` (bounded to `disk_max_bytes`)."""
+    def __init__(self, path=None, max_items=256, max_bytes=None, mmap=False, disk_max_bytes=None):
+        self.memory = LRUCache(max_items=max_items, max_bytes=max_bytes)
+        self.disk = DiskCache(path, mmap=mmap, max_bytes=disk_max_bytes) if path is not None else None
+        self.hits = self.misses = 0
+
+    def __contains__(self, key):
+        return key in self.memory or (self.disk is not None and key in self.disk)
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None: self.memory.put(key, value)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None: self.disk.put(key, value)
+        return value
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None: self.disk.clear()
+
+    def stats(self):
+        stats = dict(hits=self.hits, misses=self.misses, memory=self.memory.stats())
+        if self.disk is not None: stats['disk'] = self.disk.stats()
+        return stats
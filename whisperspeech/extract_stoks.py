@@ -19,7 +19,6 @@ from torch.profiler import profile, record_function, ProfilerActivity
 from fastprogress import progress_bar
 from fastcore.script import *
 
-from speechbrain.pretrained import EncoderClassifier
 from . import vq_stoks, utils, vad_merge
 import webdataset as wds
 
@@ -41,6 +40,7 @@ def prepare_stoks(
     vq_model = vq_stoks.RQBottleneckTransformer.load_model(vq_model, cache_dir=cache_dir).to(device)
     vq_model.ensure_whisper()
     
+    from speechbrain.pretrained import EncoderClassifier
     spk_classifier = EncoderClassifier.from_hparams("speechbrain/spkrec-ecapa-voxceleb",
                                                     savedir=expanduser("~/.cache/speechbrain/"),
                                                     run_opts = {"device": device},
@@ -4,9 +4,10 @@
 __all__ = ['get_compute_device']
 
 # %% ../nbs/D. Common inference utilities.ipynb 1
+import json
+import mmap
 import torch
 import torch.nn.functional as F
-from huggingface_hub import hf_hub_download
 
 from contextlib import nullcontext
 
@@ -31,11 +32,77 @@ def get_compute_device():
 def load_model(ref=None, spec=None, device='cpu', cache_dir=None):
     if spec is not None: return spec
     if ":" in ref:
+        from huggingface_hub import hf_hub_download
         repo_id, filename = ref.split(":", 1)
         local_filename = hf_hub_download(repo_id=repo_id, filename=filename, cache_dir=cache_dir)
     else:
         local_filename = ref
-    return torch.load(local_filename, map_location=device)
+    return load_spec(local_filename, device)
+
+def load_spec(fname, device='cpu'):
+    """Loads a model spec (`config`, `tunables` and `state_dict`) from a `.safetensors` or a pickled `.model` file."""
+    if str(fname).endswith('.safetensors'): return load_safetensors(fname, device)
+    return torch.load(fname, map_location=device)
+
+# safetensors files are an 8 byte header length, a JSON header with the dtype, shape and byte range of every
+# tensor and the raw tensor data. We keep the rest of the spec (config, tunables, the non-tensor extra state)
+# as JSON in the header metadata.
+_st_dtypes = {'F64': torch.float64, 'F32': torch.float32, 'F16': torch.float16, 'BF16': torch.bfloat16,
+              'I64': torch.int64, 'I32': torch.int32, 'I16': torch.int16, 'I8': torch.int8, 'U8': torch.uint8, 'BOOL': torch.bool}
+
+def save_safetensors(fname, spec):
+    """Saves a model `spec` (as created by `save_model`) in the safetensors format."""
+    assert not spec.get('quantized'), "quantized models can only be saved in the pickled format"
+    names = {v: k for k, v in _st_dtypes.items()}
+    state_dict, extra = {}, {}
+    for k, v in spec['state_dict'].items():
+        # the KV caches are recreated by `optimize`
+        if k.endswith(('k_cache', 'v_cache')): continue
+        if isinstance(v, torch.Tensor): state_dict[k] = v.detach().cpu().contiguous()
+        else: extra[k] = v
+    meta = {k: v for k, v in spec.items() if k != 'state_dict'}
+    meta['extra_state'] = extra
+    # biggest elements first so every tensor stays aligned
+    tensors = sorted(state_dict.items(), key=lambda x: (-x[1].element_size(), x[0]))
+    header, offset = {'__metadata__': {'format': 'pt', 'whisperspeech': json.dumps(meta)}}, 0
+    for k, v in tensors:
+        n = v.nelement() * v.element_size()
+        header[k] = dict(dtype=names[v.dtype], shape=list(v.shape), data_offsets=[offset, offset + n])
+        offset += n
+    header = json.dumps(header).encode('utf-8')
+    header += b' ' * (-len(header) % 8)
+    with open(fname, 'wb') as f:
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for k, v in tensors:
+            f.write(v.view(-1).view(torch.uint8).numpy().tobytes())
+
+def load_safetensors(fname, device='cpu'):
+    """Loads a model spec saved with `save_safetensors`. On the CPU the tensors are memory-mapped (copy-on-write)
+    so only the pages which are actually used are read and all processes share the same page cache."""
+    with open(fname, 'rb') as f:
+        n = int.from_bytes(f.read(8), 'little')
+        header = json.loads(f.read(n))
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    meta = json.loads(header.pop('__metadata__')['whisperspeech'])
+    state_dict = {}
+    for k, info in header.items():
+        (start, end), dtype, shape = info['data_offsets'], _st_dtypes[info['dtype']], info['shape']
+        if start == end: x = torch.empty(shape, dtype=dtype)
+        else: x = torch.frombuffer(data, dtype=dtype, count=torch.Size(shape).numel(), offset=8 + n + start).view(shape)
+        state_dict[k] = x.to(device)
+    state_dict.update(meta.pop('extra_state'))
+    # the tensors can be used as they are instead of being copied into freshly allocated weights
+    return dict(meta, state_dict=state_dict, mmap=True)
+
+def export_safetensors(ref, fname, cache_dir=None):
+    """Converts a model checkpoint (`repo_id:filename` or a local file) to the safetensors format."""
+    save_safetensors(fname, load_model(ref, cache_dir=cache_dir))
+
+def progress_bar(it, **kwargs):
+    # fastprogress takes a while to import so we only load it when we show a progress bar
+    from fastprogress import progress_bar
+    return progress_bar(it, **kwargs)
 
 # %% ../nbs/D. Common inference utilities.ipynb 5
 def inference_context():
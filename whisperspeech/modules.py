@@ -1,8 +1,9 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/A. Neural modules.ipynb.
 
 # %% auto 0
-__all__ = ['LayerNorm', 'LinearHead', 'QueryHead', 'init_transformer', 'sinusoids', 'MultiHeadAttention',
-           'ResidualAttentionBlock', 'BaseDecoder', 'EmbeddingProjector', 'FlexEmbeddings']
+__all__ = ['LayerNorm', 'LinearHead', 'QueryHead', 'init_transformer', 'quantize_int8', 'sinusoids', 'MultiHeadAttention',
+           'ResidualAttentionBlock', 'BaseDecoder', 'KVPagePool', 'PagedKVCache', 'EmbeddingProjector',
+           'FlexEmbeddings']
 
 # %% ../nbs/A. Neural modules.ipynb 2
 import torch
@@ -12,6 +13,7 @@ import math
 from torch import Tensor, nn
 import torch.nn.functional as F
 from typing import Dict, Iterable, Optional
+from contextlib import contextmanager
 
 # import xformers.ops as xops
 
@@ -42,6 +44,11 @@ def init_transformer(m):
         torch.nn.init.constant_(m.bias, 0)
         torch.nn.init.constant_(m.weight, 1.0)
 
+def quantize_int8(m):
+    """Replaces (in place) every `nn.Linear` layer with a dynamically quantized int8 version for CPU inference.
+    The subclasses (like the μP heads or the embedding projections) are left alone."""
+    return torch.ao.quantization.quantize_dynamic(m, {nn.Linear}, dtype=torch.qint8, inplace=True)
+
 # %% ../nbs/A. Neural modules.ipynb 4
 def sinusoids(length, channels, max_timescale=10000):
     """Returns sinusoids for positional embedding"""
@@ -66,9 +73,18 @@ class MultiHeadAttention(nn.Module):
         self.query_subsampling = 1
         self.key_subsampling = 1
 
-        self.cached_kvx = None
+        # only attend to the filled part of the self-attention KV cache (needs the positions on the host)
+        self.trim_kv = False
         self.register_buffer('k_cache', None)
         self.register_buffer('v_cache', None)
+        # with a sliding `window` the cache is a ring buffer of the last positions (see `window_kv`)
+        self.window = None
+        self.register_buffer('kv_positions', None, persistent=False)
+        # compute the RoPE rotations for any position instead of looking them up in the fixed size table
+        self.long_rope = False
+        # while a `PagedKVCache` is attached the self-attention cache lives in its pages
+        self.paged = None
+        self.block_table = None
         
         self.rotary = None
         if rope:
@@ -76,10 +92,18 @@ class MultiHeadAttention(nn.Module):
         self.qkv = None
         self.kv = None
 
-    def setup_kv_cache(self, max_batch_size, max_seq_len, dtype=torch.float32):
+    def setup_kv_cache(self, max_batch_size, max_seq_len, dtype=torch.float32, device=None, window=None):
+        if device is None: device = self.key.weight.device
+        self.window = window
+        if window is not None:
+            # only the last `window` positions are kept so the memory does not depend on the sequence length
+            max_seq_len = window
+            self.kv_positions = torch.full((window,), -1, dtype=torch.long, device=device)
+        else:
+            self.kv_positions = None
         cache_shape = (max_batch_size, self.n_head, max_seq_len, self.n_state//self.n_head)
-        self.k_cache = torch.zeros(cache_shape, dtype=dtype, device=self.key.weight.device)
-        self.v_cache = torch.zeros(cache_shape, dtype=dtype, device=self.value.weight.device)
+        self.k_cache = torch.zeros(cache_shape, dtype=dtype, device=device)
+        self.v_cache = torch.zeros(cache_shape, dtype=dtype, device=device)
 
     def merge_linears(self, layers, mults):
         bias = [x.bias for x in layers if x.bias is not None][0]
@@ -104,10 +128,76 @@ class MultiHeadAttention(nn.Module):
         
     def split_heads(self, x, x_positions, rope=False, subsampling=1):
         x = x.view(*x.shape[:2], self.n_head, -1)
-        if rope:
+        if rope and self.long_rope:
+            cos, sin = self.rotary.at(x_positions * subsampling)
+            x = x * cos + rotate_half(x) * sin
+        elif rope:
             x = rope_rotate(x, x_positions * subsampling, *self.rotary(x))
         return x.permute(0, 2, 1, 3)
 
+    def project_kv(self, kvx, kv_positions):
+        """Returns the keys and values (split into heads) for `kvx`.
+
+        For cross-attention these only depend on the encoder output so they can be computed once and passed
+        to `forward` as `kv` for every decoding step."""
+        if self.kv:
+            k,v = self.kv(kvx).split(self.odim, dim=-1)
+        else:
+            k,v = self.key(kvx) * self.sqrt_qk_scale, self.value(kvx)
+        k = self.split_heads(k, kv_positions, rope = self.rotary, subsampling = self.key_subsampling)
+        v = self.split_heads(v, kv_positions)
+        return k, v
+
+    def update_kv_cache(self, k, v, positions, slots=None):
+        if slots is None and positions.dim() == 1:
+            self.k_cache[:k.shape[0],:,positions] = k
+            self.v_cache[:v.shape[0],:,positions] = v
+        else:
+            # every row writes to its own cache slot at its own positions
+            if slots is None: slots = torch.arange(k.shape[0], device=k.device)
+            if positions.dim() == 1: positions = positions.expand(k.shape[0], -1)
+            self.k_cache[slots[:,None],:,positions] = k.transpose(1,2)
+            self.v_cache[slots[:,None],:,positions] = v.transpose(1,2)
+
+    def window_kv(self, k, v, positions, q_positions):
+        """Returns the keys, values and the attention mask for the sliding window cache together with the new
+        entries and writes the new entries into the ring buffer (overwriting the oldest positions)."""
+        b = k.shape[0]
+        cached = self.kv_positions
+        ks = torch.cat([self.k_cache[:b], k], dim=2)
+        vs = torch.cat([self.v_cache[:b], v], dim=2)
+        # cached entries at or after the new positions are left over from an earlier sequence
+        valid = torch.cat([(cached >= 0) & (cached < positions[0]), torch.ones_like(positions, dtype=torch.bool)])
+        pos, q = torch.cat([cached, positions]), q_positions[:,None]
+        mask = valid & (pos <= q) & (pos > q - self.window)
+        n = min(self.window, positions.shape[0])
+        idx = positions[-n:] % self.window
+        self.k_cache[:b,:,idx] = k[:,:,-n:]
+        self.v_cache[:b,:,idx] = v[:,:,-n:]
+        self.kv_positions[idx] = positions[-n:]
+        return ks, vs, mask
+
+    def paged_kv(self, k, v, positions, slots=None):
+        """Writes the new keys and values into their pages and gathers the pages of every row (see `PagedKVCache`)."""
+        pool = self.paged.pool
+        if slots is None: slots = torch.arange(k.shape[0], device=k.device)
+        if positions.dim() == 1: positions = positions.expand(k.shape[0], -1)
+        table = self.block_table[slots]
+        pages = table.gather(1, positions // pool.page_size)
+        pool.k[pages,:,positions % pool.page_size] = k.transpose(1,2)
+        pool.v[pages,:,positions % pool.page_size] = v.transpose(1,2)
+        # only the pages of the longest sequence are read, the positions past the end of a row are masked
+        table = table[:,:self.paged.used]
+        k = pool.k[table].transpose(1,2).flatten(2,3)[:,:,:self.paged.max_seq_len]
+        v = pool.v[table].transpose(1,2).flatten(2,3)[:,:,:self.paged.max_seq_len]
+        return k, v
+
+    def select_kv_rows(self, rows):
+        """Moves the cache rows `rows` to the front (in place) so a smaller batch can continue decoding."""
+        if self.k_cache is None: return
+        self.k_cache[:len(rows)] = self.k_cache[rows]
+        self.v_cache[:len(rows)] = self.v_cache[rows]
+
     def forward(
         self,
         qx,
@@ -116,34 +206,52 @@ class MultiHeadAttention(nn.Module):
         kv_positions,
         causal = False,
         mask=None,
+        slots=None,
+        kv=None,
     ):
-        if self.k_cache is not None:
+        if self.k_cache is not None and slots is None and kv is None and self.paged is None:
             assert qx.shape[0] <= self.k_cache.shape[0], "please pass in a larger max_batch_size to setup_kv_cache"
         if self.qkv:
             q,k,v = self.qkv(qx).split(self.odim, dim=-1)
         elif self.kv:
             q = self.q(qx)
-            k,v = self.kv(kvx).split(self.odim, dim=-1)
+            if kv is None: k,v = self.kv(kvx).split(self.odim, dim=-1)
         else:
             q,k,v = None,None,None
         
         if q is None: q = self.query(qx) * self.sqrt_qk_scale
         q = self.split_heads(q, q_positions, rope = self.rotary, subsampling = self.query_subsampling)
 
-        if kvx is not self.cached_kvx:
+        if kv is not None:
+            k, v = kv
+        else:
             if k is None: k = self.key(kvx) * self.sqrt_qk_scale
             k = self.split_heads(k, kv_positions, rope = self.rotary, subsampling = self.key_subsampling)
             if v is None: v = self.value(kvx)
             v = self.split_heads(v, kv_positions)
-            if self.k_cache is not None:
-                self.k_cache[:k.shape[0],:,kv_positions] = k
-                self.v_cache[:v.shape[0],:,kv_positions] = v
-
-        if self.k_cache is not None:
-            k, v = self.k_cache[:k.shape[0]], self.v_cache[:v.shape[0]]
-
-        if mask is not None:
+            if self.k_cache is not None and self.window is None and self.paged is None:
+                self.update_kv_cache(k, v, kv_positions, slots)
+
+        if self.paged is not None and kv is None:
+            k, v = self.paged_kv(k, v, kv_positions, slots)
+        elif self.window is not None and kv is None:
+            assert slots is None and kv_positions.dim() == 1, "the sliding window cache needs positions shared by the whole batch"
+            k, v, mask = self.window_kv(k, v, kv_positions, q_positions)
+        elif self.k_cache is not None and kv is None:
+            if slots is None:
+                k, v = self.k_cache[:qx.shape[0]], self.v_cache[:qx.shape[0]]
+            else:
+                k, v = self.k_cache[slots], self.v_cache[slots]
+            if self.trim_kv and not self.cross and q_positions.dim() == 1:
+                kv_len = int(q_positions[-1]) + 1
+                k, v = k[:,:,:kv_len], v[:,:,:kv_len]
+                # a single query at the end of the sequence can see every cached position
+                if q.shape[-2] == 1: mask = None
+
+        if mask is not None and self.window is None:
             mask = mask[q_positions,:k.shape[-2]]
+            # per-row positions give us a separate mask for every row
+            if mask.dim() == 3: mask = mask.unsqueeze(1)
             
         wv = F.scaled_dot_product_attention(q, k, v, attn_mask=mask, dropout_p=0, is_causal=causal)
         
@@ -176,6 +284,13 @@ class Rotary(torch.nn.Module):
             self.sin_cached = emb.sin()[None, :, None, :]
         return self.cos_cached, self.sin_cached
 
+    def at(self, positions):
+        """Returns the rotations for arbitrary `positions` (computed directly, without the cached table)."""
+        # always in float32, the large positions would lose too much precision in float16
+        freqs = positions.float()[..., None] * self.inv_freq.float()
+        emb = torch.cat((freqs, freqs), dim=-1)[..., None, :]
+        return emb.cos().to(self.inv_freq.dtype), emb.sin().to(self.inv_freq.dtype)
+
 
 # rotary pos emb helpers:
 def rotate_half(x):
@@ -185,7 +300,8 @@ def rotate_half(x):
     )
 
 def rope_rotate(x, positions, cos, sin):
-    return x * cos[:,positions] + rotate_half(x) * sin[:,positions]
+    # positions can be shared by the whole batch ([T]) or specific to every row ([B, T])
+    return x * cos[0,positions] + rotate_half(x) * sin[0,positions]
 
 # %% ../nbs/A. Neural modules.ipynb 7
 class ResidualAttentionBlock(nn.Module):
@@ -206,10 +322,12 @@ class ResidualAttentionBlock(nn.Module):
         )
         self.mlp_ln = LayerNorm(n_state)
     
-    def setup_kv_cache(self, max_batch_size, max_seq_len, max_cross_seq_len=None):
-        self.attn.setup_kv_cache(max_batch_size, max_seq_len)
-        if self.cross_attn:
-            self.cross_attn.setup_kv_cache(max_batch_size, max_cross_seq_len)
+    def setup_kv_cache(self, max_batch_size, max_seq_len, window=None, dtype=torch.float32):
+        # the LayerNorms are never quantized so they always know the device
+        device = self.attn_ln.weight.device
+        # the cross-attention keys and values are computed once per request and passed in
+        # (see `BaseDecoder.project_cross_kv`) so only the self-attention needs a cache
+        self.attn.setup_kv_cache(max_batch_size, max_seq_len, dtype=dtype, device=device, window=window)
     
     def forward(
         self,
@@ -219,12 +337,14 @@ class ResidualAttentionBlock(nn.Module):
         xa_positions: Optional[Tensor] = None,
         causal = False,
         mask=None,
+        slots=None,
+        xa_kv=None,
     ):
         lnx = self.attn_ln(x)
-        x = x + self.attn(lnx, x_positions, lnx, x_positions, causal=causal, mask=mask)
+        x = x + self.attn(lnx, x_positions, lnx, x_positions, causal=causal, mask=mask, slots=slots)
         if self.cross_attn:
             lnx = self.cross_attn_ln(x)
-            x = x + self.cross_attn(lnx, x_positions, xa, xa_positions)
+            x = x + self.cross_attn(lnx, x_positions, xa, xa_positions, slots=slots, kv=xa_kv)
         x = x + self.mlp(self.mlp_ln(x))
         return x
 
@@ -245,14 +365,108 @@ class BaseDecoder(nn.Module):
         mask = torch.empty(length, length).fill_(-torch.inf).triu_(1)
         self.register_buffer("mask", mask, persistent=False)
 
-    def forward(self, x, x_positions, xenc, xenc_positions):
+    def project_cross_kv(self, xenc, xenc_positions):
+        """Precomputes the cross-attention keys and values of every layer (see `MultiHeadAttention.project_kv`)."""
+        return [l.cross_attn.project_kv(xenc, xenc_positions) for l in self.layers]
+
+    def setup_kv_cache(self, max_batch_size=None):
+        """Replaces the self-attention KV caches with new ones of the same size, dtype and window (or for
+        `max_batch_size` sequences), e.g. in worker processes which share the weights but not the caches."""
+        for l in self.layers:
+            assert l.attn.k_cache is not None, "please call optimize on the model first"
+            b, _, n, _ = l.attn.k_cache.shape
+            l.setup_kv_cache(max_batch_size or b, n, window=l.attn.window, dtype=l.attn.k_cache.dtype)
+
+    def select_kv_rows(self, rows):
+        """Keeps only the batch `rows` in the KV caches (see `MultiHeadAttention.select_kv_rows`)."""
+        for l in self.layers:
+            l.attn.select_kv_rows(rows)
+            l.cross_attn.select_kv_rows(rows)
+
+    def forward(self, x, x_positions, xenc, xenc_positions, slots=None, cross_kv=None):
         for i,l in enumerate(self.layers):
-            x = l(x, x_positions, xenc, xenc_positions, causal=self.training, mask=self.mask if not self.training else None)
+            x = l(x, x_positions, xenc, xenc_positions, causal=self.training, mask=self.mask if not self.training else None, slots=slots,
+                  xa_kv=cross_kv[i] if cross_kv is not None else None)
 
         x = self.ln_post(x)
 
         return x
 
+class KVPagePool:
+    """Fixed size pages for the self-attention KV caches with a free-list allocator.
+
+    The pages can be shared by all the layers of several decoders (e.g. T2S and S2A, see `PagedKVCache`) as long as
+    they have the same number of heads and head width. Page 0 is never handed out, unused block table entries point to it."""
+    def __init__(self, n_pages, n_head, head_dim, page_size=16, dtype=torch.float32, device=None):
+        shape = (n_pages, n_head, page_size, head_dim)
+        self.k = torch.zeros(shape, dtype=dtype, device=device)
+        self.v = torch.zeros(shape, dtype=dtype, device=device)
+        self.page_size = page_size
+        self.free = list(range(n_pages - 1, 0, -1))
+
+    @property
+    def n_free(self):
+        return len(self.free)
+
+    def alloc(self, n):
+        if n > len(self.free): raise RuntimeError(f"out of KV cache pages ({n} needed, {len(self.free)} free)")
+        pages = self.free[len(self.free)-n:]
+        del self.free[len(self.free)-n:]
+        return pages
+
+    def release(self, pages):
+        self.free.extend(pages)
+
+class PagedKVCache:
+    """Block tables which map the self-attention KV caches of `decoder` onto pages from a `KVPagePool`.
+
+    Every row (batch slot) only holds the pages it needs for its current length (in every layer) so short sequences
+    do not reserve memory for the longest possible one. While `attached` the decoder uses these caches instead of
+    the dense ones from `setup_kv_cache`."""
+    def __init__(self, pool, decoder, max_batch_size, max_seq_len):
+        attn = decoder.layers[0].attn
+        assert pool.k.shape[1] == attn.n_head and pool.k.shape[3] == attn.n_state // attn.n_head, "the pages do not match the attention heads"
+        self.pool = pool
+        self.decoder = decoder
+        self.max_seq_len = max_seq_len
+        self.max_pages = -(-max_seq_len // pool.page_size)
+        self.tables = torch.zeros((len(decoder.layers), max_batch_size, self.max_pages), dtype=torch.long, device=pool.k.device)
+        self.owned = [[] for _ in range(max_batch_size)]
+        self.lengths = [0] * max_batch_size # pages (per layer) held by every row
+        self.used = 0
+
+    def pages_needed(self, length):
+        """Number of pages (in all the layers) a row of `length` positions takes."""
+        return len(self.decoder.layers) * min(-(-length // self.pool.page_size), self.max_pages)
+
+    def reserve(self, row, length):
+        """Makes sure the first `length` positions of `row` have pages in every layer."""
+        n, have = min(-(-length // self.pool.page_size), self.max_pages), self.lengths[row]
+        if n <= have: return
+        pages = self.pool.alloc(len(self.decoder.layers) * (n - have))
+        self.tables[:,row,have:n] = torch.tensor(pages).view(len(self.decoder.layers), n - have)
+        self.owned[row] += pages
+        self.lengths[row] = n
+        self.used = max(self.used, n)
+
+    def release(self, row):
+        self.pool.release(self.owned[row])
+        self.owned[row] = []
+        self.lengths[row] = 0
+        self.tables[:,row] = 0
+        self.used = max(self.lengths)
+
+    @contextmanager
+    def attached(self):
+        attns = [l.attn for l in self.decoder.layers]
+        for i, attn in enumerate(attns):
+            attn.paged, attn.block_table = self, self.tables[i]
+        try:
+            yield self
+        finally:
+            for attn in attns:
+                attn.paged = attn.block_table = None
+
 # %% ../nbs/A. Neural modules.ipynb 9
 class EmbeddingProjector(nn.Linear):
     pass
@@ -1,19 +1,73 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/7. Pipeline.ipynb.
 
 # %% auto 0
-__all__ = ['Pipeline']
+__all__ = ['split_text', 'crossfade_concat', 'Pipeline']
 
 # %% ../nbs/7. Pipeline.ipynb 1
 from os.path import expanduser
 import torch
+import torch.nn.functional as F
+from whisperspeech.inference import progress_bar
 from whisperspeech.t2s_up_wds_mlang_enclm import TSARTransformer
 from whisperspeech.s2a_delar_mup_wds_mlang import SADelARTransformer
 from whisperspeech.a2wav import Vocoder
 from whisperspeech import inference, s2a_delar_mup_wds_mlang_cond
+from whisperspeech.cache import TieredCache, AudioCache, content_hash, model_checksum
+import re
+import hashlib
+import unicodedata
 import traceback
+import threading
+import queue
 from pathlib import Path
 
 # %% ../nbs/7. Pipeline.ipynb 2
+def split_text(text, max_chars=180, max_bytes=270):
+    """Splits `text` into segments short enough for a single generation pass.
+
+    Sentences are packed together up to `max_chars` characters and `max_bytes` UTF-8 bytes, sentences
+    which are too long on their own are split at clause boundaries, then between words."""
+    def fits(s): return len(s) <= max_chars and len(s.encode('utf-8')) <= max_bytes
+
+    def split_long(s):
+        if fits(s): return [s]
+        for pattern in (r'(?<=[,;:])\s+', r'\s+'):
+            parts = re.split(pattern, s)
+            if len(parts) > 1: return pack(parts)
+        segments = []
+        while s:
+            cut = min(len(s), max_chars)
+            while cut > 1 and not fits(s[:cut]): cut -= 1
+            segments.append(s[:cut])
+            s = s[cut:]
+        return segments
+
+    def pack(parts):
+        segments, cur = [], ''
+        for part in parts:
+            for piece in split_long(part):
+                joined = f'{cur} {piece}' if cur else piece
+                if fits(joined):
+                    cur = joined
+                else:
+                    if cur: segments.append(cur)
+                    cur = piece
+        if cur: segments.append(cur)
+        return segments
+
+    sentences = [' '.join(x.split()) for x in re.split(r'(?<=[.!?…。！？])\s+|\n\s*\n', text.strip())]
+    return pack([x for x in sentences if x])
+
+def crossfade_concat(chunks, overlap):
+    """Concatenates audio chunks cross-fading `overlap` samples at each seam."""
+    out = chunks[0]
+    for chunk in chunks[1:]:
+        n = min(overlap, out.shape[-1], chunk.shape[-1])
+        fade = torch.linspace(0, 1, n, device=chunk.device, dtype=chunk.dtype)
+        seam = out[...,out.shape[-1]-n:] * (1 - fade) + chunk[...,:n] * fade
+        out = torch.cat([out[...,:out.shape[-1]-n], seam, chunk[...,n:]], dim=-1)
+    return out
+
 class Pipeline:
     default_speaker = torch.tensor(
        [-0.2929, -0.4503,  0.4155, -0.1417,  0.0473, -0.1624, -0.2322,  0.7071,
@@ -42,18 +96,50 @@ class Pipeline:
          0.2702,  0.1699, -0.1443, -0.9614,  0.3261,  0.1718,  0.3545, -0.0686]
     )
     
-    def __init__(self, t2s_ref=None, s2a_ref=None, optimize=True, torch_compile=False, device=None, cache_dir=None):
+    def __init__(self, t2s_ref=None, s2a_ref=None, optimize=True, torch_compile=False, device=None, cache_dir=None, max_batch_size=1,
+                 speaker_cache_dir=None, stoks_cache=None, atoks_cache=None, audio_cache=None, num_threads=None,
+                 quantize=None, t2s_draft_ref=None, draft_tokens=4, s2a_draft_ref=None, frames_per_step=4,
+                 s2a_window=None):
+        assert not (s2a_window and s2a_draft_ref), "the S2A draft model cannot be used with an s2a_window"
         if device is None: device = inference.get_compute_device()
+        # on the CPU every decoding step is a few small matmuls so it helps to match the threads to the available cores
+        if num_threads is not None: torch.set_num_threads(num_threads)
         self.device = device
+        self.max_batch_size = max_batch_size
         args = dict(device = device, cache_dir=cache_dir)
         try:
             if t2s_ref:
                 args["ref"] = t2s_ref
             self.t2s = TSARTransformer.load_model(**args)  # use obtained compute device
-            if optimize: self.t2s.optimize(torch_compile=torch_compile)
+            if optimize: self.t2s.optimize(max_batch_size=max_batch_size, torch_compile=torch_compile, quantize=quantize)
         except:
             print("Failed to load the T2S model:")
             print(traceback.format_exc())
+        # an optional small T2S model for speculative decoding (see `TSARTransformer.generate_speculative`)
+        self.t2s_draft = None
+        self.draft_tokens = draft_tokens
+        if t2s_draft_ref:
+            try:
+                t2s_draft = TSARTransformer.load_model(ref=t2s_draft_ref, device=device, cache_dir=cache_dir)
+                if optimize: t2s_draft.optimize(max_batch_size=max_batch_size, torch_compile=False, quantize=quantize)
+                self.t2s_draft = t2s_draft
+            except:
+                print("Failed to load the T2S draft model:")
+                print(traceback.format_exc())
+        # and the same for S2A (see `SADelARTransformer.generate_speculative`)
+        self.s2a_draft = None
+        self.frames_per_step = frames_per_step
+        if s2a_draft_ref:
+            try:
+                spec = inference.load_model(ref=s2a_draft_ref, device=device, cache_dir=cache_dir)
+                cond = any(k.startswith('cond_embeddings.') for k in spec['state_dict'])
+                cls = s2a_delar_mup_wds_mlang_cond.SADelARTransformer if cond else SADelARTransformer
+                s2a_draft = cls.load_model(spec=spec, device=device)
+                if optimize: s2a_draft.optimize(max_batch_size=max_batch_size, torch_compile=False, quantize=quantize)
+                self.s2a_draft = s2a_draft
+            except:
+                print("Failed to load the S2A draft model:")
+                print(traceback.format_exc())
         args = dict(device = device, cache_dir=cache_dir)
         try:
             if s2a_ref:
@@ -67,18 +153,68 @@ class Pipeline:
             else:
                 cls = SADelARTransformer
             self.s2a = cls.load_model(**args)  # use obtained compute device
-            if optimize: self.s2a.optimize(torch_compile=torch_compile)
+            if optimize: self.s2a.optimize(max_batch_size=max_batch_size, torch_compile=torch_compile, quantize=quantize, kv_window=s2a_window)
         except:
             print("Failed to load the S2A model:")
             print(traceback.format_exc())
 
+        # with a sliding window KV cache S2A can generate past its 30 second context (see `generate_long`)
+        self.s2a_window = s2a_window if optimize else None
         self.vocoder = Vocoder(device=device)
         self.encoder = None
+        self.spk_cache = TieredCache(speaker_cache_dir)
+        self.speakers = {}
+        # seeded results: None keeps them in memory, a path adds a disk cache, False disables it
+        self.stoks_cache = self.make_cache(stoks_cache, mmap=True)
+        self.atoks_cache = self.make_cache(atoks_cache)
+        # the final audio is only cached on disk (as FLAC) if you pass a path
+        self.audio_cache = AudioCache(audio_cache) if isinstance(audio_cache, (str, Path)) else audio_cache
+        self.checksums = {}
 
-    def extract_spk_emb(self, fname):
-        """Extracts a speaker embedding from the first 30 seconds of the give audio file.
-        """
-        import torchaudio
+    @staticmethod
+    def make_cache(cache, **kwargs):
+        if cache is None: return TieredCache()
+        if isinstance(cache, (str, Path)): return TieredCache(cache, **kwargs)
+        return cache if cache is not False else None
+
+    def checksum(self, name):
+        if name not in self.checksums:
+            model = self.vocoder.vocos if name == 'vocoder' else getattr(self, name)
+            self.checksums[name] = model_checksum(model)
+        return self.checksums[name]
+
+    def cache_key(self, cache, kind, text, lang='en', cps=15, seed=None, speaker=None):
+        """Returns the key for a seeded `kind` ('stoks', 'atoks' or 'audio') result, it covers all the inputs
+        and the weights of every model involved. Returns None if the result should not be cached."""
+        if seed is None or cache is None: return None
+        models = dict(stoks=['t2s'], atoks=['t2s', 's2a'], audio=['t2s', 's2a', 'vocoder'])[kind]
+        # speculative decoding samples from the same distribution but gives different results for the same seed
+        if self.t2s_draft is not None: models = ['t2s_draft'] + models
+        if self.s2a_draft is not None and kind != 'stoks': models = ['s2a_draft'] + models
+        parts = [kind] + [self.checksum(m) for m in models]
+        if speaker is not None: parts.append(hashlib.sha256(speaker.detach().float().cpu().numpy().tobytes()).hexdigest()[:16])
+        text = " ".join(unicodedata.normalize('NFC', text).split())
+        return ':'.join(parts + [str(lang), str(cps), str(seed), text])
+
+    def cache_stats(self):
+        """Returns the hit/miss counters and sizes of all the caches."""
+        caches = dict(speakers=self.spk_cache, stoks=self.stoks_cache, atoks=self.atoks_cache, audio=self.audio_cache)
+        return {name: cache.stats() for name, cache in caches.items() if hasattr(cache, 'stats')}
+
+    def share_memory(self):
+        """Moves all the model weights into shared memory so worker processes forked afterwards use the same
+        copy (see `server.SynthesisProcessPool`). Every worker then calls `setup_kv_cache` to get its own KV caches."""
+        for m in [self.t2s, self.t2s_draft, self.s2a, self.s2a_draft, self.vocoder.vocos]:
+            if m is not None: m.share_memory()
+        if self.encoder is not None: self.encoder.mods.share_memory()
+        return self
+
+    def setup_kv_cache(self):
+        """Replaces the KV caches of all the models with new ones (of the same sizes)."""
+        for m in [self.t2s, self.t2s_draft, self.s2a, self.s2a_draft]:
+            if m is not None: m.decoder.setup_kv_cache()
+
+    def load_spk_encoder(self):
         if self.encoder is None:
             device = self.device
             if device == 'mps': device = 'cpu' # operator 'aten::_fft_r2c' is not currently implemented for the MPS device
@@ -86,27 +222,288 @@ class Pipeline:
             self.encoder = EncoderClassifier.from_hparams("speechbrain/spkrec-ecapa-voxceleb",
                                                           savedir=expanduser("~/.cache/speechbrain/"),
                                                           run_opts={"device": device})
+        return self.encoder
+
+    def load_spk_audio(self, fname, max_seconds=30):
+        """Loads the first `max_seconds` of an audio file as mono, 16kHz samples for the speaker encoder."""
+        import torchaudio
+        encoder = self.load_spk_encoder()
         audio_info = torchaudio.info(fname)
         actual_sample_rate = audio_info.sample_rate
-        num_frames = actual_sample_rate * 30 # specify 30 seconds worth of frames
+        num_frames = actual_sample_rate * max_seconds # specify max_seconds worth of frames
         samples, sr = torchaudio.load(fname, num_frames=num_frames)
         samples = samples[:, :num_frames]
-        samples = self.encoder.audio_normalizer(samples[0], sr)
-        spk_emb = self.encoder.encode_batch(samples.unsqueeze(0))
-        
-        return spk_emb[0,0].to(self.device)
+        return encoder.audio_normalizer(samples[0], sr)
+
+    def extract_spk_emb(self, fname, max_seconds=30):
+        """Extracts a speaker embedding from the first `max_seconds` of the given audio file.
+
+        The embeddings are cached by the file contents in memory (and on disk if `speaker_cache_dir` was given).
+        """
+        key = f'spk:{content_hash(fname)}:{max_seconds}'
+        spk_emb = self.spk_cache.get(key)
+        if spk_emb is None:
+            samples = self.load_spk_audio(fname, max_seconds)
+            spk_emb = self.spk_cache.put(key, self.load_spk_encoder().encode_batch(samples.unsqueeze(0))[0,0].cpu())
+        return spk_emb.to(self.device)
+
+    def extract_spk_embs(self, fnames, max_seconds=30, batch_size=32, num_workers=8, show_progress_bar=True):
+        """Extracts speaker embeddings for many audio files at once.
+
+        The files are decoded in a thread pool and the speaker encoder runs on padded batches of `batch_size`
+        clips (with `wav_lens` masking out the padding). Returns a tensor of shape `[len(fnames), spk_width]`."""
+        from concurrent.futures import ThreadPoolExecutor
+        encoder = self.load_spk_encoder()
+        keys = [f'spk:{content_hash(fname)}:{max_seconds}' for fname in fnames]
+        embs = [self.spk_cache.get(key) for key in keys]
+        todo = [i for i,emb in enumerate(embs) if emb is None]
+        batches = [todo[i:i+batch_size] for i in range(0, len(todo), batch_size)]
+        with ThreadPoolExecutor(num_workers) as pool:
+            def load(batch): return [pool.submit(self.load_spk_audio, fnames[i], max_seconds) for i in batch]
+            pending = load(batches[0]) if batches else []
+            for n in (progress_bar(range(len(batches))) if show_progress_bar else range(len(batches))):
+                batch, samples = batches[n], [x.result() for x in pending]
+                # decode the next batch while the encoder runs on this one
+                if n + 1 < len(batches): pending = load(batches[n+1])
+                lens = torch.tensor([len(x) for x in samples])
+                samples = torch.stack([F.pad(x, (0, lens.max() - len(x))) for x in samples])
+                with torch.no_grad():
+                    batch_embs = encoder.encode_batch(samples, wav_lens=lens.float() / lens.max())[:,0].cpu()
+                for i, emb in zip(batch, batch_embs):
+                    embs[i] = self.spk_cache.put(keys[i], emb.clone())
+        return torch.stack(embs).to(self.device)
+
+    def register_speaker(self, name, speaker):
+        """Registers a voice (an audio file or a speaker embedding) under `name` so it can later be used as `speaker=name`.
+
+        With a `speaker_cache_dir` the registration is also saved to disk."""
+        spk_emb = self.get_speaker(speaker)
+        self.speakers[name] = spk_emb
+        if self.spk_cache.disk is not None: self.spk_cache.disk.put(f'name:{name}', spk_emb)
+        return spk_emb
         
-    def generate_atoks(self, text, speaker=None, lang='en', cps=15, step_callback=None):
-        if speaker is None: speaker = self.default_speaker
-        elif isinstance(speaker, (str, Path)): speaker = self.extract_spk_emb(speaker)
+    def get_speaker(self, speaker=None):
+        """Returns the speaker embedding for a `speaker` given as an embedding, a registered name or an audio file path."""
+        if speaker is None: return self.default_speaker
+        if isinstance(speaker, str):
+            if speaker in self.speakers: return self.speakers[speaker]
+            if self.spk_cache.disk is not None and f'name:{speaker}' in self.spk_cache.disk:
+                self.speakers[speaker] = self.spk_cache.disk.get(f'name:{speaker}').to(self.device)
+                return self.speakers[speaker]
+        if isinstance(speaker, (str, Path)): return self.extract_spk_emb(speaker)
+        return speaker
+
+    def generate_stoks(self, text, lang='en', cps=15, seed=None, step_callback=None):
+        """Generates the semantic tokens for `text`.
+
+        Sampling is deterministic when a `seed` is given so these results are reused from `stoks_cache`."""
+        key = self.cache_key(self.stoks_cache, 'stoks', text, lang, cps, seed)
+        stoks = self.stoks_cache.get(key) if key else None
+        if stoks is None:
+            if seed is not None: torch.manual_seed(seed)
+            if self.t2s_draft is not None:
+                stoks = self.t2s.generate_speculative(self.t2s_draft, text, cps=cps, lang=lang, k=self.draft_tokens, step=step_callback)[0]
+            else:
+                stoks = self.t2s.generate(text, cps=cps, lang=lang, step=step_callback)[0]
+            if key: self.stoks_cache.put(key, stoks.cpu())
+        return stoks.to(self.device)
+
+    def cached_stoks_stream(self, stoks, key):
+        """Passes through a stream of semantic tokens and saves the whole sequence in `stoks_cache` at the end."""
+        toks = []
+        for x in stoks:
+            toks.append(x)
+            yield x
+        if key and toks: self.stoks_cache.put(key, torch.cat(toks).cpu())
+
+    def generate_stoks_async(self, text, lang='en', cps=15, stop=None):
+        """Runs T2S in a background thread, returns an iterator over the semantic tokens as they are generated.
+
+        The thread quits after the current step once the `stop` event is set. This happens when the iterator
+        is exhausted, closed or garbage collected."""
+        q = queue.Queue()
+        if stop is None: stop = threading.Event()
+        def worker():
+            try:
+                for toks in self.t2s.generate_stream(text, cps=cps, lang=lang):
+                    if stop.is_set(): break
+                    q.put(toks)
+            except Exception as e:
+                q.put(e)
+            q.put(None)
+        threading.Thread(target=worker, daemon=True).start()
+        try:
+            while True:
+                toks = q.get()
+                if toks is None: return
+                if isinstance(toks, Exception): raise toks
+                yield toks
+        finally:
+            stop.set()
+
+    def get_stoks(self, text, lang='en', cps=15, seed=None, step_callback=None, lookahead=None, stop=None):
+        # with `lookahead` (and no cached result) we return an iterator over the tokens as they are generated
+        key = self.cache_key(self.stoks_cache, 'stoks', text, lang, cps, seed)
+        if lookahead is not None and not (key and key in self.stoks_cache):
+            if seed is not None: torch.manual_seed(seed)
+            return self.cached_stoks_stream(self.generate_stoks_async(text, lang=lang, cps=cps, stop=stop), key)
+        stoks = self.generate_stoks(text, lang=lang, cps=cps, seed=seed, step_callback=step_callback)
+        # reseed so S2A samples the same tokens no matter if T2S ran or not
+        if seed is not None: torch.manual_seed(seed)
+        return stoks
+
+    def generate_atoks(self, text, speaker=None, lang='en', cps=15, step_callback=None, lookahead=None, seed=None):
+        """Generates the acoustic tokens for `text`.
+
+        If `lookahead` is given S2A starts decoding as soon as it has `lookahead` semantic tokens
+        of context (see `SADelARTransformer.generate_stream`) while T2S is still running.
+
+        With a `seed` the sampling is reproducible and repeated requests are served from `stoks_cache` and `atoks_cache`
+        (with `lookahead` T2S and S2A run concurrently so the results are not reproducible and only the semantic tokens are cached)."""
+        speaker = self.get_speaker(speaker)
         text = text.replace("\n", " ")
-        stoks = self.t2s.generate(text, cps=cps, lang=lang, step=step_callback)[0]
-        atoks = self.s2a.generate(stoks, speaker.unsqueeze(0), step=step_callback)
+        key = self.cache_key(self.atoks_cache, 'atoks', text, lang, cps, seed, speaker)
+        atoks = self.atoks_cache.get(key) if key else None
+        if atoks is not None: return atoks.to(self.device, torch.long)
+        stoks = self.get_stoks(text, lang=lang, cps=cps, seed=seed, step_callback=step_callback, lookahead=lookahead)
+        if lookahead is not None:
+            chunks = self.s2a.generate_stream(stoks, speaker, lookahead=lookahead, chunk_frames=self.s2a.ctx_n, step=step_callback)
+            return torch.cat(list(chunks), dim=-1)
+        if self.s2a_window and len(stoks) * 3 >= self.s2a.ctx_n:
+            atoks = self.s2a.generate_long(stoks, speaker, step=step_callback)
+        elif self.s2a_draft is not None:
+            atoks = self.s2a.generate_speculative(self.s2a_draft, stoks, speaker.unsqueeze(0), frames_per_step=self.frames_per_step, step=step_callback)
+        else:
+            atoks = self.s2a.generate(stoks, speaker.unsqueeze(0), step=step_callback)
+        # the codes are < 1024 so we can store them compactly
+        if key: self.atoks_cache.put(key, atoks.to(torch.int16).cpu())
         return atoks
+
+    def get_cached_audio(self, text, speaker=None, lang='en', cps=15, seed=None):
+        key = self.cache_key(self.audio_cache, 'audio', text.replace("\n", " "), lang, cps, seed, self.get_speaker(speaker))
+        return key, (self.audio_cache.get(key) if key else None)
         
-    def generate(self, text, speaker=None, lang='en', cps=15, step_callback=None):
-        return self.vocoder.decode(self.generate_atoks(text, speaker, lang=lang, cps=cps, step_callback=step_callback))
+    def generate(self, text, speaker=None, lang='en', cps=15, step_callback=None, lookahead=None, seed=None):
+        key, audio = self.get_cached_audio(text, speaker, lang=lang, cps=cps, seed=seed)
+        if audio is not None: return audio.to(self.vocoder.device)
+        audio = self.vocoder.decode(self.generate_atoks(text, speaker, lang=lang, cps=cps, step_callback=step_callback, lookahead=lookahead, seed=seed))
+        if key and lookahead is None: self.audio_cache.put(key, audio)
+        return audio
     
+    def generate_stream(self, text, speaker=None, lang='en', cps=15, chunk_frames=25, step_callback=None, lookahead=None, seed=None):
+        """Yields the audio in chunks while it is being generated, the first chunk is available
+        after about `chunk_frames` acoustic frames (at 75 frames per second) instead of after the whole utterance.
+
+        With `lookahead` S2A also overlaps with T2S (see `generate_atoks`). Cached results are returned in a single chunk."""
+        _, audio = self.get_cached_audio(text, speaker, lang=lang, cps=cps, seed=seed)
+        if audio is not None:
+            yield audio.to(self.vocoder.device)
+            return
+        speaker = self.get_speaker(speaker)
+        text = text.replace("\n", " ")
+        key = self.cache_key(self.atoks_cache, 'atoks', text, lang, cps, seed, speaker)
+        atoks = self.atoks_cache.get(key) if key else None
+        if atoks is not None:
+            yield self.vocoder.decode(atoks.to(self.device, torch.long))
+            return
+        # stops the background T2S thread (with `lookahead`) as soon as the consumer stops reading the audio
+        stop = threading.Event()
+        try:
+            stoks = self.get_stoks(text, lang=lang, cps=cps, seed=seed, step_callback=step_callback, lookahead=lookahead, stop=stop)
+            atoks = self.s2a.generate_stream(stoks, speaker, chunk_frames=chunk_frames, lookahead=lookahead or 0, step=step_callback)
+            yield from self.vocoder.decode_stream(atoks)
+        finally:
+            stop.set()
+
+    def generate_atoks_batch(self, texts, speakers=None, langs='en', cps=15, step_callback=None):
+        """Generates acoustic tokens for many texts at once, `speakers`, `langs` and `cps` can be lists with
+        one value per text or single values shared by all of them.
+
+        The texts are processed in batches of `max_batch_size` (as passed to the constructor)."""
+        n = len(texts)
+        if not isinstance(speakers, (list, tuple)): speakers = [speakers] * n
+        if isinstance(langs, str): langs = [langs] * n
+        if not isinstance(cps, (list, tuple)): cps = [cps] * n
+        texts = [text.replace("\n", " ") for text in texts]
+        speakers = [self.get_speaker(s).to(self.device) for s in speakers]
+
+        atoks = []
+        for i in range(0, n, self.max_batch_size):
+            chunk = slice(i, i + self.max_batch_size)
+            stoks = self.t2s.generate_batch(texts[chunk], cps=cps[chunk], lang=langs[chunk], step=step_callback)
+            atoks += self.s2a.generate_batch(stoks, torch.stack(speakers[chunk]), step=step_callback)
+        return atoks
+
+    def generate_batch(self, texts, speakers=None, langs='en', cps=15, step_callback=None):
+        """Synthesizes many texts in batches, returns a list of waveforms."""
+        atoks = self.generate_atoks_batch(texts, speakers, langs=langs, cps=cps, step_callback=step_callback)
+        audio = []
+        for i in range(0, len(atoks), self.max_batch_size):
+            audio += self.vocoder.decode_batch(atoks[i:i+self.max_batch_size])
+        return audio
+
+    def generate_long(self, text, speaker=None, lang='en', cps=15, max_seconds=12, context=True, crossfade=0.05, step_callback=None):
+        """Synthesizes a text of any length.
+
+        The text is split into segments of at most `max_seconds` (estimated from `cps`) which are generated in batches
+        of `max_batch_size`. With `context` the first segment is generated on its own and used as a prompt
+        (its text and semantic tokens for T2S, its semantic and acoustic tokens for S2A) for all the others
+        to keep the voice and prosody consistent. The segments are joined with a `crossfade` (in seconds).
+        The prompt and every segment have to fit in the S2A (and T2S) context together so with `context` the segments
+        are limited to half of it (15 seconds for the released models). Without `context` the segments are generated
+        independently so we put `crossfade` seconds of silence between them instead of overlapping them.
+
+        With an `s2a_window` (see the constructor) only T2S works in segments. Their semantic tokens are joined
+        and S2A generates the whole text in one go so the audio needs no crossfades."""
+        speaker = self.get_speaker(speaker).to(self.device)
+        # the most semantic tokens S2A can take in one go (it generates 3 acoustic frames per semantic token)
+        max_stoks = min(self.s2a.ctx_n // 3, self.s2a.stoks_len) - 1
+        if context and not self.s2a_window: max_seconds = min(max_seconds, max_stoks // 2 / 25)
+        # with `context` T2S gets the text of the first segment in front of every other one
+        max_bytes = self.t2s.ttoks_len - 2
+        if context: max_bytes = max_bytes // 2 - 1
+        segments = split_text(text, max_chars=int(cps * max_seconds), max_bytes=max_bytes)
+        if not segments: return torch.zeros((1, 0))
+        if self.s2a_window: return self.generate_long_windowed(segments, speaker, lang=lang, cps=cps, context=context, step_callback=step_callback)
+
+        # the estimate from `cps` is only a guess so we also cap the lengths of the generated semantic tokens
+        N = max_stoks // 2 + 1 if context else None
+        stoks0 = self.t2s.generate_batch(segments[:1], cps=cps, lang=lang, N=N, step=step_callback)[0]
+        atoks = self.s2a.generate_batch([stoks0], speaker.unsqueeze(0), step=step_callback)
+        atoks0 = atoks[0]
+        rest = segments[1:]
+        for i in range(0, len(rest), self.max_batch_size):
+            chunk = rest[i:i+self.max_batch_size]
+            speakers = speaker.expand(len(chunk), -1)
+            if context:
+                stoks = self.t2s.generate_batch([f'{segments[0]} {x}' for x in chunk], cps=cps, lang=lang, stoks_prompt=stoks0,
+                                                N=min(max_stoks + 1, self.t2s.stoks_len), step=step_callback)
+                stoks = [torch.cat([stoks0, x]) for x in stoks]
+                # the prompt is aligned with the semantic tokens so we drop exactly 3 acoustic frames per semantic token
+                atoks += [x[:,3*len(stoks0):] for x in self.s2a.generate_batch(stoks, speakers, atoks_prompt=atoks0, step=step_callback)]
+            else:
+                stoks = self.t2s.generate_batch(chunk, cps=cps, lang=lang, step=step_callback)
+                atoks += self.s2a.generate_batch(stoks, speakers, step=step_callback)
+
+        audio = []
+        for i in range(0, len(atoks), self.max_batch_size):
+            audio += self.vocoder.decode_batch(atoks[i:i+self.max_batch_size])
+        if context: return crossfade_concat(audio, int(crossfade * 24000))
+        silence = audio[0].new_zeros(audio[0].shape[:-1] + (int(crossfade * 24000),))
+        return torch.cat([x for a in audio for x in (silence, a)][1:], dim=-1)
+
+    def generate_long_windowed(self, segments, speaker, lang='en', cps=15, context=True, step_callback=None):
+        stoks = self.t2s.generate_batch(segments[:1], cps=cps, lang=lang, step=step_callback)
+        stoks0, rest = stoks[0], segments[1:]
+        for i in range(0, len(rest), self.max_batch_size):
+            chunk = rest[i:i+self.max_batch_size]
+            if context:
+                stoks += self.t2s.generate_batch([f'{segments[0]} {x}' for x in chunk], cps=cps, lang=lang, stoks_prompt=stoks0, step=step_callback)
+            else:
+                stoks += self.t2s.generate_batch(chunk, cps=cps, lang=lang, step=step_callback)
+        atoks = self.s2a.generate_long(torch.cat(stoks), speaker, step=step_callback)
+        return self.vocoder.decode(atoks)
+
     def generate_to_file(self, fname, text, speaker=None, lang='en', cps=15, step_callback=None):
         self.vocoder.decode_to_file(fname, self.generate_atoks(text, speaker, lang=lang, cps=cps, step_callback=None))
         
@@ -17,12 +17,11 @@ import torch.nn.functional as F
 import numpy as np
 from torch.profiler import profile, record_function, ProfilerActivity, schedule
 from fastcore.basics import store_attr
-from huggingface_hub import hf_hub_download
 
 # %% ../nbs/4B. Multi-language semantic to acoustic token modeling.ipynb 3
 from pathlib import Path
 import json
-from fastprogress import progress_bar, master_bar
+from .inference import progress_bar
 
 # %% ../nbs/4B. Multi-language semantic to acoustic token modeling.ipynb 4
 from . import inference
@@ -283,6 +282,8 @@ class SADelARTransformer(nn.Module):
                                      ffn_mult=ffn_mult, depth=decoder_depth,
                                      rope=tunables.rope)
         self.head = DelSumHead(n_head=n_head, head_width=head_width, quantizers=quantizers)
+        self.quantized = None
+        self.kv_window = None
         for l in self.decoder.layers:
             l.cross_attn.key_subsampling = 3
         
@@ -347,11 +348,11 @@ class SADelARTransformer(nn.Module):
         for l in self.encoder: x = l(x, positions, causal=self.tunables.causal_encoder)
         return self.ln_post(x)
     
-    def run_encoder(self, Stoks, speakers):
+    def run_encoder(self, Stoks, speakers, offset=0):
         semb = self.embed_stoks(Stoks)
         with record_function("encoder"):
             if self.positional_embeddings is not None: semb = semb + self.positional_embeddings
-            positions = torch.arange(0, semb.shape[1], device=semb.device)
+            positions = torch.arange(offset, offset + semb.shape[1], device=semb.device)
             xenc = self._encoder(semb, positions)
         if self.training and self.tunables.causal_encoder:
             enc_logits = (self.hidden_to_emb(xenc) @ self.semantic_embedding.weight.to(xenc.dtype).T).float()
@@ -363,14 +364,14 @@ class SADelARTransformer(nn.Module):
         if self.spk_factor: spk_embs = self.spk_to_hidden(spk_embs)
         return xenc + spk_embs.unsqueeze(1), positions, enc_logits
 
-    def forward(self, Stoks, Atoks, speakers, langs=None, out_stoks=None, out_atoks=None, noloss=False, xenc=None, xenc_positions=None, atoks_positions=None):
+    def forward(self, Stoks, Atoks, speakers, langs=None, out_stoks=None, out_atoks=None, noloss=False, xenc=None, xenc_positions=None, atoks_positions=None, slots=None, cross_kv=None):
         if xenc is None:
             Stoks, Atoks = [x.to(dtype=torch.long) for x in (Stoks, Atoks)]
             xenc, xenc_positions, enc_logits = self.run_encoder(Stoks, speakers)
         with record_function("decoder"):
             embs = self.embds(Atoks, xenc)
             if atoks_positions is None: atoks_positions = torch.arange(0, embs.shape[1], device=embs.device)
-            x = self.decoder(embs, atoks_positions, xenc, xenc_positions)
+            x = self.decoder(embs, atoks_positions, xenc, xenc_positions, slots=slots, cross_kv=cross_kv)
             logits = self.head(x, embeddings=self.embds.embeddings)
             logits *= self.tunables.output_mult / (self.width / self.base_width)
             
@@ -418,12 +419,16 @@ class SADelARTransformer(nn.Module):
             else:
                 local_filename = ref
         if not local_filename and spec is None:
+            from huggingface_hub import hf_hub_download
             local_filename = hf_hub_download(repo_id=repo_id, filename=filename, cache_dir=cache_dir)
         if spec is None:
-            spec = torch.load(local_filename, map_location=device)
+            spec = inference.load_spec(local_filename, device)
         if '_extra_state' not in spec['state_dict'] and 'speaker_map' in spec['config']: spec['state_dict']['_extra_state'] = { 'speaker_map': spec['config']['speaker_map'] }
         model = cls(**spec['config'], tunables=Tunables(**Tunables.upgrade(spec['tunables'])))
-        model.load_state_dict(spec['state_dict'])
+        if spec.get('quantized'):
+            model.convert_for_eval()
+            model.quantize(spec['quantized'])
+        model.load_state_dict(spec['state_dict'], assign=spec.get('mmap', False))
         model.eval().to(device)
         return model
     
@@ -445,9 +450,16 @@ class SADelARTransformer(nn.Module):
         return self
     
     def save_model(self, fname):
-        torch.save(dict(config = self.__stored_args__,
-                        tunables = dataclasses.asdict(self.tunables),
-                        state_dict = self.state_dict()), fname)
+        """Saves the model, a `fname` ending in `.safetensors` selects the memory-mappable format (see `inference.load_safetensors`)."""
+        spec = dict(config = self.__stored_args__,
+                    tunables = dataclasses.asdict(self.tunables),
+                    state_dict = self.state_dict())
+        if self.quantized:
+            # the KV caches are recreated by `optimize` (we delete them in place to keep the metadata of the quantized layers)
+            for k in [k for k in spec['state_dict'] if k.endswith(('k_cache', 'v_cache'))]: del spec['state_dict'][k]
+            spec['quantized'] = self.quantized
+        if str(fname).endswith('.safetensors'): inference.save_safetensors(fname, spec)
+        else: torch.save(spec, fname)
 
     def switch_dtypes(self, dtype=torch.float16):
         self.dtype = dtype
@@ -457,9 +469,9 @@ class SADelARTransformer(nn.Module):
                 m.to(dtype)
             # take care of buffers ([kv]_cache, masks) that are not in the leaf layers
             for bn,b in m.named_buffers(recurse=False):
-                setattr(m,bn,b.to(dtype))
+                if b.is_floating_point(): setattr(m,bn,b.to(dtype))
 
-    def optimize(self, max_batch_size=1, dtype=torch.float16, torch_compile=True):
+    def convert_for_eval(self):
         for emb in self.embds.embeddings:
             emb.convert_for_eval()
         for l in self.encoder:
@@ -467,10 +479,35 @@ class SADelARTransformer(nn.Module):
         for l in self.decoder.layers:
             l.attn.convert_for_eval()
             l.cross_attn.convert_for_eval()
-            l.setup_kv_cache(max_batch_size, self.ctx_n, self.stoks_len)
+
+    def quantize(self, mode='int8'):
+        assert mode == 'int8', f"unsupported quantization: {mode}"
+        for m in [self.encoder, self.decoder, self.head]: quantize_int8(m)
+        self.quantized = mode
+
+    def optimize(self, max_batch_size=1, dtype=None, torch_compile=True, quantize=None, kv_window=None):
+        """Prepares the model for fast inference (in float16 on GPUs and float32 on the CPU by default, see `TSARTransformer.optimize`).
+
+        With a `kv_window` the decoder self-attention only keeps the last `kv_window` frames in a ring buffer
+        so the memory does not grow with the length (and `generate_long` can go past `ctx_n`)."""
+        cpu = self.device.type == 'cpu'
+        if dtype is None: dtype = torch.float32 if cpu else torch.float16
+        # models loaded from quantized checkpoints are already converted
+        if self.quantized: quantize = self.quantized
+        else: self.convert_for_eval()
+        if quantize: assert cpu and dtype == torch.float32, "quantized models only run in float32 on the CPU"
+        if kv_window: assert self.tunables.rope, "the sliding window KV cache needs a model with RoPE positions"
+        for l in self.decoder.layers:
+            l.attn.trim_kv = cpu and not torch_compile
+            l.setup_kv_cache(max_batch_size, self.ctx_n, window=kv_window)
+        # the positions can go past the precomputed RoPE table
+        for m in self.modules():
+            if isinstance(m, MultiHeadAttention): m.long_rope = bool(kv_window)
+        self.kv_window = kv_window
         self.switch_dtypes(dtype)
+        if quantize and not self.quantized: self.quantize(quantize)
         if torch_compile:
-            self.generate_next = torch.compile(self.generate_next, mode="reduce-overhead", fullgraph=True)
+            self.generate_next = torch.compile(self.generate_next, mode=None if cpu else "reduce-overhead", fullgraph=True)
             
     def optimize_training(self):
         self.decoder = torch.compile(self.decoder, fullgraph=True, mode="reduce-overhead")
@@ -480,19 +517,40 @@ class SADelARTransformer(nn.Module):
     def device(self):
         return next(self.parameters()).device
 
-    def generate_one(self, toks, positions, langs, xenc, xenc_positions, T, top_k):
-        probs = self(None, toks, None, langs, noloss=True, xenc=xenc, xenc_positions=xenc_positions, atoks_positions=positions)
+    def generate_one(self, toks, positions, langs, xenc, xenc_positions, T, top_k, slots=None, cross_kv=None):
+        probs = self(None, toks, None, langs, noloss=True, xenc=xenc, xenc_positions=xenc_positions, atoks_positions=positions, slots=slots, cross_kv=cross_kv)
         probs = probs[:,:,-1]
         return inference.sample(probs, T, top_k)
 
     def generate_next(self, *args, **kwargs):
         return self.generate_one(*args, **kwargs)
     
+    def prep_stoks(self, stoks):
+        """Pads the semantic tokens to the full encoder context."""
+        return F.pad(stoks.to(self.device), (1, self.stoks_len - len(stoks) - 1), value=self.stoks_codes-1)
+
+    def stoks_length(self, stoks):
+        """Returns the number of semantic tokens before the first padding token (where the speech ends)."""
+        ends = (stoks == self.stoks_codes-1).nonzero()
+        return int(ends[0,0]) if len(ends) else len(stoks)
+
+    def encode(self, stoks, speakers, offset=0):
+        """Runs the encoder on a batch of padded semantic tokens and speaker embeddings (starting at position `offset`)."""
+        speakers = speakers.to(device=self.device, dtype=self.dtype)
+        xenc, xenc_positions, _ = self.run_encoder(stoks, speakers, offset=offset)
+        return xenc, xenc_positions
+
+    def prefill(self, toks, start, xenc, xenc_positions, T, top_k, cross_kv=None):
+        """Runs the decoder on the first `start` positions (SOT and the prompt) and samples the next tokens."""
+        positions = torch.arange(start, device=toks.device)
+        return self.generate_one(toks[:,:,:start], positions, None, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)
+
     @torch.no_grad()
     def generate(self, stoks, speakers, langs=None, atoks_prompt=None, N=None, bs=1, T=0.7, top_k=None, show_progress_bar=True, step=None, subsample_enc=False):
         dev = self.device
+        stoks = stoks[:self.stoks_length(stoks)]
         N = N or len(stoks) * 3
-        stoks = F.pad(stoks.to(dev), (1, self.stoks_len - len(stoks) - 1), value=self.stoks_codes-1).unsqueeze(0)
+        stoks = self.prep_stoks(stoks).unsqueeze(0)
         speakers = speakers.to(device=dev, dtype=self.dtype)
         toks = torch.full((bs,self.quantizers,self.ctx_n), self.codes+1, dtype=torch.long, device=dev)
         T = torch.tensor(T, device=dev)
@@ -505,11 +563,13 @@ class SADelARTransformer(nn.Module):
         start += 1 # we always start with at least an SOT
 
         with record_function("encode"):
-            stoks, speakers = [x.repeat(bs, 1) for x in (stoks, speakers)]
-            xenc, xenc_positions, _ = self.run_encoder(stoks, speakers)
+            # the encoder output (and the cross-attention keys and values) are the same for every sequence in the batch
+            xenc, xenc_positions = self.encode(stoks, speakers)
+            cross_kv = [(k.expand(bs, -1, -1, -1), v.expand(bs, -1, -1, -1)) for k,v in self.decoder.project_cross_kv(xenc, xenc_positions)]
+            xenc = xenc.expand(bs, -1, -1)
             toks_positions = torch.arange(N, device=dev)
         with record_function("prefill"):
-            initial = self.generate_one(toks[:,:,:start], toks_positions[:start], langs, xenc, xenc_positions, T, top_k)
+            initial = self.prefill(toks, start, xenc, xenc_positions, T, top_k, cross_kv)
             toks[:,:start,start:start+1] = initial[:,:start]
             start += 1
             
@@ -519,15 +579,307 @@ class SADelARTransformer(nn.Module):
 
             for i in it:
                 with record_function("generate_one"):
-                    toks[:,:i,i:i+1] = self.generate_next(toks[:,:,i-1:i], toks_positions[i-1:i], langs, xenc, xenc_positions, T, top_k)[:,:i]
+                    toks[:,:i,i:i+1] = self.generate_next(toks[:,:,i-1:i], toks_positions[i-1:i], langs, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,:i]
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+        return self.undelay(toks, N)
+
+    @torch.no_grad()
+    def generate_stream(self, stoks, speakers, atoks_prompt=None, N=None, T=0.7, top_k=None, chunk_frames=25, lookahead=10, step=None):
+        """Like `generate` (for a single sequence) but yields the acoustic tokens in chunks of at least `chunk_frames`
+        frames as soon as they are ready. Because of the delay pattern a frame is complete `quantizers` steps
+        after its first token was sampled. Concatenating the chunks gives the same result as `generate`.
+
+        `stoks` can also be an iterator over chunks of semantic tokens which are still being generated. In this case
+        every acoustic frame is decoded only when at least `lookahead` semantic tokens past it are available. Once
+        fewer are left we wait for `lookahead` more and rerun the encoder (and the cross-attention projections) on
+        the longer prefix, so they run once every `lookahead` semantic tokens instead of after each of them. Since the
+        encoder is not causal this only approximates running on the finished sequence, a larger `lookahead` brings
+        it closer."""
+        dev = self.device
+        speakers = speakers.reshape(1, -1)
+        if isinstance(stoks, torch.Tensor):
+            chunks, received, exhausted = None, stoks[:self.stoks_length(stoks)].to(dev), True
+        else:
+            chunks, received, exhausted = iter(stoks), torch.zeros(0, dtype=torch.long, device=dev), False
+
+        def pull(n):
+            nonlocal received, exhausted
+            new = False
+            while not exhausted and len(received) < n:
+                try:
+                    received = torch.cat([received, next(chunks).to(dev)])
+                    new = True
+                except StopIteration:
+                    exhausted = True
+            return new
+
+        def target():
+            if N: return N
+            return len(received) * 3 if exhausted else self.ctx_n
+
+        toks = torch.full((1,self.quantizers,self.ctx_n), self.codes+1, dtype=torch.long, device=dev)
+        T = torch.tensor(T, device=dev)
+
+        start = 0 # number of valid tokens or the index of first empty spot
+        if atoks_prompt is not None:
+            start = atoks_prompt.shape[-1]
+            for i in range(self.quantizers):
+                toks[:,i,1+i:start+i+1] = atoks_prompt[:,i]
+        start += 1 # we always start with at least an SOT
+
+        with record_function("encode"):
+            pull(start // 3 + 1 + lookahead)
+            xenc, xenc_positions = self.encode(self.prep_stoks(received).unsqueeze(0), speakers)
+            cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+            toks_positions = torch.arange(self.ctx_n, device=dev)
+        with record_function("prefill"):
+            initial = self.prefill(toks, start, xenc, xenc_positions, T, top_k, cross_kv)
+            toks[:,:start,start:start+1] = initial[:,:start]
+            start += 1
+
+        def frames(a, b):
+            return torch.stack([toks[:,j,a+1+j:b+1+j] for j in range(self.quantizers)], dim=1)
+
+        emitted, i = 0, start
+        with inference.inference_context():
+            while True:
+                need = i // 3 + 1 + lookahead
+                if len(received) < need and pull(need + lookahead):
+                    with record_function("encode"):
+                        xenc, xenc_positions = self.encode(self.prep_stoks(received).unsqueeze(0), speakers)
+                        cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+                if i >= min(target(), self.ctx_n-1): break
+
+                with record_function("generate_one"):
+                    toks[:,:i,i:i+1] = self.generate_next(toks[:,:,i-1:i], toks_positions[i-1:i], None, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,:i]
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+
+                ready = min(i - self.quantizers + 1, target() - 4)
+                if ready - emitted >= chunk_frames:
+                    yield frames(emitted, ready)
+                    emitted = ready
+                i += 1
+        final = self.undelay(toks, target())
+        if emitted < final.shape[-1]: yield final[...,emitted:]
+
+    @torch.no_grad()
+    def generate_speculative(self, draft, stoks, speakers, atoks_prompt=None, N=None, frames_per_step=4, T=0.7, top_k=None, step=None):
+        """Like `generate` (for a single sequence) but a smaller `draft` S2A model proposes `frames_per_step` delayed
+        frames at a time and this model checks all of them in a single forward pass.
+
+        The quantizers of one frame are independent given the previous frames so every proposed token is accepted with
+        probability min(1, p/q) or resampled from the leftover probability mass on its own. This keeps the output
+        distribution the same as in `generate`. All the frames after the first one with a resampled token are thrown away.
+        The acceptance counts (per frame and per quantizer) are kept in `self.speculative_stats`."""
+        assert draft.quantizers == self.quantizers and draft.codes == self.codes, "the draft model has to use the same acoustic tokens"
+        # the rejected draft frames would overwrite positions which are still inside a sliding window
+        assert self.kv_window is None and draft.kv_window is None, "speculative decoding does not work with a kv_window"
+        dev = self.device
+        stoks = stoks[:self.stoks_length(stoks)]
+        N = N or len(stoks) * 3
+        Q = self.quantizers
+        toks = torch.full((1,Q,self.ctx_n), self.codes+1, dtype=torch.long, device=dev)
+        start = 0
+        if atoks_prompt is not None:
+            start = atoks_prompt.shape[-1]
+            for i in range(Q):
+                toks[:,i,1+i:start+i+1] = atoks_prompt[:,i]
+        start += 1
+        end = min(N, self.ctx_n-1)
+        positions = torch.arange(self.ctx_n, device=dev)
+
+        def encode(m):
+            xenc, xenc_positions = m.encode(m.prep_stoks(stoks).unsqueeze(0), speakers)
+            return xenc, xenc_positions, m.decoder.project_cross_kv(xenc, xenc_positions)
+
+        with record_function("encode"):
+            encs = [encode(m) for m in (self, draft)]
+
+        def probs(m, enc, a, b):
+            # the distributions for the frames following toks[...,a:b] (the KV cache has to be filled up to a)
+            xenc, xenc_positions, cross_kv = enc
+            logits = m(None, toks[...,a:b], None, None, noloss=True, xenc=xenc, xenc_positions=xenc_positions, atoks_positions=positions[a:b], cross_kv=cross_kv)
+            return inference.logits_to_probs(logits[0].float(), T, top_k).transpose(0,1) # [frames, Q, codes]
+
+        def sample(probs):
+            return inference.multinomial_sample_one_no_sync(probs)[:,0]
+
+        stats = self.speculative_stats = dict(drafted=0, accepted=0, quantizer_accepted=torch.zeros(Q, dtype=torch.long))
+        # frames before i are final, the models have toks[...,:main_pos] and toks[...,:draft_pos] in their KV caches
+        i, main_pos, draft_pos = start, 0, 0
+        with inference.inference_context():
+            while i < end:
+                n = min(frames_per_step, end - i)
+                qs = []
+                with record_function("draft"):
+                    for j in range(n):
+                        qs.append(probs(draft, encs[1], draft_pos, i+j)[-1])
+                        draft_pos = i+j
+                        # the delay pattern: quantizer q only starts at frame q+1
+                        m = min(i+j, Q)
+                        toks[0,:m,i+j] = sample(qs[-1])[:m]
+                with record_function("verify"):
+                    ps = probs(self, encs[0], main_pos, i+n)[-n-1:]
+                accepted = 0
+                for j in range(n):
+                    m = min(i+j, Q)
+                    tok = toks[0,:m,i+j]
+                    p, q = ps[j,:m], qs[j][:m]
+                    idx = torch.arange(m, device=dev)
+                    ok = torch.rand(m, device=dev) * q[idx,tok] < p[idx,tok]
+                    stats['quantizer_accepted'][:m] += ok.cpu()
+                    if ok.all():
+                        accepted += 1
+                        continue
+                    residual = (p - q).clamp(min=0)
+                    fixed = sample(residual / residual.sum(-1, keepdim=True))
+                    toks[0,:m,i+j] = torch.where(ok, tok, fixed)
+                    break
+                else:
+                    if i+n < end:
+                        # all the drafts were good so we get one more frame for free
+                        m = min(i+n, Q)
+                        toks[0,:m,i+n] = sample(ps[n])[:m]
+                stats['drafted'] += n
+                stats['accepted'] += accepted
+                i = min(i + accepted + 1, end)
+                main_pos = i - 1
+                draft_pos = min(draft_pos, i - 1)
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+        return self.undelay(toks, N)
+
+    @torch.no_grad()
+    def generate_long(self, stoks, speakers, atoks_prompt=None, N=None, T=0.7, top_k=None, show_progress_bar=True, step=None):
+        """Like `generate` (for a single sequence) but without the `ctx_n` length limit. It needs a model optimized
+        with a `kv_window` (see `optimize`).
+
+        The decoder only attends to the last `kv_window` frames and the encoder is rerun on a window of `stoks_len`
+        semantic tokens which moves along with the generated frames (the RoPE positions keep the cross-attention aligned).
+        Since neither of them sees the whole sequence this approximates a model with an unbounded context."""
+        assert self.kv_window is not None, "please call optimize with a kv_window first"
+        dev = self.device
+        stoks = stoks[:self.stoks_length(stoks)].to(dev)
+        N = N or len(stoks) * 3
+        speakers = speakers.reshape(1, -1)
+        # the semantic tokens with the leading padding token (like in `prep_stoks`)
+        padded = F.pad(stoks, (1, 0), value=self.stoks_codes-1)
+        last_offset = max(0, len(padded) - self.stoks_len)
+        toks = torch.full((1,self.quantizers,N+1), self.codes+1, dtype=torch.long, device=dev)
+        T = torch.tensor(T, device=dev)
+
+        start = 0 # number of valid tokens or the index of first empty spot
+        if atoks_prompt is not None:
+            start = atoks_prompt.shape[-1]
+            for i in range(self.quantizers):
+                toks[:,i,1+i:start+i+1] = atoks_prompt[:,i]
+        start += 1 # we always start with at least an SOT
+
+        def encode(i):
+            nonlocal offset, xenc, xenc_positions, cross_kv
+            # the window starts a quarter of its length before the semantic token aligned with frame `i`
+            offset = min(max(0, i // 3 - self.stoks_len // 4), last_offset)
+            window = padded[offset:offset+self.stoks_len]
+            window = F.pad(window, (0, self.stoks_len - len(window)), value=self.stoks_codes-1)
+            xenc, xenc_positions = self.encode(window.unsqueeze(0), speakers, offset=offset)
+            cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+
+        offset = xenc = xenc_positions = cross_kv = None
+        with record_function("encode"):
+            encode(start)
+            toks_positions = torch.arange(N+1, device=dev)
+        with record_function("prefill"):
+            initial = self.generate_one(toks[:,:,:start], toks_positions[:start], None, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)
+            toks[:,:start,start:start+1] = initial[:,:start]
+            start += 1
+
+        with inference.inference_context():
+            it = range(start,N)
+            if show_progress_bar: it = progress_bar(it)
+
+            for i in it:
+                # move the encoder window when less than a quarter of it is left ahead of the current frame
+                if offset < last_offset and i // 3 + self.stoks_len // 4 > offset + self.stoks_len:
+                    with record_function("encode"):
+                        encode(i)
+                with record_function("generate_one"):
+                    toks[:,:i,i:i+1] = self.generate_next(toks[:,:,i-1:i], toks_positions[i-1:i], None, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,:i]
 
                 # for profiling, debugging or early exit
                 if step is not None: step()
-        # shift tokens
-        toks = toks[:,:,1:N]
+        return self.undelay(toks, N)
+
+    def undelay(self, toks, N):
+        """Drops the SOT token and shifts the quantizers back into alignment (undoes the delay pattern)."""
+        toks = toks[...,1:N].clone()
         for j in range(self.quantizers):
-            toks[:, j] = torch.roll(toks[:, j], -j)
-        return toks[:,:,:N-4]
+            toks[...,j,:] = torch.roll(toks[...,j,:], -j)
+        return toks[...,:N-4]
+
+    @torch.no_grad()
+    def generate_batch(self, stoks, speakers, atoks_prompt=None, N=None, T=0.7, top_k=None, show_progress_bar=True, step=None):
+        """Generates acoustic tokens for a batch of different semantic token sequences.
+
+        `stoks` is a list of token tensors, `speakers` has one embedding per sequence and the optional
+        `atoks_prompt` is shared by the whole batch. Returns a list of acoustic token tensors (including
+        the prompt, like `generate`), each trimmed to the length of its own semantic tokens.
+
+        Every sequence stops as soon as it reaches its own length (the semantic tokens are cut at the first padding
+        token) and the finished rows are dropped from the batch (and from the KV cache) so the remaining steps only
+        run on the sequences which still need them."""
+        dev = self.device
+        bs = len(stoks)
+        stoks = [x[:self.stoks_length(x)] for x in stoks]
+        Ns = [N or len(x) * 3 for x in stoks]
+        toks = torch.full((bs,self.quantizers,self.ctx_n), self.codes+1, dtype=torch.long, device=dev)
+        T = torch.tensor(T, device=dev)
+
+        start = 0 # number of valid tokens or the index of first empty spot
+        if atoks_prompt is not None:
+            atoks_prompt = atoks_prompt.reshape(self.quantizers, -1)
+            start = atoks_prompt.shape[-1]
+            for i in range(self.quantizers):
+                toks[:,i,1+i:start+i+1] = atoks_prompt[i]
+        start += 1 # we always start with at least an SOT
+
+        with record_function("encode"):
+            xenc, xenc_positions = self.encode(torch.stack([self.prep_stoks(x) for x in stoks]), speakers)
+            cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+            toks_positions = torch.arange(self.ctx_n, device=dev)
+        with record_function("prefill"):
+            initial = self.prefill(toks, start, xenc, xenc_positions, T, top_k, cross_kv)
+            toks[:,:start,start:start+1] = initial[:,:start]
+            start += 1
+
+        out = [None] * bs
+        active = torch.arange(bs) # the original indices of the rows still being decoded
+        ends = torch.tensor([min(n, self.ctx_n-1) for n in Ns])
+        with inference.inference_context():
+            it = range(start,int(ends.max()))
+            if show_progress_bar: it = progress_bar(it)
+
+            for i in it:
+                done = ends[active] <= i
+                if done.any():
+                    for r in done.nonzero()[:,0].tolist(): out[active[r]] = toks[r]
+                    keep = (~done).nonzero()[:,0]
+                    rows = keep.to(dev)
+                    active, toks, xenc = active[keep], toks[rows], xenc[rows]
+                    cross_kv = [(k[rows], v[rows]) for k,v in cross_kv]
+                    self.decoder.select_kv_rows(rows)
+
+                with record_function("generate_one"):
+                    toks[:,:i,i:i+1] = self.generate_next(toks[:,:,i-1:i], toks_positions[i-1:i], None, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,:i]
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+        for r, row in zip(active.tolist(), toks): out[r] = row
+        return [self.undelay(row, n) for row, n in zip(out, Ns)]
 
 # %% ../nbs/4B. Multi-language semantic to acoustic token modeling.ipynb 15
 def _make_model(size:str, quantizers:int=4, tunables:Tunables=Tunables(), **kwargs):
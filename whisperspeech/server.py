@@ -0,0 +1,437 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/7C. Synthesis server.ipynb.
+
+# %% auto 0
+__all__ = ['SynthesisRequest', 'SynthesisWorker', 'SynthesisProcessPool', 'encode_audio', 'make_app', 'main']
+
+# %% ../nbs/7C. Synthesis server.ipynb 2
+import io
+import os
+import time
+import queue
+import wave
+import asyncio
+import contextlib
+import threading
+import dataclasses
+from concurrent.futures import Future
+
+import torch
+
+from whisperspeech import languages
+
+# %% ../nbs/7C. Synthesis server.ipynb 3
+# An HTTP/WebSocket front end for the Pipeline. The models run in a single worker thread which owns the Pipeline,
+# the asyncio handlers only put requests on its queue and wait for the results. Waiting requests are synthesized
+# together with `Pipeline.generate_batch` so concurrent clients share the decoding steps instead of taking turns.
+#
+# The web framework (starlette + uvicorn) is an optional dependency and only imported when the app is created.
+
+sample_rate = 24000
+
+# %% ../nbs/7C. Synthesis server.ipynb 4
+@dataclasses.dataclass(eq=False)
+class SynthesisRequest:
+    text: str
+    speaker: str = None
+    lang: str = 'en'
+    cps: float = 15
+    stream: bool = False
+    # streaming requests get every audio chunk (and a final `None`) passed to `on_chunk` from the worker thread
+    on_chunk: callable = None
+    future: Future = dataclasses.field(default_factory=Future)
+    cancelled: threading.Event = dataclasses.field(default_factory=threading.Event)
+    submitted: float = dataclasses.field(default_factory=time.monotonic)
+
+# %% ../nbs/7C. Synthesis server.ipynb 5
+class SynthesisWorker:
+    """Runs all the `pipe` calls in one background thread.
+
+    Non-streaming requests which arrive within `batch_timeout` seconds of each other are synthesized
+    together in batches of up to `max_batch_size` (the `Pipeline` default). Streaming requests are served
+    one at a time, in between the batches."""
+    def __init__(self, pipe, max_batch_size=None, batch_timeout=0.01):
+        self.pipe = pipe
+        self.max_batch_size = max_batch_size or pipe.max_batch_size
+        self.batch_timeout = batch_timeout
+        self.queue = queue.Queue()
+        self.thread = None
+        self.n_requests = self.n_batches = self.n_streams = self.n_errors = 0
+        self.busy_time = 0.
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='whisperspeech-worker', daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def submit(self, req):
+        self.queue.put(req)
+        return req
+
+    def next_batch(self, first):
+        batch, streams = [first], []
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.max_batch_size:
+            try:
+                req = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if req is None:
+                # let `run` see the shutdown request after this batch
+                self.queue.put(None)
+                break
+            (streams if req.stream else batch).append(req)
+        return batch, streams
+
+    def run(self):
+        while True:
+            req = self.queue.get()
+            if req is None: break
+            if req.stream:
+                self.run_stream(req)
+                continue
+            batch, streams = self.next_batch(req)
+            self.run_batch(batch)
+            for req in streams: self.run_stream(req)
+
+    def run_batch(self, batch):
+        batch = [req for req in batch if not req.cancelled.is_set() and req.future.set_running_or_notify_cancel()]
+        if not batch: return
+        start = time.monotonic()
+        self.synthesize(batch)
+        self.busy_time += time.monotonic() - start
+        self.n_requests += len(batch)
+        self.n_batches += 1
+
+    def synthesize(self, batch):
+        try:
+            audio = self.pipe.generate_batch([req.text for req in batch], [req.speaker for req in batch],
+                                             langs=[req.lang for req in batch], cps=[req.cps for req in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                # one bad request should not fail the others so we retry them one by one
+                for req in batch: self.synthesize([req])
+                return
+            self.n_errors += 1
+            batch[0].future.set_exception(e)
+        else:
+            for req, x in zip(batch, audio): req.future.set_result(x.reshape(-1).float().cpu())
+
+    def run_stream(self, req):
+        if req.cancelled.is_set() or not req.future.set_running_or_notify_cancel():
+            if req.on_chunk: req.on_chunk(None)
+            return
+        start = time.monotonic()
+        try:
+            for chunk in self.pipe.generate_stream(req.text, req.speaker, lang=req.lang, cps=req.cps):
+                # the client went away, stop generating
+                if req.cancelled.is_set(): break
+                req.on_chunk(chunk.reshape(-1).float().cpu())
+        except Exception as e:
+            self.n_errors += 1
+            req.future.set_exception(e)
+        else:
+            req.future.set_result(None)
+        finally:
+            req.on_chunk(None)
+        self.busy_time += time.monotonic() - start
+        self.n_requests += 1
+        self.n_streams += 1
+
+    async def generate(self, text, speaker=None, lang='en', cps=15):
+        """Returns the whole waveform for `text` (to be awaited from an event loop)."""
+        req = self.submit(SynthesisRequest(text, speaker, lang, cps))
+        try:
+            return await asyncio.wrap_future(req.future)
+        finally:
+            req.cancelled.set()
+
+    async def stream(self, text, speaker=None, lang='en', cps=15):
+        """Yields the waveform for `text` in chunks as they are generated."""
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+        req = self.submit(SynthesisRequest(text, speaker, lang, cps, stream=True,
+                                           on_chunk=lambda x: loop.call_soon_threadsafe(chunks.put_nowait, x)))
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None: break
+                yield chunk
+            # re-raises the errors from the worker
+            await asyncio.wrap_future(req.future)
+        finally:
+            req.cancelled.set()
+
+    def stats(self):
+        return dict(requests=self.n_requests, batches=self.n_batches, streams=self.n_streams, errors=self.n_errors,
+                    mean_batch_size=(self.n_requests - self.n_streams) / max(1, self.n_batches),
+                    busy_time=self.busy_time, queued=self.queue.qsize())
+
+# %% ../nbs/7C. Synthesis server.ipynb 6
+class _WorkerInbox:
+    """Stands in for the request queue of a `SynthesisWorker` running in a pool process, the results and
+    the audio chunks are sent back to the parent through `results`."""
+    def __init__(self, requests, results):
+        self.requests = requests
+        self.results = results
+
+    def put(self, msg):
+        self.requests.put(msg)
+
+    def qsize(self):
+        return self.requests.qsize()
+
+    def get(self, timeout=None):
+        msg = self.requests.get(timeout=timeout)
+        if msg is None: return None
+        rid, kwargs = msg
+        req = SynthesisRequest(**kwargs)
+        if req.stream: req.on_chunk = lambda x: x is not None and self.results.put((rid, 'chunk', x.numpy()))
+        req.future.add_done_callback(lambda f: self.results.put(self.result(rid, f)))
+        return req
+
+    @staticmethod
+    def result(rid, f):
+        if f.exception() is not None: return rid, 'error', repr(f.exception())
+        return rid, 'done', None if f.result() is None else f.result().numpy()
+
+# %% ../nbs/7C. Synthesis server.ipynb 7
+def _pool_worker(pipe, requests, results, max_batch_size, batch_timeout, num_threads):
+    torch.set_num_threads(num_threads)
+    # the weights are shared with the other processes but the caches have to be private
+    pipe.setup_kv_cache()
+    worker = SynthesisWorker(pipe, max_batch_size, batch_timeout)
+    worker.queue = _WorkerInbox(requests, results)
+    worker.run()
+
+# %% ../nbs/7C. Synthesis server.ipynb 8
+class SynthesisProcessPool(SynthesisWorker):
+    """Serves the requests from `n_workers` processes forked from this one which share the weights of `pipe`
+    (see `Pipeline.share_memory`). A single process cannot keep a big CPU busy, this way the memory only grows by
+    the KV caches and activations of every worker.
+
+    Every process batches its requests like `SynthesisWorker` and runs with `num_threads` threads (by default
+    the cores divided evenly). New requests go to the process with the fewest unfinished ones. Clients which
+    disconnect do not stop the generation in the worker processes."""
+    def __init__(self, pipe, n_workers=2, num_threads=None, max_batch_size=None, batch_timeout=0.01):
+        super().__init__(pipe, max_batch_size, batch_timeout)
+        self.n_workers = n_workers
+        self.num_threads = num_threads or max(1, (os.cpu_count() or 1) // n_workers)
+        self.processes = []
+        self.pending = {}
+        self.load = [0] * n_workers
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.processes: return self
+        # the workers inherit the shared weights by forking, this has to happen before we start any threads
+        ctx = torch.multiprocessing.get_context('fork')
+        self.pipe.share_memory()
+        self.results = ctx.Queue()
+        self.inboxes = [ctx.Queue() for _ in range(self.n_workers)]
+        for i, inbox in enumerate(self.inboxes):
+            p = ctx.Process(target=_pool_worker, name=f'whisperspeech-worker-{i}', daemon=True,
+                            args=(self.pipe, inbox, self.results, self.max_batch_size, self.batch_timeout, self.num_threads))
+            p.start()
+            self.processes.append(p)
+        self.thread = threading.Thread(target=self.collect, name='whisperspeech-results', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if not self.processes: return
+        for inbox in self.inboxes: inbox.put(None)
+        for p in self.processes: p.join()
+        self.results.put(None)
+        self.thread.join()
+        self.processes, self.thread = [], None
+
+    def submit(self, req):
+        # once sent to a worker the request cannot be cancelled anymore
+        req.future.set_running_or_notify_cancel()
+        with self.lock:
+            rid = self.next_id
+            self.next_id += 1
+            i = min(range(self.n_workers), key=self.load.__getitem__)
+            self.load[i] += 1
+            self.pending[rid] = req, i
+        self.inboxes[i].put((rid, dict(text=req.text, speaker=req.speaker, lang=req.lang, cps=req.cps, stream=req.stream)))
+        return req
+
+    def collect(self):
+        for rid, kind, value in iter(self.results.get, None):
+            if kind == 'chunk':
+                self.pending[rid][0].on_chunk(torch.from_numpy(value))
+                continue
+            with self.lock:
+                req, i = self.pending.pop(rid)
+                self.load[i] -= 1
+            self.n_requests += 1
+            if kind == 'error':
+                self.n_errors += 1
+                req.future.set_exception(RuntimeError(value))
+            else:
+                req.future.set_result(None if value is None else torch.from_numpy(value))
+            if req.stream:
+                self.n_streams += 1
+                req.on_chunk(None)
+
+    def stats(self):
+        return dict(requests=self.n_requests, streams=self.n_streams, errors=self.n_errors,
+                    workers=self.n_workers, in_flight=list(self.load))
+
+# %% ../nbs/7C. Synthesis server.ipynb 9
+def to_pcm16(audio):
+    """Converts a float waveform to little-endian 16-bit PCM bytes."""
+    return (audio.clamp(-1, 1) * 32767).round().to(torch.int16).numpy().astype('<i2').tobytes()
+
+# %% ../nbs/7C. Synthesis server.ipynb 10
+def encode_audio(audio, format='wav'):
+    """Encodes a waveform as `pcm` (raw 16-bit samples), `wav` or any other `format` supported by
+    `torchaudio.save` (e.g. `ogg` or `opus`). Returns the bytes and the matching MIME type."""
+    if format == 'pcm':
+        return to_pcm16(audio), f'audio/pcm;rate={sample_rate};encoding=s16le'
+    if format == 'wav':
+        f = io.BytesIO()
+        with wave.open(f, 'wb') as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate)
+            w.writeframes(to_pcm16(audio))
+        return f.getvalue(), 'audio/wav'
+    import torchaudio
+    f = io.BytesIO()
+    torchaudio.save(f, audio[None], sample_rate, format=format)
+    return f.getvalue(), 'audio/ogg' if format in ('ogg', 'opus') else f'audio/{format}'
+
+# %% ../nbs/7C. Synthesis server.ipynb 11
+# the speed embedding of the T2S model covers up to 20 characters per second (faster values are clamped)
+max_cps = 20
+
+# %% ../nbs/7C. Synthesis server.ipynb 12
+def parse_request(params, speakers):
+    text = params.get('text')
+    if not isinstance(text, str) or not text.strip(): raise ValueError("`text` is required")
+    speaker = params.get('speaker')
+    # only registered voices, we never open paths or URLs given by the clients
+    if speaker is not None and speaker not in speakers: raise ValueError(f"unknown speaker: {speaker!r}")
+    lang = params.get('lang', 'en')
+    try:
+        languages.to_id(lang)
+    except (TypeError, ValueError):
+        raise ValueError(f"unknown language: {lang!r}") from None
+    cps = params.get('cps', 15)
+    if isinstance(cps, bool) or not isinstance(cps, (int, float)) or not 0 < cps <= max_cps:
+        raise ValueError(f"`cps` has to be a number between 0 and {max_cps}")
+    return dict(text=text, speaker=speaker, lang=lang, cps=float(cps))
+
+# %% ../nbs/7C. Synthesis server.ipynb 13
+def make_app(worker):
+    """Creates the ASGI app:
+
+    - `POST /v1/tts` with a JSON body `{"text": ..., "speaker": ..., "lang": ..., "cps": ..., "format": ..., "stream": ...}`
+      returns the audio (`wav` by default), with `"stream": true` the 16-bit PCM is streamed as it is generated
+    - `WS /v1/tts/stream` accepts the same JSON messages and replies with binary PCM messages followed by
+      `{"done": true}` (or `{"error": ...}`) for every one of them
+    - `GET /v1/speakers` and `GET /v1/stats`"""
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse, Response, StreamingResponse
+    from starlette.routing import Route, WebSocketRoute
+    from starlette.websockets import WebSocketDisconnect
+
+    async def tts(request):
+        try:
+            params = await request.json()
+            args = parse_request(params, worker.pipe.speakers)
+        except ValueError as e:
+            return JSONResponse({'error': str(e)}, status_code=400)
+        if params.get('stream'):
+            async def pcm():
+                async for chunk in worker.stream(**args): yield to_pcm16(chunk)
+            return StreamingResponse(pcm(), media_type=f'audio/pcm;rate={sample_rate};encoding=s16le')
+        try:
+            audio = await worker.generate(**args)
+        except Exception as e:
+            return JSONResponse({'error': str(e)}, status_code=500)
+        data, media_type = encode_audio(audio, params.get('format', 'wav'))
+        return Response(data, media_type=media_type)
+
+    async def tts_stream(websocket):
+        await websocket.accept()
+        try:
+            while True:
+                params = await websocket.receive_json()
+                try:
+                    args = parse_request(params, worker.pipe.speakers)
+                    async for chunk in worker.stream(**args): await websocket.send_bytes(to_pcm16(chunk))
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    # the connection stays usable for the next requests
+                    await websocket.send_json({'error': str(e)})
+                else:
+                    await websocket.send_json({'done': True, 'sample_rate': sample_rate})
+        except WebSocketDisconnect:
+            pass
+
+    async def speakers(request):
+        return JSONResponse(sorted(worker.pipe.speakers))
+
+    async def stats(request):
+        return JSONResponse(worker.stats())
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        worker.start()
+        yield
+        await asyncio.get_running_loop().run_in_executor(None, worker.stop)
+
+    return Starlette(routes=[
+        Route('/v1/tts', tts, methods=['POST']),
+        WebSocketRoute('/v1/tts/stream', tts_stream),
+        Route('/v1/speakers', speakers),
+        Route('/v1/stats', stats),
+    ], lifespan=lifespan)
+
+# %% ../nbs/7C. Synthesis server.ipynb 14
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m whisperspeech.server', description="WhisperSpeech synthesis server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--t2s-ref', default=None)
+    parser.add_argument('--s2a-ref', default=None)
+    parser.add_argument('--device', default=None)
+    parser.add_argument('--max-batch-size', type=int, default=8)
+    parser.add_argument('--batch-timeout', type=float, default=0.01, help="seconds to wait for more requests to batch together")
+    parser.add_argument('--torch-compile', action='store_true')
+    parser.add_argument('--workers', type=int, default=1, help="worker processes sharing the model weights (CPU only)")
+    parser.add_argument('--threads-per-worker', type=int, default=None)
+    parser.add_argument('--cache-dir', default=None)
+    parser.add_argument('--speaker', action='append', default=[], metavar='NAME=FILE', help="register a voice from an audio file")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+    from whisperspeech.pipeline import Pipeline
+    pipe = Pipeline(t2s_ref=args.t2s_ref, s2a_ref=args.s2a_ref, device=args.device, torch_compile=args.torch_compile,
+                    max_batch_size=args.max_batch_size, speaker_cache_dir=args.cache_dir)
+    for spec in args.speaker:
+        name, fname = spec.split('=', 1)
+        pipe.register_speaker(name, fname)
+    if args.workers > 1:
+        # fork the workers before uvicorn starts its threads
+        worker = SynthesisProcessPool(pipe, args.workers, num_threads=args.threads_per_worker, batch_timeout=args.batch_timeout).start()
+    else:
+        worker = SynthesisWorker(pipe, batch_timeout=args.batch_timeout)
+    uvicorn.run(make_app(worker), host=args.host, port=args.port)
+
+# %% ../nbs/7C. Synthesis server.ipynb 15
+if __name__ == '__main__':
+    main()
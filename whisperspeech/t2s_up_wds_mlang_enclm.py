@@ -13,15 +13,15 @@ import torch.nn as nn
 import torch.nn.functional as F
 from torch.profiler import record_function
 
-from huggingface_hub import hf_hub_download
 from fastcore.basics import store_attr
-from fastprogress import progress_bar
+from whisperspeech.inference import progress_bar
 
 from pathlib import Path
 
 # %% ../nbs/5B. Multi-lang text to semantic token modeling.ipynb 2
 from whisperspeech.modules import *
 from whisperspeech import languages, inference
+from whisperspeech.cache import LRUCache
 
 # %% ../nbs/5B. Multi-lang text to semantic token modeling.ipynb 6
 import re
@@ -270,6 +270,8 @@ class TSARTransformer(nn.Module):
             width=width, n_head=n_head, ffn_mult=ffn_mult,
         )
         self.tokenizer = None
+        self.encoder_cache = None
+        self.quantized = None
         
         self.apply(self.init_transformer)
 
@@ -325,8 +327,27 @@ class TSARTransformer(nn.Module):
             xenc = self.encoder(in_ttoks.to(torch.long), positions, lang_emb=lang_embs)
 
         return xenc, positions, cps_emb
+
+    def enable_encoder_cache(self, max_items=128, max_bytes=1<<30):
+        """Memoizes the encoder outputs (and the cross-attention keys and values) of `encode_text` so
+        repeated texts skip the encoder. Pass `max_items=0` to disable it again."""
+        self.encoder_cache = LRUCache(max_items=max_items, max_bytes=max_bytes) if max_items else None
+
+    def encode_text(self, ttoks, langs, cpss):
+        """Runs the encoder and precomputes the decoder cross-attention keys and values.
+
+        Returns `(xenc, xenc_positions, cps_emb, cross_kv)`, from the encoder cache if enabled."""
+        key = None
+        if self.encoder_cache is not None:
+            key = tuple(x.cpu().numpy().tobytes() for x in (ttoks, langs, cpss.float()))
+            cached = self.encoder_cache.get(key)
+            if cached is not None: return cached
+        xenc, xenc_positions, cps_emb = self.run_encoder(ttoks, langs, cpss)
+        cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+        if key is not None: self.encoder_cache.put(key, (xenc, xenc_positions, cps_emb, cross_kv))
+        return xenc, xenc_positions, cps_emb, cross_kv
     
-    def forward(self, in_ttoks, out_ttoks, languages, cpss, in_stoks, out_stoks=None, in_stoks_positions=None, loss=True, offset=None, xenc=None, xenc_positions=None, cps_emb=None):
+    def forward(self, in_ttoks, out_ttoks, languages, cpss, in_stoks, out_stoks=None, in_stoks_positions=None, loss=True, offset=None, xenc=None, xenc_positions=None, cps_emb=None, slots=None, cross_kv=None):
         if xenc is None:
             xenc, xenc_positions, cps_emb = self.run_encoder(in_ttoks, languages, cpss)
 
@@ -334,7 +355,8 @@ class TSARTransformer(nn.Module):
             x = (self.embeddings.embedding(in_stoks) + 
                  self.embeddings.positional_embedding[in_stoks_positions] +
                  cps_emb).to(xenc[0].dtype)
-            x = self.decoder(x, in_stoks_positions, xenc.clone(), xenc_positions)
+            # with precomputed cross-attention keys and values the decoder does not read xenc
+            x = self.decoder(x, in_stoks_positions, xenc.clone() if cross_kv is None else xenc, xenc_positions, slots=slots, cross_kv=cross_kv)
             logits = self.embeddings.embedding.unembed(x)
             logits = logits * self.tunables.output_mult / (self.width / self.base_width)
 
@@ -360,11 +382,15 @@ class TSARTransformer(nn.Module):
             else:
                 local_filename = ref
         if not local_filename and spec is None:
+            from huggingface_hub import hf_hub_download
             local_filename = hf_hub_download(repo_id=repo_id, filename=filename, cache_dir=cache_dir)
         if spec is None:
-            spec = torch.load(local_filename, map_location=device)
+            spec = inference.load_spec(local_filename, device)
         model = cls(**spec['config'], tunables=Tunables(**Tunables.upgrade(spec['tunables'])))
-        model.load_state_dict(spec['state_dict'])
+        if spec.get('quantized'):
+            model.convert_for_eval()
+            model.quantize(spec['quantized'])
+        model.load_state_dict(spec['state_dict'], assign=spec.get('mmap', False))
         model.eval().to(device)
         return model
 
@@ -380,9 +406,16 @@ class TSARTransformer(nn.Module):
         return self
 
     def save_model(self, fname):
-        torch.save(dict(config = self.__stored_args__,
-                        tunables = dataclasses.asdict(self.tunables),
-                        state_dict = self.state_dict()), fname)
+        """Saves the model, a `fname` ending in `.safetensors` selects the memory-mappable format (see `inference.load_safetensors`)."""
+        spec = dict(config = self.__stored_args__,
+                    tunables = dataclasses.asdict(self.tunables),
+                    state_dict = self.state_dict())
+        if self.quantized:
+            # the KV caches are recreated by `optimize` (we delete them in place to keep the metadata of the quantized layers)
+            for k in [k for k in spec['state_dict'] if k.endswith(('k_cache', 'v_cache'))]: del spec['state_dict'][k]
+            spec['quantized'] = self.quantized
+        if str(fname).endswith('.safetensors'): inference.save_safetensors(fname, spec)
+        else: torch.save(spec, fname)
 
     def ensure_tokenizer(self):
         assert not self.training
@@ -390,6 +423,7 @@ class TSARTransformer(nn.Module):
 
     def switch_dtypes(self, dtype=torch.float16):
         self.dtype = dtype
+        if self.encoder_cache is not None: self.encoder_cache.clear()
         for n,m in self.named_modules():
             # convert every leaf layer apart from the LayerNorms
             if isinstance(m, (nn.Linear, nn.Embedding)):
@@ -398,7 +432,7 @@ class TSARTransformer(nn.Module):
             for bn,b in m.named_buffers(recurse=False):
                 setattr(m,bn,b.to(dtype))
 
-    def optimize(self, max_batch_size=1, dtype=torch.float16, torch_compile=True):
+    def convert_for_eval(self):
         for emb in [self.embeddings.embedding, self.embeddings.embedding]:
             emb.convert_for_eval()
         for l in self.encoder.layers:
@@ -406,10 +440,35 @@ class TSARTransformer(nn.Module):
         for l in self.decoder.layers:
             l.attn.convert_for_eval()
             l.cross_attn.convert_for_eval()
-            l.setup_kv_cache(max_batch_size, self.stoks_len, self.ttoks_len)
+
+    def quantize(self, mode='int8'):
+        assert mode == 'int8', f"unsupported quantization: {mode}"
+        for m in [self.encoder, self.decoder]: quantize_int8(m)
+        self.quantized = mode
+
+    def optimize(self, max_batch_size=1, dtype=None, torch_compile=True, quantize=None):
+        """Prepares the model for fast inference. The default `dtype` is float16 on GPUs and float32 on the CPU
+        (where float16 matmuls are very slow, bfloat16 is an option on CPUs which support it).
+
+        On the CPU without `torch_compile` the attention only looks at the filled part of the KV cache, which saves most
+        of the work in the early decoding steps. `torch_compile` needs static shapes so it always uses the whole cache
+        and only enables CUDA graphs on the GPU.
+
+        `quantize='int8'` replaces the linear layers with dynamically quantized ones (float32 on the CPU only). Such
+        a model can be saved with `save_model` and loaded back with `load_model`."""
+        cpu = self.device.type == 'cpu'
+        if dtype is None: dtype = torch.float32 if cpu else torch.float16
+        # models loaded from quantized checkpoints are already converted
+        if self.quantized: quantize = self.quantized
+        else: self.convert_for_eval()
+        if quantize: assert cpu and dtype == torch.float32, "quantized models only run in float32 on the CPU"
+        for l in self.decoder.layers:
+            l.attn.trim_kv = cpu and not torch_compile
+            l.setup_kv_cache(max_batch_size, self.stoks_len)
         self.switch_dtypes(dtype)
+        if quantize and not self.quantized: self.quantize(quantize)
         if torch_compile:
-            self.generate_next = torch.compile(self.generate_next, mode="reduce-overhead", fullgraph=True)
+            self.generate_next = torch.compile(self.generate_next, mode=None if cpu else "reduce-overhead", fullgraph=True)
             
     def optimize_training(self):
         # breaks with: Error: accessing tensor output of CUDAGraphs that has been overwritten by a subsequent run.
@@ -421,8 +480,8 @@ class TSARTransformer(nn.Module):
     def device(self):
         return next(self.parameters()).device
 
-    def generate_one(self, toks, toks_positions, cps_emb, xenc, xenc_positions, T, top_k):
-        probs, _ = self(None, None, None, None, toks, in_stoks_positions=toks_positions, loss=None, xenc=xenc, xenc_positions=xenc_positions, cps_emb=cps_emb)
+    def generate_one(self, toks, toks_positions, cps_emb, xenc, xenc_positions, T, top_k, slots=None, cross_kv=None):
+        probs, _ = self(None, None, None, None, toks, in_stoks_positions=toks_positions, loss=None, xenc=xenc, xenc_positions=xenc_positions, cps_emb=cps_emb, slots=slots, cross_kv=cross_kv)
         probs = probs[:,-1]
         probs[self.embeddings.embedding.codes:] = -torch.inf
         return inference.sample(probs, T, top_k)
@@ -439,10 +498,8 @@ class TSARTransformer(nn.Module):
         langs = torch.tensor([languages.to_id(lang)], device=dev)
         return ttoks, cpss, langs
     
-    @torch.no_grad()
-    def generate(self, txt, cps=15, lang="en", stoks_prompt=None, N=None, bs=1, T=0.7, top_k=None, step=None, show_progress_bar=True):
-        self.ensure_tokenizer()
-        N = N or self.stoks_len
+    def prep_text(self, txt, lang="en"):
+        """Tokenizes and pads the text and the (per-character) language ids for `run_encoder`."""
         dev = self.device
         ttoks = []
         langs = []
@@ -462,11 +519,19 @@ class TSARTransformer(nn.Module):
             langs = torch.tensor([languages.to_id(lang)], device=dev)
         ttoks = torch.tensor(ttoks, device=dev)
         ttoks = F.pad(ttoks, (1, self.ttoks_len - len(ttoks) - 1), value=self.tokenizer.eot)
-        cpss = torch.tensor([cps], device=dev)
-        T = torch.tensor(T, device=dev)
         if not isinstance(langs, torch.Tensor):
             langs = torch.tensor(langs, device=dev)
             langs = F.pad(langs, (1, self.ttoks_len - len(langs) - 1), value=languages.to_id(lang0))
+        return ttoks, langs
+    
+    @torch.no_grad()
+    def generate(self, txt, cps=15, lang="en", stoks_prompt=None, N=None, bs=1, T=0.7, top_k=None, step=None, show_progress_bar=True):
+        self.ensure_tokenizer()
+        N = N or self.stoks_len
+        dev = self.device
+        ttoks, langs = self.prep_text(txt, lang)
+        cpss = torch.tensor([cps], device=dev)
+        T = torch.tensor(T, device=dev)
 
         toks = torch.zeros((bs,N), dtype=torch.long, device=dev)
         toks[:,0] = self.stoks_codes + self.tunables.padding_token_offset
@@ -479,16 +544,18 @@ class TSARTransformer(nn.Module):
 
         toks_positions = torch.arange(N, device=dev)
         with record_function("encode"):
-            ttoks = ttoks.repeat(bs, 1)
-            langs, cpss = [x.repeat(bs) for x in (langs, cpss)]
-            xenc, xenc_positions, cps_emb = self.run_encoder(ttoks, langs, cpss)
+            # the encoder output is the same for every sequence in the batch
+            xenc, xenc_positions, cps_emb, cross_kv = self.encode_text(ttoks.unsqueeze(0), langs, cpss)
+            xenc = xenc.expand(bs, -1, -1)
+            if cps_emb is not None: cps_emb = cps_emb.expand(bs, -1, -1)
+            cross_kv = [(k.expand(bs, -1, -1, -1), v.expand(bs, -1, -1, -1)) for k,v in cross_kv]
             toks_positions = torch.arange(N+1, device=dev)
         
         with record_function("prefill"):
-            toks[:,start+1] = self.generate_one(toks[:,:start+1].contiguous(), toks_positions[:start+1], cps_emb, xenc, xenc_positions, T, top_k)[:,0]
+            toks[:,start+1] = self.generate_one(toks[:,:start+1].contiguous(), toks_positions[:start+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
         with inference.inference_context():
             for i in it:
-                toks[:,i+1] = self.generate_next(toks[:,i:i+1], toks_positions[i:i+1], cps_emb, xenc, xenc_positions, T, top_k)[:,0]
+                toks[:,i+1] = self.generate_next(toks[:,i:i+1], toks_positions[i:i+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
                 if (toks[:,i+1] == self.stoks_codes+self.tunables.padding_token_offset).all(): return toks[:,1:i+1]
 
                 # for profiling, debugging or early exit
@@ -496,28 +563,171 @@ class TSARTransformer(nn.Module):
         return toks[:,1:]
     
     @torch.no_grad()
-    def generate_batch(self, txts, N=None, T=1.1, top_k=7, show_progress_bar=True):
+    def generate_speculative(self, draft, txt, cps=15, lang="en", stoks_prompt=None, N=None, k=4, T=0.7, top_k=None, step=None):
+        """Like `generate` (for a single sequence) but a smaller `draft` T2S model proposes `k` tokens at a time and
+        this model checks all of them in a single forward pass.
+
+        The proposals are accepted or resampled with rejection sampling so the result follows exactly the same
+        distribution as `generate` (with the same `T` and `top_k`). The acceptance counts are kept in `self.speculative_stats`."""
         self.ensure_tokenizer()
-        N = self.stoks_len
+        draft.ensure_tokenizer()
+        assert draft.stoks_codes == self.stoks_codes, "the draft model has to use the same semantic tokens"
+        N = N or self.stoks_len
         dev = self.device
-        ttoks = []
-        for txt in txts:
-            ttoks_ = torch.tensor(self.tokenizer.encode(txt), device=dev)
-            ttoks_ = F.pad(ttoks_, (0, self.ttoks_len - len(ttoks_)), value=self.tokenizer.eot).unsqueeze(0)
-            ttoks.append(ttoks_)
-        ttoks = torch.cat(ttoks, dim=0)
-        toks = torch.zeros((len(ttoks),N), dtype=torch.long, device=dev)
-        it = range(N)
+        eot = self.stoks_codes + self.tunables.padding_token_offset
+        cpss = torch.tensor([cps], device=dev)
+
+        encs = []
+        with record_function("encode"):
+            for m in (self, draft):
+                ttoks, langs = m.prep_text(txt, lang)
+                encs.append(m.encode_text(ttoks.unsqueeze(0), langs, cpss))
+
+        toks = torch.zeros((1,N+1), dtype=torch.long, device=dev)
+        toks[:,0] = eot
+        start = 0
+        if stoks_prompt is not None:
+            toks[:,1:len(stoks_prompt)+1] = stoks_prompt
+            start = len(stoks_prompt)
+        toks_positions = torch.arange(N+1, device=dev)
+
+        def probs(m, enc, a, b):
+            # the distributions for the tokens following toks[a:b] (the KV cache has to be filled up to a)
+            xenc, xenc_positions, cps_emb, cross_kv = enc
+            logits, _ = m(None, None, None, None, toks[:,a:b], in_stoks_positions=toks_positions[a:b], loss=None,
+                          xenc=xenc, xenc_positions=xenc_positions, cps_emb=cps_emb, cross_kv=cross_kv)
+            return inference.logits_to_probs(logits[0].float(), T, top_k)
+
+        def sample(probs):
+            return inference.multinomial_sample_one_no_sync(probs)[0]
+
+        stats = self.speculative_stats = dict(drafted=0, accepted=0)
+        # toks[:i+1] are final, the main model has all but the last one in its KV cache, the draft model has toks[:draft_pos]
+        i, draft_pos = start, 0
+        with inference.inference_context():
+            if start:
+                with record_function("prefill"):
+                    probs(self, encs[0], 0, start)
+            while i < N-1:
+                n = min(k, N-1-i)
+                qs = []
+                with record_function("draft"):
+                    for j in range(n):
+                        qs.append(probs(draft, encs[1], draft_pos, i+j+1)[-1])
+                        draft_pos = i+j+1
+                        toks[0,i+j+1] = sample(qs[-1])
+                with record_function("verify"):
+                    ps = probs(self, encs[0], i, i+n+1)
+                accepted = 0
+                for j in range(n):
+                    tok = toks[0,i+j+1]
+                    # accept with probability min(1, p/q), otherwise resample from the leftover probability mass
+                    if torch.rand((), device=dev) * qs[j][tok] < ps[j][tok]:
+                        accepted += 1
+                    else:
+                        residual = (ps[j] - qs[j]).clamp(min=0)
+                        toks[0,i+j+1] = sample(residual / residual.sum())
+                        break
+                else:
+                    # all the drafts were good so we get one more token for free
+                    toks[0,i+n+1] = sample(ps[n])
+                stats['drafted'] += n
+                stats['accepted'] += accepted
+
+                new = toks[0,i+1:i+accepted+2]
+                ends = (new == eot).nonzero()
+                if len(ends): return toks[:,1:i+1+ends[0,0]]
+                i += accepted + 1
+                draft_pos = min(draft_pos, i)
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+        return toks[:,1:N]
+
+    @torch.no_grad()
+    def generate_stream(self, txt, cps=15, lang="en", stoks_prompt=None, N=None, T=0.7, top_k=None, step=None):
+        """Like `generate` (for a single sequence) but yields the newly sampled semantic tokens one by one
+        (without the prompt) so the consumer can start working before the whole sequence is finished."""
+        self.ensure_tokenizer()
+        N = N or self.stoks_len
+        dev = self.device
+        eot = self.stoks_codes + self.tunables.padding_token_offset
+        ttoks, langs = self.prep_text(txt, lang)
+        cpss = torch.tensor([cps], device=dev)
+        T = torch.tensor(T, device=dev)
+
+        toks = torch.zeros((1,N), dtype=torch.long, device=dev)
+        toks[:,0] = eot
+        start = 0
+        if stoks_prompt is not None:
+            toks[:,1:len(stoks_prompt)+1] = stoks_prompt
+            start = len(stoks_prompt)
+        toks_positions = torch.arange(N, device=dev)
+
+        with record_function("encode"):
+            xenc, xenc_positions, cps_emb, cross_kv = self.encode_text(ttoks.unsqueeze(0), langs, cpss)
+        with record_function("prefill"):
+            toks[:,start+1] = self.generate_one(toks[:,:start+1].contiguous(), toks_positions[:start+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
+        with inference.inference_context():
+            for i in range(start+1,N):
+                if toks[0,i] == eot: return
+                yield toks[0,i:i+1].clone()
+                if i == N-1: return
+                toks[:,i+1] = self.generate_next(toks[:,i:i+1], toks_positions[i:i+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+
+    @torch.no_grad()
+    def generate_batch(self, txts, cps=15, lang="en", stoks_prompt=None, N=None, T=0.7, top_k=None, step=None, show_progress_bar=True):
+        """Generates semantic tokens for a batch of different texts (each with its own language and speed).
+        The optional `stoks_prompt` is shared by the whole batch.
+
+        Returns a list of token tensors (without the prompt), each one trimmed at its own end of text token."""
+        self.ensure_tokenizer()
+        N = N or self.stoks_len
+        dev = self.device
+        bs = len(txts)
+        if not isinstance(cps, (list, tuple)): cps = [cps] * bs
+        if isinstance(lang, str): lang = [lang] * bs
+        eot = self.stoks_codes + self.tunables.padding_token_offset
+
+        ttoks, langs = zip(*[self.prep_text(txt, l) for txt, l in zip(txts, lang)])
+        ttoks = torch.stack(ttoks)
+        langs = torch.stack([l.expand(self.ttoks_len) if len(l) == 1 else l for l in langs])
+        cpss = torch.tensor(cps, device=dev)
+        T = torch.tensor(T, device=dev)
+
+        toks = torch.zeros((bs,N), dtype=torch.long, device=dev)
+        toks[:,0] = eot
+        start = 0
+        if stoks_prompt is not None:
+            toks[:,1:len(stoks_prompt)+1] = stoks_prompt
+            start = len(stoks_prompt)
+        toks_positions = torch.arange(N, device=dev)
+        with record_function("encode"):
+            xenc, xenc_positions, cps_emb = self.run_encoder(ttoks, langs, cpss)
+            cross_kv = self.decoder.project_cross_kv(xenc, xenc_positions)
+
+        with record_function("prefill"):
+            toks[:,start+1] = self.generate_one(toks[:,:start+1].contiguous(), toks_positions[:start+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
+        finished = toks[:,start+1] == eot
+        it = range(start+1,N-1)
         if show_progress_bar: it = progress_bar(it)
-        for i in it:
-            p, _ = self(ttoks, toks[:,:i], loss=None)
-            last_p = p[:,-1]
-            if top_k:
-                last_p[last_p < torch.topk(last_p, top_k).values[:,-1,None]] = -torch.inf
-            tok = torch.multinomial((last_p / float(T)).softmax(-1), 1)
-            toks[:,i] = tok[:,0]
-            if (toks[:,i] == self.stoks_codes-1).all(): return toks[:,:i]
-        return toks
+        with inference.inference_context():
+            for i in it:
+                if finished.all(): break
+                toks[:,i+1] = self.generate_next(toks[:,i:i+1], toks_positions[i:i+1], cps_emb, xenc, xenc_positions, T, top_k, cross_kv=cross_kv)[:,0]
+                finished |= toks[:,i+1] == eot
+
+                # for profiling, debugging or early exit
+                if step is not None: step()
+
+        stoks = []
+        for row in toks[:,start+1:]:
+            ends = (row == eot).nonzero()
+            stoks.append(row[:ends[0,0]] if len(ends) else row)
+        return stoks
 
 # %% ../nbs/5B. Multi-lang text to semantic token modeling.ipynb 16
 def _make_model(size:str, tunables:Tunables=Tunables(), dataset=None, **kwargs):
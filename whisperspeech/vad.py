@@ -66,7 +66,7 @@ def process_shard(
     input:str,           # input shard URL/path
     output:str,          # output shard URL/path
     key:str='audio',     # string to replace with 'vad' in the shard name
-    model:str='whisperx' # VAD model to use (possible values: `whisperx` or `pyannote`)
+    model:str='whisperx', # VAD model to use (possible values: `whisperx` or `pyannote`)
     cache_dir: str = None
 ):  
     ds = wds.WebDataset(url).compose(
@@ -8,35 +8,23 @@ import io
 import sys
 import time
 import torch
-import torchaudio
 
 # %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 3
 from pathlib import Path
 import json
-from fastprogress import progress_bar, master_bar
-import fastprogress
 import numpy as np
-import pylab as plt
-import pandas as pd
 import random
 
-import whisper
-import whisper.tokenizer
-from huggingface_hub import hf_hub_download
 from fastcore.basics import store_attr
 
 from torch import nn
 import torch.optim as optim
 import torch.nn.functional as F
 from torch.utils.data.dataloader import DataLoader
-import webdataset as wds
-from . import utils, vad_merge
-
-from vector_quantize_pytorch import ResidualVQ
 
 from fastcore.script import *
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 13
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 14
 def add_masks(samples):
     for s in samples:
         seconds = s['tend'] - s['tstart']
@@ -50,6 +38,7 @@ def add_masks(samples):
         yield s
         
 def get_tokenizer(model, language):
+    import whisper.tokenizer
     multilingual = not model.endswith(".en")
     return whisper.tokenizer.get_tokenizer(multilingual, language=language, task="transcribe",
                                            num_languages = 100 if model == 'large-v3' else 99)
@@ -64,7 +53,7 @@ def tokenize_text(samples, ttoks_size=200, model="base.en", language="en"):
         s['out_ttoks'] = F.pad(torch.tensor(tokens[1:] + [tokenizer.eot]), (0, rpad), value=-100)
         yield s
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 14
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 15
 def load_dataset(
         dataset_dir:Path,
         txt_label:str="base.en-txt", # the label of the files containing transcriptions
@@ -74,6 +63,9 @@ def load_dataset(
         validation:bool=False,
         exclude_datasets:str="txt-random-valid", # space separated directory names for validation datasets to exclude
     ):
+    # the dataset utilities pull in webdataset and torchaudio which inference does not need
+    import webdataset as wds
+    from whisperspeech import utils, vad_merge
     dataset_dir = Path(dataset_dir)
     shards = utils.shard_glob(dataset_dir/'audio/*.tar')
     with open(dataset_dir/'txt-samples.list') as f: samples = len(f.readlines())
@@ -114,11 +106,10 @@ def load_dataset(
     
     return ds
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 22
-from whisperspeech.train import *
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 23
 from whisperspeech.modules import *
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 23
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 24
 import dataclasses
 
 def rand(start, end):
@@ -183,10 +174,10 @@ class Tunables:
         if 'vq_codes' in args: del args['vq_codes']
         return args
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 24
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 25
 import math
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 25
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 26
 class RQBottleneckTransformer(nn.Module):
     def __init__(self, vq_codes=512, q_depth=12, depth=1, n_head=2, head_width=64, ffn_mult=4,
                  codebook_dim=2, threshold_ema_dead_code=2, use_cosine_sim = False, kl_loss_mul=1,
@@ -223,6 +214,7 @@ class RQBottleneckTransformer(nn.Module):
                 self.downsample_conv = None
 
             if tunables.mask_embs: vq_codes = vq_codes + 1
+            from vector_quantize_pytorch import ResidualVQ
             self.rq = ResidualVQ(
                 dim = width,
                 codebook_size = vq_codes, # codebook size
@@ -286,6 +278,7 @@ class RQBottleneckTransformer(nn.Module):
     # training
     #
     def log_mel_spectrogram(self, samples):
+        import whisper
         return whisper.log_mel_spectrogram(samples, 128 if self.whisper_model_name == 'large-v3' else 80)
     
     @torch.no_grad()
@@ -360,6 +353,7 @@ class RQBottleneckTransformer(nn.Module):
             else:
                 local_filename = ref
         if not local_filename:
+            from huggingface_hub import hf_hub_download
             local_filename = hf_hub_download(repo_id=repo_id, filename=filename, cache_dir=cache_dir)
         spec = torch.load(local_filename) 
         vqmodel = cls(**spec['config'], tunables=Tunables(**Tunables.upgrade(spec.get('tunables', {}))))
@@ -382,6 +376,8 @@ class RQBottleneckTransformer(nn.Module):
         
     def ensure_whisper(self, device=None):
         if self.whmodel is not None: return
+        # Whisper is only needed to extract the tokens from audio (or to decode them back to text)
+        import whisper
         device = device or self.device
         # the list wrapper is a hack to make sure the whole of Whisper is not sucked into self.parameters()
         if self.whmodel is None: self.whmodel = [whisper.load_model(self.whisper_model_name, device=device)]
@@ -414,6 +410,7 @@ class RQBottleneckTransformer(nn.Module):
 
     def encode_audio(self, audio):
         if isinstance(audio, str):
+            import torchaudio
             x, sr = torchaudio.load(audio)
             x = torchaudio.transforms.Resample(sr, 16000)(x)[0]
             audio = x.unsqueeze(0)
@@ -422,6 +419,7 @@ class RQBottleneckTransformer(nn.Module):
     def encode_mel(self, mel):
         assert len(mel.shape) == 3, "invalid mel spectrogram shape, expect (batch,chn,time)"
         self.ensure_whisper()
+        import whisper
         n = mel.shape[-1]
         if n > whisper.audio.N_FRAMES:
             padding = 0
@@ -442,7 +440,7 @@ class RQBottleneckTransformer(nn.Module):
         embs = self.dequantize(stoks).to(self.whmodel[0].device)
         return self.whmodel[0].decode(embs, decoding_options)
 
-# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 27
+# %% ../nbs/2B. Whisper quantization (semantic token) model.ipynb 28
 def make_model(size:str, no_quantize=False, tunables:Tunables=Tunables(), dataset:torch.utils.data.Dataset=None):
     common = dict(
         q_depth=1, depth=1, threshold_ema_dead_code=0, use_cosine_sim=True, tunables=tunables,